@@ -1,10 +1,23 @@
 #!/usr/bin/env python
 # coding=utf-8
 
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import http.client
+import itertools
 import logging
+import re
+import ssl
 import threading
 import time
+import urllib.error
+import urllib.parse
+import urllib.request
 from dataclasses import dataclass
+from html.parser import HTMLParser
 from typing import Any
 
 
@@ -32,16 +45,64 @@ USE_MARKDOWN = False
 # Disk cache for web_search and visit_webpage (SQLite, shared between processes)
 # ---------------------------------------------------------------------------
 
-_WEB_CACHE_LOCK = threading.Lock()
 _WEB_CACHE_MAX_RETRIES = 5
 
+# One open connection per (thread, db path), kept for the process lifetime.
+_web_cache_local = threading.local()
+
+# Entries expire at an absolute time (expires_at), so hits never write. Every
+# _WEB_CACHE_PURGE_EVERY-th _web_cache_set sweeps expired rows in one DELETE.
+_WEB_CACHE_PURGE_EVERY = 100
+_web_cache_set_count = itertools.count(1)
+
+# In-process LRU in front of SQLite: (db_path, kind, key) -> (value, expires_at).
+# Absorbs repeated lookups within a session without a SQL round trip.
+_MEM_CACHE: collections.OrderedDict[tuple[str, str, str], tuple[str, float]] = collections.OrderedDict()
+_MEM_CACHE_LOCK = threading.Lock()
+_MEM_CACHE_MAX = 256
+
+# db paths already switched to WAL. journal_mode=WAL is persistent in the
+# database file, so it only needs to be set once per path per process.
+# Do not add cache=shared: it serializes access and defeats WAL's concurrency.
+_pragmas_applied: set[str] = set()
+
 # VisitWebpageTool: sample size for garbage detection (binary/unreadable content)
 _GARBAGE_CHECK_BYTES = 4096
 
+# VisitWebpageTool: download cap, in HTML bytes per character of max_output_length.
+# Markup typically outweighs visible text several times over, so this leaves room
+# to fill the output while still bounding huge or endless responses.
+_HTML_BYTES_PER_OUTPUT_CHAR = 16
+
+# VisitWebpageTool.forward_many: concurrent page fetches
+_VISIT_MAX_WORKERS = 8
+
+# Collapses runs of blank lines in extracted page text
+_RE_MULTI_NL = re.compile(r"\n{3,}")
+
+# VisitWebpageTool: non-text responses rejected before the garbage scan.
+# (signature, offset) -> label; ISO media (mp4/mov) carries "ftyp" at offset 4.
+_BINARY_MAGIC = (
+    (b"PK\x03\x04", 0, "zip"),
+    (b"\x89PNG", 0, "png"),
+    (b"\xff\xd8\xff", 0, "jpeg"),
+    (b"GIF8", 0, "gif"),
+    (b"\x1f\x8b", 0, "gzip"),
+    (b"\x00asm", 0, "wasm"),
+    (b"ftyp", 4, "mp4"),
+)
+_BINARY_CONTENT_TYPE_PREFIXES = ("image/", "audio/", "video/", "font/", "application/octet-stream", "application/zip")
+
 # Minimum decoded length and garbage ratio threshold to treat content as binary
 _GARBAGE_MIN_CHARS = 100
 _GARBAGE_RATIO_THRESHOLD = 0.5
 
+# str.translate table deleting printable ASCII and ASCII whitespace, so the
+# garbage scan only looks at the (usually few) remaining characters in Python.
+_ASCII_GOOD_DELETE = dict.fromkeys(
+    (i for i in range(128) if chr(i).isprintable() or chr(i).isspace()), None
+)
+
 
 def _get_user_agent_for_url(url: str | None = None) -> str:
     """Return the appropriate User-Agent for a given URL.
@@ -61,99 +122,444 @@ def _get_user_agent_for_url(url: str | None = None) -> str:
     return BROWSER_USER_AGENT
 
 
+def _log_cache_event(event: str, key: str) -> None:
+    """Debug-log a cache hit/miss; the key is only shortened when debug logging is on."""
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("web_cache: %s: %s", event, key[:60] + "..." if len(key) > 60 else key)
+
+
+def _binary_kind(content_type: str, head: bytes) -> str | None:
+    """Label for a response that is clearly not text (by Content-Type or magic bytes), else None."""
+    if content_type.startswith(_BINARY_CONTENT_TYPE_PREFIXES):
+        return content_type.split(";", 1)[0].strip()
+    for signature, offset, label in _BINARY_MAGIC:
+        if head.startswith(signature, offset):
+            return label
+    return None
+
+
 def _is_garbage_text(s: str) -> bool:
     """True if the decoded string looks like binary/garbage (e.g. PDF decoded as UTF-8)."""
     if len(s) < _GARBAGE_MIN_CHARS:
         return False
-    garbage_count = sum(
-        1 for c in s
-        if c == "\ufffd" or (not c.isspace() and not c.isprintable())
-    )
+    rest = s.translate(_ASCII_GOOD_DELETE)
+    garbage_count = rest.count("\ufffd")
+    if garbage_count:
+        rest = rest.replace("\ufffd", "")
+    if not rest.isprintable():
+        garbage_count += sum(1 for c in rest if not c.isspace() and not c.isprintable())
     return (garbage_count / len(s)) > _GARBAGE_RATIO_THRESHOLD
 
 
-def _web_cache_ensure_schema(conn: Any) -> None:
+def _web_cache_apply_pragmas(conn: Any, db_path: str) -> None:
+    """WAL journal plus relaxed fsync: readers no longer block the writer in _web_cache_set."""
+    if db_path not in _pragmas_applied:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _pragmas_applied.add(db_path)
+    # The remaining PRAGMAs are per-connection settings; connections are pooled
+    # so they also run only once per (thread, db path).
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA mmap_size=268435456")
+
+
+def _web_cache_ensure_schema(conn: Any, db_path: str) -> None:
+    _web_cache_apply_pragmas(conn, db_path)
     conn.execute(
         "CREATE TABLE IF NOT EXISTS web_cache "
-        "(kind TEXT, key TEXT, value TEXT, size INTEGER, created_at REAL, PRIMARY KEY (kind, key))"
+        "(kind TEXT, key BLOB, value TEXT, size INTEGER, created_at REAL, PRIMARY KEY (kind, key))"
+    )
+    # HTTP validators for conditional re-fetch and the unhashed key (diagnostics,
+    # in-memory cache eviction); added after the first release.
+    for column in ("etag", "last_modified", "raw_key"):
+        try:
+            conn.execute("ALTER TABLE web_cache ADD COLUMN %s TEXT" % column)
+        except sqlite3.OperationalError:
+            pass  # column already exists
+    try:
+        conn.execute("ALTER TABLE web_cache ADD COLUMN expires_at REAL")
+    except sqlite3.OperationalError:
+        pass  # column already exists
+    else:
+        # Rows from before absolute expiry get the default 7-day validity.
+        conn.execute("UPDATE web_cache SET expires_at = created_at + 7 * 86400 WHERE expires_at IS NULL")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_web_cache_expires_at ON web_cache(expires_at)")
+    # Covering index for size eviction. size and raw_key sit after the (often
+    # large) value column and are only reachable by walking its overflow pages,
+    # so the oldest-first scan reads them from the index instead of the row.
+    conn.execute("DROP INDEX IF EXISTS idx_web_cache_created_at")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_web_cache_lru ON web_cache(created_at, size, kind, raw_key)")
+    # Running total of web_cache.size, kept by triggers so eviction need not SUM the table.
+    # Seeded from the table so caches created before the triggers start out correct.
+    conn.execute("CREATE TABLE IF NOT EXISTS web_cache_meta (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL)")
+    conn.execute(
+        "INSERT OR IGNORE INTO web_cache_meta (id, total) "
+        "SELECT 0, COALESCE(SUM(size), 0) FROM web_cache"
+    )
+    conn.execute(
+        "CREATE TRIGGER IF NOT EXISTS web_cache_ai AFTER INSERT ON web_cache "
+        "BEGIN UPDATE web_cache_meta SET total = total + NEW.size WHERE id = 0; END"
+    )
+    conn.execute(
+        "CREATE TRIGGER IF NOT EXISTS web_cache_ad AFTER DELETE ON web_cache "
+        "BEGIN UPDATE web_cache_meta SET total = total - OLD.size WHERE id = 0; END"
+    )
+    conn.execute(
+        "CREATE TRIGGER IF NOT EXISTS web_cache_au AFTER UPDATE OF size ON web_cache "
+        "BEGIN UPDATE web_cache_meta SET total = total - OLD.size + NEW.size WHERE id = 0; END"
     )
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_web_cache_created_at ON web_cache(created_at)")
+
+
+def _get_conn(db_path: str) -> Any:
+    """Return this thread's connection to db_path, opening and initializing it on first use."""
+    conns = getattr(_web_cache_local, "conns", None)
+    if conns is None:
+        conns = _web_cache_local.conns = {}
+    conn = conns.get(db_path)
+    if conn is None:
+        # Autocommit: single statements need no explicit commit; multi-statement
+        # writes open their own BEGIN IMMEDIATE transaction.
+        conn = sqlite3.connect(db_path, timeout=10.0, check_same_thread=False, isolation_level=None)
+        try:
+            _web_cache_ensure_schema(conn, db_path)
+        except Exception:
+            conn.close()
+            raise
+        conns[db_path] = conn
+    return conn
 
 
 def _web_cache_with_connection(db_path: str, fn):
-    """Run fn(conn) with a locked connection; retry on database locked/busy."""
+    """Run fn(conn) with this thread's pooled connection; retry on database locked/busy."""
     if not HAS_SQLITE:
         return None
     for attempt in range(_WEB_CACHE_MAX_RETRIES):
-        with _WEB_CACHE_LOCK:
-            try:
-                conn = sqlite3.connect(db_path, timeout=10.0)
-                try:
-                    _web_cache_ensure_schema(conn)
-                    return fn(conn)
-                finally:
-                    conn.close()
-            except sqlite3.OperationalError as e:
-                if attempt < _WEB_CACHE_MAX_RETRIES - 1 and ("locked" in str(e).lower() or "busy" in str(e).lower()):
-                    time.sleep(0.15 * (attempt + 1))
-                    continue
-                raise
+        try:
+            return fn(_get_conn(db_path))
+        except sqlite3.OperationalError as e:
+            if attempt < _WEB_CACHE_MAX_RETRIES - 1 and ("locked" in str(e).lower() or "busy" in str(e).lower()):
+                time.sleep(0.15 * (attempt + 1))
+                continue
+            raise
+
+
+def _cache_key(key: str) -> bytes:
+    """16-byte digest stored as the key column, so long URLs do not bloat the primary-key index.
+
+    Rows written before keys were hashed have text keys that never match; they
+    age out through the expiry purge and size eviction.
+    """
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+def _mem_cache_put(db_path: str, kind: str, key: str, value: str, expires_at: float) -> None:
+    with _MEM_CACHE_LOCK:
+        _MEM_CACHE[(db_path, kind, key)] = (value, expires_at)
+        _MEM_CACHE.move_to_end((db_path, kind, key))
+        while len(_MEM_CACHE) > _MEM_CACHE_MAX:
+            _MEM_CACHE.popitem(last=False)
 
 
-def _web_cache_get(db_path: str, kind: str, key: str, max_age_days: int = 7) -> str | None:
-    """Return cached value for (kind, key), or None. On hit, touch row (update created_at). No-op when SQLite unavailable."""
+def _mem_cache_discard(db_path: str, kind: str, key: str) -> None:
+    with _MEM_CACHE_LOCK:
+        _MEM_CACHE.pop((db_path, kind, key), None)
+
+
+def _web_cache_get(db_path: str, kind: str, key: str) -> str | None:
+    """Return the unexpired cached value for (kind, key), or None. Read-only. No-op when SQLite unavailable."""
     if not HAS_SQLITE or not db_path or not key:
         return None
 
+    now = time.time()
+    with _MEM_CACHE_LOCK:
+        entry = _MEM_CACHE.get((db_path, kind, key))
+        if entry is not None:
+            if entry[1] > now:
+                _MEM_CACHE.move_to_end((db_path, kind, key))
+                return entry[0]
+            del _MEM_CACHE[(db_path, kind, key)]
+
     def do_get(conn):
-        row = conn.execute("SELECT value, created_at FROM web_cache WHERE kind = ? AND key = ?", (kind, key)).fetchone()
-        if row is None:
-            return None
-
-        value, created_at = row
-        max_age_seconds = max_age_days * 86400
-        now = time.time()
-
-        if now - created_at > max_age_seconds:
-            conn.execute("DELETE FROM web_cache WHERE kind = ? AND key = ?", (kind, key))
-            conn.commit()
-            return None
-
-        conn.execute(
-            "UPDATE web_cache SET created_at = ? WHERE kind = ? AND key = ?",
-            (now, kind, key),
-        )
-        conn.commit()
-        return value
+        # Expired rows are left for the periodic purge; rows with validators
+        # stay available to _web_cache_get_stale for a conditional GET.
+        return conn.execute(
+            "SELECT value, expires_at FROM web_cache WHERE kind = ? AND key = ? AND expires_at > ?",
+            (kind, _cache_key(key), now),
+        ).fetchone()
+
+    row = _web_cache_with_connection(db_path, do_get)
+    if row is None:
+        return None
+    value, expires_at = row
+    _mem_cache_put(db_path, kind, key, value, expires_at)
+    return value
+
+
+def _web_cache_get_stale(db_path: str, kind: str, key: str) -> tuple[str, str | None, str | None] | None:
+    """Return (value, etag, last_modified) for an entry that has HTTP validators, regardless of age, or None."""
+    if not HAS_SQLITE or not db_path or not key:
+        return None
+
+    def do_get(conn):
+        return conn.execute(
+            "SELECT value, etag, last_modified FROM web_cache "
+            "WHERE kind = ? AND key = ? AND (etag IS NOT NULL OR last_modified IS NOT NULL)",
+            (kind, _cache_key(key)),
+        ).fetchone()
 
     return _web_cache_with_connection(db_path, do_get)
 
 
-def _web_cache_set(db_path: str, kind: str, key: str, value: str, max_size_bytes: int) -> None:
-    """Store (kind, key) -> value; evict oldest entries until total size <= max_size_bytes. No-op when SQLite unavailable."""
+def _web_cache_set(
+    db_path: str,
+    kind: str,
+    key: str,
+    value: str,
+    max_size_bytes: int,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    max_age_days: int = 7,
+) -> None:
+    """Store (kind, key) -> value, valid for max_age_days, with optional HTTP validators.
+
+    Evicts the oldest entries until total size <= max_size_bytes. No-op when SQLite unavailable.
+    """
     if not HAS_SQLITE or not db_path or not key or max_size_bytes <= 0:
         return
     size = len(value.encode("utf-8"))
+    now = time.time()
+    expires_at = now + max_age_days * 86400
+    purge = next(_web_cache_set_count) % _WEB_CACHE_PURGE_EVERY == 0
 
     def do_set(conn):
-        now = time.time()
-        conn.execute(
-            "INSERT OR REPLACE INTO web_cache (kind, key, value, size, created_at) VALUES (?, ?, ?, ?, ?)",
-            (kind, key, value, size, now),
-        )
-        while True:
-            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM web_cache").fetchone()[0]
-            if total <= max_size_bytes:
-                break
-            row = conn.execute(
-                "SELECT kind, key FROM web_cache ORDER BY created_at ASC LIMIT 1"
-            ).fetchone()
-            if not row:
-                break
-            conn.execute("DELETE FROM web_cache WHERE kind = ? AND key = ?", row)
-        conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if purge:
+                conn.execute(
+                    "DELETE FROM web_cache WHERE expires_at < ? AND etag IS NULL AND last_modified IS NULL",
+                    (now,),
+                )
+            # Upsert rather than INSERT OR REPLACE: REPLACE's implicit delete does not
+            # fire the size-counter triggers.
+            conn.execute(
+                "INSERT INTO web_cache (kind, key, raw_key, value, size, created_at, etag, last_modified, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (kind, key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                "created_at = excluded.created_at, etag = excluded.etag, last_modified = excluded.last_modified, "
+                "expires_at = excluded.expires_at",
+                (kind, _cache_key(key), key, value, size, now, etag, last_modified, expires_at),
+            )
+            total = conn.execute("SELECT total FROM web_cache_meta WHERE id = 0").fetchone()[0]
+            if total > max_size_bytes:
+                # Collect just enough of the oldest rows, then delete them in one batch.
+                excess = total - max_size_bytes
+                victims = []
+                oldest = conn.execute("SELECT rowid, kind, raw_key, size FROM web_cache ORDER BY created_at ASC")
+                for rowid, victim_kind, victim_key, row_size in oldest:
+                    victims.append((rowid, victim_kind, victim_key))
+                    excess -= row_size
+                    if excess <= 0:
+                        break
+                oldest.close()
+                conn.executemany("DELETE FROM web_cache WHERE rowid = ?", [(v[0],) for v in victims])
+                for _, victim_kind, victim_key in victims:
+                    if victim_key is not None:
+                        _mem_cache_discard(db_path, victim_kind, victim_key)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
     _web_cache_with_connection(db_path, do_set)
+    _mem_cache_put(db_path, kind, key, value, expires_at)
+
+
+# ---------------------------------------------------------------------------
+# Keep-alive HTTP for web_search and visit_webpage
+# ---------------------------------------------------------------------------
+
+# One http.client connection per (thread, scheme, host, port), reused across
+# tool calls so repeated requests to a host skip the TCP/TLS handshake. Each
+# thread keeps only its most recently used hosts; older sockets are closed.
+_http_local = threading.local()
+_HTTP_MAX_CONNS_PER_THREAD = 4
+_HTTP_MAX_REDIRECTS = 5
+_HTTP_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+_HTTPS_CONTEXT = ssl.create_default_context()
+
+
+def _http_proxies() -> dict[str, str]:
+    """Proxy settings from the environment; http.client does not honor them, so proxied requests use urlopen.
+
+    Read per request so proxy changes take effect without a restart.
+    """
+    return urllib.request.getproxies()
+
+
+def _http_connection(scheme: str, host: str, port: int, timeout: float):
+    conns = getattr(_http_local, "conns", None)
+    if conns is None:
+        conns = _http_local.conns = collections.OrderedDict()
+    key = (scheme, host, port)
+    conn = conns.get(key)
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=_HTTPS_CONTEXT)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        conns[key] = conn
+        while len(conns) > _HTTP_MAX_CONNS_PER_THREAD:
+            conns.popitem(last=False)[1].close()
+    else:
+        conns.move_to_end(key)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return key, conn
+
+
+def _http_drop(key) -> None:
+    conn = getattr(_http_local, "conns", {}).pop(key, None)
+    if conn is not None:
+        conn.close()
+
+
+@contextlib.contextmanager
+def _web_open(url: str, data: bytes | None = None, headers: dict[str, str] | None = None, timeout: float = 20):
+    """Open url like urllib.request.urlopen (POST when data is given), over a pooled keep-alive connection.
+
+    Follows redirects and raises urllib.error.HTTPError for non-2xx statuses. The
+    connection is returned to the pool only if the caller read the whole body.
+    """
+    headers = dict(headers or {})
+    if data is not None:
+        headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+    for _ in range(_HTTP_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme in _http_proxies() and not urllib.request.proxy_bypass(parts.hostname or ""):
+            req = urllib.request.Request(url, data=data, headers=headers)
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                yield response
+            return
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("Unsupported URL: %s" % url)
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = (parts.path or "/") + ("?" + parts.query if parts.query else "")
+        method = "GET" if data is None else "POST"
+
+        key, conn = _http_connection(scheme, parts.hostname, port, timeout)
+        for attempt in range(2):
+            reused = conn.sock is not None
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                response = conn.getresponse()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                _http_drop(key)
+                # The server closed an idle keep-alive socket; retry once on a new one.
+                if not reused or attempt:
+                    raise
+                key, conn = _http_connection(scheme, parts.hostname, port, timeout)
+            except Exception:
+                _http_drop(key)
+                raise
+
+        try:
+            location = response.headers.get("Location")
+            if response.status in _HTTP_REDIRECT_CODES and location:
+                response.read()
+                url = urllib.parse.urljoin(url, location)
+                if response.status in (301, 302, 303) and data is not None:
+                    data = None
+                    headers.pop("Content-Type", None)
+                continue
+            if not 200 <= response.status < 300:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            yield response
+            return
+        finally:
+            if response.will_close or not response.isclosed():
+                _http_drop(key)
+    raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+
+class _DuckDuckGoResultParser(HTMLParser):
+    """Extracts title/description/link rows from lite.duckduckgo.com results.
+
+    ``description`` is left as a list of text chunks; callers join the results they keep.
+    """
+
+    _required = frozenset({"title", "description", "link"})
+
+    def __init__(self):
+        super().__init__()
+        self.results = []
+        self.current = {}
+        self.capture_title = False
+        self.capture_description = False
+        self.capture_link = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "a" and attrs.get("class") == "result-link":
+            self.capture_title = True
+        elif tag == "td" and attrs.get("class") == "result-snippet":
+            self.capture_description = True
+        elif tag == "span" and attrs.get("class") == "link-text":
+            self.capture_link = True
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self.capture_title:
+            self.capture_title = False
+        elif tag == "td" and self.capture_description:
+            self.capture_description = False
+        elif tag == "span" and self.capture_link:
+            self.capture_link = False
+        elif tag == "tr":
+            if self._required <= self.current.keys():
+                self.results.append(self.current)
+                self.current = {}
+
+    def handle_data(self, data):
+        if self.capture_title:
+            self.current["title"] = data.strip()
+        elif self.capture_description:
+            self.current.setdefault("description", [])
+            self.current["description"].append(data.strip())
+        elif self.capture_link:
+            self.current["link"] = "https://" + data.strip()
+
+
+# Tags whose text content _TextExtractor drops
+_HIDE_TAGS = frozenset({"script", "style", "noscript", "meta", "head"})
+
+
+class _TextExtractor(HTMLParser):
+    """Collects visible text from a page, skipping script/style/head content."""
+
+    def __init__(self):
+        super().__init__()
+        self.text = []
+        self._append_text = self.text.append
+        self.hide = False
+
+    # The handlers run once per tag/text node; they test the module-level
+    # frozenset directly rather than going through attribute lookups.
+    def handle_starttag(self, tag, attrs):
+        if tag in _HIDE_TAGS:
+            self.hide = True
+
+    def handle_endtag(self, tag):
+        if tag in _HIDE_TAGS:
+            self.hide = False
+
+    def handle_data(self, data):
+        if not self.hide:
+            d = data.strip()
+            if d:
+                self._append_text(d)
 
 
 @dataclass
@@ -197,17 +603,15 @@ class PythonInterpreterTool(Tool):
         super().__init__(*args, **kwargs)
 
     def forward(self, code: str) -> str:
-        state = {}
-        output = str(
-            self.python_evaluator(
-                code,
-                state=state,
-                static_tools=self.base_python_tools,
-                authorized_imports=self.authorized_imports,
-                timeout_seconds=self.timeout_seconds,
-            )[0]  # The second element is boolean is_final_answer
-        )
-        return f"Stdout:\n{str(state['_print_outputs'])}\nOutput: {output}"
+        state = {"_print_outputs": []}
+        output = self.python_evaluator(
+            code,
+            state=state,
+            static_tools=self.base_python_tools,
+            authorized_imports=self.authorized_imports,
+            timeout_seconds=self.timeout_seconds,
+        )[0]  # The second element is boolean is_final_answer
+        return "Stdout:\n" + str(state["_print_outputs"]) + "\nOutput: " + str(output)
 
 
 class FinalAnswerTool(Tool):
@@ -247,68 +651,25 @@ class DuckDuckGoSearchTool(Tool):
     def forward(self, query: str) -> str:
         key = " ".join(str(query).strip().split())
         if self._cache_path and self._cache_max_mb > 0 and key:
-            cached = _web_cache_get(self._cache_path, "search", key, max_age_days=self._cache_max_age_days)
+            cached = _web_cache_get(self._cache_path, "search", key)
             if cached is not None:
-                log.debug("web_cache: search hit: %s" % (key[:60] + "..." if len(key) > 60 else key))
+                _log_cache_event("search hit", key)
                 return cached
-            log.debug("web_cache: search miss: %s" % (key[:60] + "..." if len(key) > 60 else key))
-
-        import urllib.request
-        import urllib.parse
-        from html.parser import HTMLParser
+            _log_cache_event("search miss", key)
 
         url = "https://lite.duckduckgo.com/lite/"
         data = urllib.parse.urlencode({"q": query}).encode("utf-8")
-        req = urllib.request.Request(url, data=data, headers={"User-Agent": _get_user_agent_for_url(url)})
         try:
-            with urllib.request.urlopen(req, timeout=10) as response:
+            with _web_open(url, data=data, headers={"User-Agent": _get_user_agent_for_url(url)}, timeout=10) as response:
                 html = response.read().decode("utf-8")
         except Exception as e:
             return f"Error fetching search results: {str(e)}"
 
-        class SimpleResultParser(HTMLParser):
-            def __init__(self):
-                super().__init__()
-                self.results = []
-                self.current = {}
-                self.capture_title = False
-                self.capture_description = False
-                self.capture_link = False
-
-            def handle_starttag(self, tag, attrs):
-                attrs = dict(attrs)
-                if tag == "a" and attrs.get("class") == "result-link":
-                    self.capture_title = True
-                elif tag == "td" and attrs.get("class") == "result-snippet":
-                    self.capture_description = True
-                elif tag == "span" and attrs.get("class") == "link-text":
-                    self.capture_link = True
-
-            def handle_endtag(self, tag):
-                if tag == "a" and self.capture_title:
-                    self.capture_title = False
-                elif tag == "td" and self.capture_description:
-                    self.capture_description = False
-                elif tag == "span" and self.capture_link:
-                    self.capture_link = False
-                elif tag == "tr":
-                    if {"title", "description", "link"} <= self.current.keys():
-                        self.current["description"] = "".join(self.current["description"])
-                        self.results.append(self.current)
-                        self.current = {}
-
-            def handle_data(self, data):
-                if self.capture_title:
-                    self.current["title"] = data.strip()
-                elif self.capture_description:
-                    self.current.setdefault("description", [])
-                    self.current["description"].append(data.strip())
-                elif self.capture_link:
-                    self.current["link"] = "https://" + data.strip()
-
-        parser = SimpleResultParser()
+        parser = _DuckDuckGoResultParser()
         parser.feed(html)
         results = parser.results[:self.max_results]
+        for r in results:
+            r["description"] = "".join(r["description"])
 
         if len(results) == 0:
             result = "No results found! Try a less restrictive/shorter query."
@@ -327,6 +688,7 @@ class DuckDuckGoSearchTool(Tool):
                 key,
                 result,
                 self._cache_max_mb * 1024 * 1024,
+                max_age_days=self._cache_max_age_days,
             )
         return result
 
@@ -358,19 +720,38 @@ class VisitWebpageTool(Tool):
                 key,
                 message,
                 self._cache_max_mb * 1024 * 1024,
+                max_age_days=self._cache_max_age_days,
             )
         return message
 
+    def _revalidated(self, key: str, stale: tuple[str, str | None, str | None], headers) -> str:
+        """Handle 304 Not Modified: reuse the cached text and restart its TTL."""
+        _log_cache_event("page revalidated", key)
+        value, etag, last_modified = stale
+        _web_cache_set(
+            self._cache_path,
+            "page",
+            key,
+            value,
+            self._cache_max_mb * 1024 * 1024,
+            etag=headers.get("ETag") or etag,
+            last_modified=headers.get("Last-Modified") or last_modified,
+            max_age_days=self._cache_max_age_days,
+        )
+        return value
+
     def forward(self, url: str) -> str:
         key = str(url).strip()
 
-        # Cache lookup
+        # Cache lookup; an expired entry with validators is revalidated below.
+        stale = None
         if self._cache_path and self._cache_max_mb > 0 and key:
-            cached = _web_cache_get(self._cache_path, "page", key, max_age_days=self._cache_max_age_days)
+            cached = _web_cache_get(self._cache_path, "page", key)
             if cached is not None:
-                log.debug("web_cache: page hit: %s" % (key[:60] + "..." if len(key) > 60 else key))
+                _log_cache_event("page hit", key)
                 return cached
-            log.debug("web_cache: page miss: %s" % (key[:60] + "..." if len(key) > 60 else key))
+            _log_cache_event("page miss", key)
+            stale = _web_cache_get_stale(self._cache_path, "page", key)
 
         # Fail fast: URL path ends with .pdf
         if is_pdf_url(url):
@@ -379,13 +760,22 @@ class VisitWebpageTool(Tool):
                 "Error fetching the webpage: URL points to a PDF; text content cannot be extracted.",
             )
 
-        import urllib.request
-        from html.parser import HTMLParser
-        import re
-
         try:
-            req = urllib.request.Request(url, headers={"User-Agent": _get_user_agent_for_url(url)})
-            with urllib.request.urlopen(req, timeout=20) as response:
+            headers = {"User-Agent": _get_user_agent_for_url(url)}
+            if stale is not None:
+                _, etag, last_modified = stale
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+            with contextlib.ExitStack() as stack:
+                try:
+                    response = stack.enter_context(_web_open(url, headers=headers, timeout=20))
+                except urllib.error.HTTPError as e:
+                    if e.code != 304 or stale is None:
+                        raise
+                    return self._revalidated(key, stale, e.headers)
+
                 # Content-Type: reject application/pdf without reading body
                 content_type_header = (response.headers.get("Content-Type") or "").lower()
                 if "application/pdf" in content_type_header:
@@ -393,56 +783,47 @@ class VisitWebpageTool(Tool):
                         key,
                         "Error fetching the webpage: Response is a PDF; text content cannot be extracted.",
                     )
+                binary_kind = _binary_kind(content_type_header, b"")
+                if binary_kind:
+                    return self._return_error(
+                        key,
+                        "Error fetching the webpage: Response is %s; text content cannot be extracted." % binary_kind,
+                    )
+
+                # Single bounded read; the checks below slice the prefix.
+                max_bytes = self.max_output_length * _HTML_BYTES_PER_OUTPUT_CHAR + _GARBAGE_CHECK_BYTES
+                raw_body = response.read(max_bytes)
 
                 # Magic bytes: reject PDF by signature
-                first_bytes = response.read(8)
-                if first_bytes.startswith(b"%PDF-"):
+                if raw_body.startswith(b"%PDF-"):
                     return self._return_error(
                         key,
                         "Error fetching the webpage: Response is a PDF; text content cannot be extracted.",
                     )
+                binary_kind = _binary_kind("", raw_body[:8])
+                if binary_kind:
+                    return self._return_error(
+                        key,
+                        "Error fetching the webpage: Response is %s; text content cannot be extracted." % binary_kind,
+                    )
 
-                # Sample first 4096 bytes for garbage detection
-                sample = response.read(_GARBAGE_CHECK_BYTES)
-                prefix_bytes = first_bytes + sample
+                # Sample first 4096 bytes (after the signature) for garbage detection
                 charset = response.headers.get_content_charset() or "utf-8"
-                sample_str = prefix_bytes.decode(charset, errors="ignore")
+                sample_str = raw_body[:8 + _GARBAGE_CHECK_BYTES].decode(charset, errors="ignore")
                 if _is_garbage_text(sample_str):
                     return self._return_error(
                         key,
                         "Error fetching the webpage: Content appears to be binary or unreadable.",
                     )
 
-                # Read remainder and decode full body
-                rest = response.read()
-                raw_body = prefix_bytes + rest
                 html = raw_body.decode(charset, errors="ignore")
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
 
-            class TextExtractor(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.text = []
-                    self.hide = False
-                    self.hide_tags = {"script", "style", "noscript", "meta", "head"}
-
-                def handle_starttag(self, tag, attrs):
-                    if tag in self.hide_tags:
-                        self.hide = True
-
-                def handle_endtag(self, tag):
-                    if tag in self.hide_tags:
-                        self.hide = False
-
-                def handle_data(self, data):
-                    if not self.hide:
-                        d = data.strip()
-                        if d:
-                            self.text.append(d)
-
-            extractor = TextExtractor()
+            extractor = _TextExtractor()
             extractor.feed(html)
             text_content = "\n".join(extractor.text)
-            text_content = re.sub(r"\n{3,}", "\n\n", text_content)
+            text_content = _RE_MULTI_NL.sub("\n\n", text_content)
             result = self._truncate_content(text_content, self.max_output_length)
             if self._cache_path and self._cache_max_mb > 0 and key:
                 _web_cache_set(
@@ -451,6 +832,9 @@ class VisitWebpageTool(Tool):
                     key,
                     result,
                     self._cache_max_mb * 1024 * 1024,
+                    etag=etag,
+                    last_modified=last_modified,
+                    max_age_days=self._cache_max_age_days,
                 )
             return result
 
@@ -458,12 +842,48 @@ class VisitWebpageTool(Tool):
             return self._return_error(key, f"Error fetching the webpage: {str(e)}")
 
 
+    def forward_many(self, urls: list[str]) -> list[str]:
+        """Visit several pages concurrently; results are in the same order as urls."""
+        visit = functools.partial(VisitWebpageTool.forward, self)
+        urls = [str(u) for u in urls]
+        if len(urls) <= 1:
+            return [visit(u) for u in urls]
+        return list(_visit_executor().map(visit, urls))
+
+
+@functools.cache
+def _visit_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Shared pool for VisitWebpageTool.forward_many; its threads keep their keep-alive connections between calls."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=_VISIT_MAX_WORKERS, thread_name_prefix="visit_webpage")
+
+
+class VisitWebpagesTool(VisitWebpageTool):
+    name = "visit_webpages"
+    description = (
+        "Visits several webpages at once and reads their content. Use this instead of repeated "
+        "visit_webpage calls when you already know which pages you want, e.g. the top search results."
+    )
+    inputs = {"urls": {"type": "array", "description": "The urls of the webpages to visit."}}
+    output_type = "string"
+
+    def forward(self, urls: list[str]) -> str:
+        # Each page still goes through the cache and checks in VisitWebpageTool.forward.
+        unique_urls = list(dict.fromkeys(str(u).strip() for u in urls if str(u).strip()))
+        if not unique_urls:
+            return "Error: no urls given."
+        pages = self.forward_many(unique_urls)
+        if USE_MARKDOWN:
+            return "\n\n".join(f"## {url}\n\n{page}" for url, page in zip(unique_urls, pages))
+        return "\n".join(f"<h2>{url}</h2>\n{page}" for url, page in zip(unique_urls, pages))
+
+
 TOOL_MAPPING = {
     tool_class.name: tool_class
     for tool_class in [
         PythonInterpreterTool,
         DuckDuckGoSearchTool,
         VisitWebpageTool,
+        VisitWebpagesTool,
     ]
 }
 
@@ -473,4 +893,5 @@ __all__ = [
     "UserInputTool",
     "DuckDuckGoSearchTool",
     "VisitWebpageTool",
+    "VisitWebpagesTool",
 ]
\ No newline at end of file
@@ -26,8 +26,10 @@ from plugin.framework.utils import get_plugin_dir
 import json
 import logging
 import dataclasses
+import functools
+from collections.abc import Mapping
 import time
-from typing import Dict, Any, Optional, TYPE_CHECKING, cast
+from typing import Dict, Any, cast
 from plugin.framework.event_bus import global_event_bus
 _uno_mod: Any
 _unohelper_mod: Any
@@ -44,7 +46,7 @@ uno: Any = _uno_mod
 unohelper: Any = _unohelper_mod
 from plugin.framework.service_base import ServiceBase
 from plugin.framework.uno_context import get_ctx
-from plugin.framework.default_models import DEFAULT_MODELS, resolve_model_id
+from plugin.framework.default_models import get_catalog_capability, get_default_model_ids
 from plugin.framework.errors import ConfigError
 
 
@@ -142,51 +144,48 @@ def user_config_dir(ctx):
         raise ConfigError(f"Failed to resolve config dir: {e}", "CONFIG_DIR_ERROR") from e
 
 
+@functools.cache
 def _get_schema_default(key):
-    """Return default for key from MODULES (module.yaml schema). Supports flat and dotted keys."""
+    """Return default for key from CONFIG_DEFAULTS (module.yaml schema). Supports flat and dotted keys.
+
+    Cached: the generated manifest is immutable for the process lifetime.
+    """
     try:
-        from plugin._manifest import MODULES
+        from plugin._manifest import CONFIG_DEFAULTS
     except ImportError:
         return None
     # Dotted key (e.g. agent_backend.backend_id)
     if "." in key:
         mod_name, field_name = key.split(".", 1)
-        for m in MODULES:
-            if m.get("name") == mod_name:
-                config = m.get("config", {})
-                if isinstance(config, dict):
-                    for fname, schema in config.items():
-                        if fname == field_name and isinstance(schema, dict) and "default" in schema:
-                            return schema["default"]
-        return None
-    # Flat key: find first module that has this config field
-    for m in MODULES:
-        config = m.get("config", {})
-        if isinstance(config, dict):
-            for fname, schema in config.items():
-                if fname == key and isinstance(schema, dict) and "default" in schema:
-                    return schema["default"]
+        return CONFIG_DEFAULTS.get(mod_name, {}).get(field_name)
+    # Flat key: first module (manifest order) that has this config field
+    for defaults in CONFIG_DEFAULTS.values():
+        if key in defaults:
+            return defaults[key]
     return None
 
 
+@functools.cache
 def _dotted_fallback_keys(key):
-    """Yield dotted key variants for key using MODULES (e.g. extend_selection_max_tokens -> chatbot.extend_selection_max_tokens)."""
+    """Return dotted key variants for key using MODULES (e.g. extend_selection_max_tokens -> chatbot.extend_selection_max_tokens).
+
+    Cached per key, like _get_schema_default.
+    """
     try:
         from plugin._manifest import MODULES
     except ImportError:
-        return
+        return ()
     if "." in key:
-        return
+        return ()
+    found = []
     for m in MODULES:
         mod_name = m.get("name", "")
         if not mod_name:
             continue
         config = m.get("config", {})
-        if isinstance(config, dict):
-            for fname in config:
-                if fname == key:
-                    yield f"{mod_name}.{fname}"
-                    break
+        if isinstance(config, Mapping) and key in config:
+            found.append(f"{mod_name}.{key}")
+    return tuple(found)
 
 
 
@@ -478,7 +477,11 @@ def _get_validated_config_dict(ctx):
         return out
     except json.JSONDecodeError as e:
         log.error("Invalid JSON in %s: %s", config_file_path, e)
-        return {}
+        # Remember the failure for this mtime so each get_config() call does
+        # not re-read, re-parse and re-log a broken file until it changes.
+        _cached_config_dict = {}
+        _cached_config_mtime = current_mtime
+        return _cached_config_dict
     except OSError as e:
         log.error("Error reading %s: %s", config_file_path, e)
         return {}
@@ -674,11 +677,7 @@ def get_model_capability(ctx, model_id, endpoint):
     """Check the model catalog for capabilities (text, image, audio)."""
     provider = get_provider_from_endpoint(endpoint)
     # Check DEFAULT_MODELS for this ID/provider
-    for m in DEFAULT_MODELS:
-        effective_id = resolve_model_id(m, provider)
-        if effective_id == model_id:
-            return m.get("capability", "text")
-    return ""
+    return get_catalog_capability(provider, model_id) or ""
 
 
 def has_native_audio(ctx, model_id, endpoint):
@@ -730,6 +729,9 @@ def set_native_audio_support(ctx, model_id, endpoint, supported):
 # session). Key is normalized `.../v1/models`; value is model id list or None after failure.
 _model_fetch_cache: dict[str, list[str] | None] = {}
 
+# Providers whose /v1/models lists are too large to show in a combobox.
+_MASSIVE_PROVIDERS = frozenset({"openrouter", "together"})
+
 
 def endpoint_url_suitable_for_v1_models_fetch(endpoint: str) -> bool:
     """True if endpoint looks like a complete http(s) URL with a real host (skip mid-typing e.g. 'http:/')."""
@@ -821,56 +823,39 @@ def populate_combobox_with_lru(
     provider = get_provider_from_endpoint(endpoint)
     req_cap = "image" if "image" in lru_key.lower() else "audio" if "audio" in lru_key.lower() or "stt" in lru_key.lower() else "text"
     
-    to_show = list(lru)
+    # Insertion-ordered dict used as an ordered set: O(1) membership while
+    # merging fetched/default IDs into the LRU.
+    to_show = dict.fromkeys(lru)
 
     # For text models, determine if we should fetch from the API.
     # We do NOT fetch for known massive providers (openrouter, together).
-    massive_providers = {"openrouter", "together"}
     fetched_models: list[str] | None = None
     if remote_models is not None:
         if req_cap == "text":
             fetched_models = remote_models
     elif skip_remote_fetch:
         fetched_models = None
-    elif req_cap == "text" and endpoint and (not provider or provider not in massive_providers):
+    elif req_cap == "text" and endpoint and (not provider or provider not in _MASSIVE_PROVIDERS):
         fetched_models = fetch_available_models(endpoint)
 
     if fetched_models is not None:
-        for mid in fetched_models:
-            if mid not in to_show:
-                to_show.append(mid)
+        to_show.update(dict.fromkeys(fetched_models))
     else:
         # Merge defaults into the list if no fetching was done or fetching failed
         if provider:
-            for m in DEFAULT_MODELS:
-                capability = m.get("capability", "text")
-                if not isinstance(capability, str):
-                    capability = str(capability)
-                caps = [c.strip() for c in capability.split(",")]
-                if req_cap in caps:
-                    # Only add models that are marked as default for this capability
-                    is_default = False
-                    if req_cap == "text" and m.get("default_text"):
-                        is_default = True
-                    elif req_cap == "image" and m.get("default_image"):
-                        is_default = True
-                    elif req_cap == "audio" and m.get("default_audio"):
-                        is_default = True
-
-                    if is_default:
-                        effective_id = resolve_model_id(m, provider)
-                        if effective_id and effective_id not in to_show:
-                            to_show.append(effective_id)
+            # Only models marked as default for this capability
+            to_show.update(dict.fromkeys(get_default_model_ids(provider, req_cap)))
 
+    items = tuple(to_show)
     curr_val_str = str(current_val).strip()
     if curr_val_str and curr_val_str not in to_show:
-        to_show.insert(0, curr_val_str)
+        items = (curr_val_str,) + items
     
-    display_val = curr_val_str if curr_val_str else (to_show[0] if to_show else "")
+    display_val = curr_val_str if curr_val_str else (items[0] if items else "")
     
-    if to_show:
+    if items:
         ctrl.removeItems(0, ctrl.getItemCount())
-        ctrl.addItems(tuple(to_show), 0)
+        ctrl.addItems(items, 0)
     if display_val:
         ctrl.setText(display_val)
     elif ctrl.getItemCount() == 0 and hasattr(ctrl, "setText"):
@@ -1276,9 +1261,7 @@ class ConfigService(ServiceBase):
         except ConfigError:
             pass
 
-        if key not in self._defaults:
-            return default
-        return self._defaults[key]
+        return self._defaults.get(key, default)
 
     def set(self, key, value, caller_module=None):
         """Set a config value."""
@@ -2,12 +2,18 @@
 
 Flat catalog: each model has ``ids`` (provider-specific IDs). models are
 available for providers listed as keys in the ``ids`` dict.
+
+``DEFAULT_MODELS`` is read-only: a tuple of ``MappingProxyType`` entries with
+interned strings.
 """
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 
-def resolve_model_id(model: dict[str, Any], provider):
+def resolve_model_id(model: Mapping[str, Any], provider):
     """Resolve the effective model ID for a given provider.
 
     Args:
@@ -27,21 +33,23 @@ def get_provider_defaults(provider):
     """Return default models mapped per provider based on boolean flags in DEFAULT_MODELS."""
     if not provider:
         return {}
-    defaults = {}
-    for model in DEFAULT_MODELS:
-        effective_id = resolve_model_id(model, provider)
-        if not effective_id:
-            continue
-        if model.get("default_text") and "text_model" not in defaults:
-            defaults["text_model"] = effective_id
-        if model.get("default_image") and "image_model" not in defaults:
-            defaults["image_model"] = effective_id
-        if model.get("default_audio") and "stt_model" not in defaults:
-            defaults["stt_model"] = effective_id
-    return defaults
-
-
-DEFAULT_MODELS: list[dict[str, Any]] = [
+    return dict(_PROVIDER_DEFAULTS.get(provider, {}))
+
+
+def get_catalog_capability(provider, model_id):
+    """Return the catalog ``capability`` string for a provider's model ID, or None if not listed."""
+    return _CAPABILITY_BY_ID.get((provider, model_id))
+
+
+def get_default_model_ids(provider, capability):
+    """Return the provider's default model IDs for ``capability`` (text/image/audio), in catalog order.
+
+    Only models that both list the capability and carry its ``default_*`` flag are included.
+    """
+    return _DEFAULT_IDS.get((provider, capability), ())
+
+
+_MODEL_CATALOG: list[dict[str, Any]] = [
     # ---- Text models (cross-provider) ------------------------------------
 
     {
@@ -163,3 +171,59 @@ DEFAULT_MODELS: list[dict[str, Any]] = [
     },
 ]
 
+
+def _freeze(value):
+    """Intern strings, turn lists into tuples and dicts into read-only mappings."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+DEFAULT_MODELS: tuple[Mapping[str, Any], ...] = _freeze(_MODEL_CATALOG)
+del _MODEL_CATALOG
+
+
+# ---- Precomputed lookups ---------------------------------------------------
+# Built once at import so callers do a dict lookup instead of walking the
+# catalog. Catalog order is priority order: the first match wins.
+
+_DEFAULT_FLAGS = (
+    ("text", "default_text", "text_model"),
+    ("image", "default_image", "image_model"),
+    ("audio", "default_audio", "stt_model"),
+)
+
+# (provider, model ID) -> capability string
+_CAPABILITY_BY_ID: dict[tuple[str, str], str] = {}
+# (provider, capability) -> default model IDs that list that capability
+_DEFAULT_IDS: dict[tuple[str, str], tuple[str, ...]] = {}
+# provider -> {"text_model"|"image_model"|"stt_model": ID}, by default_* flag alone
+_PROVIDER_DEFAULTS: dict[str, dict[str, str]] = {}
+
+
+def _build_lookups():
+    default_ids: dict[tuple[str, str], list[str]] = {}
+    for model in DEFAULT_MODELS:
+        capability = str(model.get("capability", "text"))
+        caps = [c.strip() for c in capability.split(",")]
+        for provider, model_id in model.get("ids", {}).items():
+            if not model_id:
+                continue
+            _CAPABILITY_BY_ID.setdefault((provider, model_id), capability)
+            defaults = _PROVIDER_DEFAULTS.setdefault(provider, {})
+            for cap, flag, role in _DEFAULT_FLAGS:
+                if not model.get(flag):
+                    continue
+                defaults.setdefault(role, model_id)
+                if cap in caps:
+                    ids = default_ids.setdefault((provider, cap), [])
+                    if model_id not in ids:
+                        ids.append(model_id)
+    _DEFAULT_IDS.update((k, tuple(v)) for k, v in default_ids.items())
+
+
+_build_lookups()
@@ -38,7 +38,6 @@ XDL dialog loading (used by ModuleBase helpers)::
 """
 
 import logging
-import threading
 from typing import Any, cast
 import unohelper
 from plugin.framework.listeners import BaseActionListener
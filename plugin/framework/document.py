@@ -15,14 +15,14 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import io
 import logging
 import uno
-import time
 from enum import Enum, auto
 from plugin.modules.calc.bridge import CalcBridge
 from plugin.modules.calc.analyzer import SheetAnalyzer
 from plugin.framework.uno_context import get_active_document as get_active_doc
-from plugin.framework.errors import UnoObjectError, DocumentDisposedError, check_disposed, safe_call, safe_uno_call
+from plugin.framework.errors import UnoObjectError, check_disposed, safe_call, safe_uno_call
 
 
 class DocumentType(Enum):
@@ -472,10 +472,11 @@ def get_calc_context_for_chat(model, max_context=8000, ctx=None):
         analyzer = SheetAnalyzer(bridge)
         summary = analyzer.get_sheet_summary()
 
-        ctx_str = f"Spreadsheet Document: {model.getURL() or 'Untitled'}\n"
-        ctx_str += f"Active Sheet: {summary['sheet_name']}\n"
-        ctx_str += f"Used Range: {summary['used_range']} ({summary['row_count']} rows x {summary['col_count']} columns)\n"
-        ctx_str += f"Columns: {', '.join([str(h) for h in summary['headers'] if h])}\n"
+        out = io.StringIO()
+        out.write(f"Spreadsheet Document: {model.getURL() or 'Untitled'}\n")
+        out.write(f"Active Sheet: {summary['sheet_name']}\n")
+        out.write(f"Used Range: {summary['used_range']} ({summary['row_count']} rows x {summary['col_count']} columns)\n")
+        out.write(f"Columns: {', '.join([str(h) for h in summary['headers'] if h])}\n")
 
         # Add selection context if available
         controller = safe_call(model.getCurrentController, "Get current controller")
@@ -485,18 +486,18 @@ def get_calc_context_for_chat(model, max_context=8000, ctx=None):
                 addr = safe_call(selection.getRangeAddress, "Get range address")
                 from plugin.modules.calc.address_utils import index_to_column
                 sel_range = f"{index_to_column(addr.StartColumn)}{addr.StartRow + 1}:{index_to_column(addr.EndColumn)}{addr.EndRow + 1}"
-                ctx_str += f"Current Selection: {sel_range}\n"
+                out.write(f"Current Selection: {sel_range}\n")
 
                 # Check for selected values if small
                 if (addr.EndRow - addr.StartRow + 1) * (addr.EndColumn - addr.StartColumn + 1) < 100:
                     from plugin.modules.calc.inspector import CellInspector
                     inspector = CellInspector(bridge)
                     cells = inspector.read_range(sel_range)
-                    ctx_str += "Selection Content (CSV-like):\n"
+                    out.write("Selection Content (CSV-like):\n")
                     for row in cells:
-                        ctx_str += ", ".join([str(c['value']) if c['value'] is not None else "" for c in row]) + "\n"
+                        out.write(", ".join([str(c['value']) if c['value'] is not None else "" for c in row]) + "\n")
 
-        return ctx_str
+        return out.getvalue()
     except UnoObjectError as e:
         logging.getLogger(__name__).warning("get_calc_context_for_chat error: %s", e)
         return "[Unable to read Calc spreadsheet context. The document may be locked or initializing.]"
@@ -517,8 +518,9 @@ def get_draw_context_for_chat(model, max_context=8000, ctx=None):
         is_impress = safe_call(model.supportsService, "Check supportsService", "com.sun.star.presentation.PresentationDocument")
         doc_type = "Impress Presentation" if is_impress else "Draw Document"
 
-        ctx_str = "%s: %s\n" % (doc_type, safe_call(model.getURL, "Get document URL") or "Untitled")
-        ctx_str += "Total %s: %d\n" % ("Slides" if is_impress else "Pages", safe_call(pages.getCount, "Get page count"))
+        out = io.StringIO()
+        out.write("%s: %s\n" % (doc_type, safe_call(model.getURL, "Get document URL") or "Untitled"))
+        out.write("Total %s: %d\n" % ("Slides" if is_impress else "Pages", safe_call(pages.getCount, "Get page count")))
 
         # Get index of active page
         active_page_idx = -1
@@ -527,23 +529,23 @@ def get_draw_context_for_chat(model, max_context=8000, ctx=None):
                 active_page_idx = i
                 break
 
-        ctx_str += "Active %s Index: %d\n" % ("Slide" if is_impress else "Page", active_page_idx)
+        out.write("Active %s Index: %d\n" % ("Slide" if is_impress else "Page", active_page_idx))
 
         # Summarize shapes on active page
         if active_page:
             shapes = bridge.get_shapes(active_page)
-            ctx_str += "\nShapes on %s %d:\n" % ("Slide" if is_impress else "Page", active_page_idx)
+            out.write("\nShapes on %s %d:\n" % ("Slide" if is_impress else "Page", active_page_idx))
             for i, s in enumerate(shapes):
                 type_name = safe_call(s.getShapeType, "Get shape type").split(".")[-1]
                 pos = safe_call(s.getPosition, "Get position")
                 size = safe_call(s.getSize, "Get size")
-                ctx_str += "- [%d] %s: pos(%d, %d) size(%dx%d)" % (
-                    i, type_name, pos.X, pos.Y, size.Width, size.Height)
+                out.write("- [%d] %s: pos(%d, %d) size(%dx%d)" % (
+                    i, type_name, pos.X, pos.Y, size.Width, size.Height))
                 if hasattr(s, "getString"):
                     text = normalize_linebreaks(safe_call(s.getString, "Get string"))
                     if text:
-                        ctx_str += " text: \"%s\"" % text[:200]
-                ctx_str += "\n"
+                        out.write(" text: \"%s\"" % text[:200])
+                out.write("\n")
             
             # Impress-specific: Speaker Notes
             if is_impress and hasattr(active_page, "getNotesPage"):
@@ -555,11 +557,11 @@ def get_draw_context_for_chat(model, max_context=8000, ctx=None):
                         if safe_call(shape.getShapeType, "Get notes shape type") == "com.sun.star.presentation.NotesShape":
                             notes_text += safe_call(shape.getString, "Get notes shape string") + "\n"
                     if notes_text.strip():
-                        ctx_str += "\nSpeaker Notes:\n%s\n" % notes_text.strip()
+                        out.write("\nSpeaker Notes:\n%s\n" % notes_text.strip())
                 except UnoObjectError:
                     pass
 
-        return ctx_str
+        return out.getvalue()
     except UnoObjectError as e:
         logging.getLogger(__name__).warning("get_draw_context_for_chat error: %s", e)
         return "[Unable to read Draw/Impress context. The document may be locked or initializing.]"
@@ -23,7 +23,12 @@ All custom exceptions should inherit from WriterAgentException.
 import json
 from typing import Any
 
-from plugin.framework.types import ToolResult, ToolError
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    # Not bundled with LibreOffice's Python; the stdlib parser is used instead.
+    orjson = None
 
 
 class WriterAgentException(Exception):
@@ -206,13 +211,42 @@ def safe_json_loads(text: Any, default: Any = None) -> Any:
     if not isinstance(text, (str, bytes, bytearray)):
         return default
     try:
-        parsed = json.loads(text)
+        if orjson is not None:
+            try:
+                parsed = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than json (NaN, >64-bit ints, lone
+                # surrogates); let json decide so results do not depend on it.
+                parsed = json.loads(text)
+        else:
+            parsed = json.loads(text)
         return parsed if parsed is not None else default
     except (json.JSONDecodeError, TypeError, ValueError, RecursionError):
         # Catch RecursionError to prevent DoS from deeply nested structures
         return default
 
 
+def json_dumps_compact(obj: Any) -> str:
+    """Serialize *obj* to compact JSON with non-ASCII text left unescaped.
+
+    Matches ``json.dumps(obj, ensure_ascii=False, separators=(",", ":"))``
+    for plain JSON data, using orjson when it is installed, which matters for
+    large tool results. datetime and dataclass values are passed through to
+    json so they raise TypeError either way. Known orjson differences: NaN and
+    infinities are written as ``null`` rather than ``NaN``, and UUIDs are
+    serialized instead of rejected.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            ).decode("utf-8")
+        except (orjson.JSONEncodeError, TypeError):
+            # Non-str keys, >64-bit ints, passed-through types: let json decide.
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
 def safe_python_literal_eval(text: Any, default: Any = None) -> Any:
     """Safely parse a Python-style literal (e.g. from an LLM) without using ast.literal_eval.
     Supports scalars (bool, None, number, string) and simple JSON-compatible lists/dicts.
@@ -24,7 +24,6 @@ from plugin.modules.http.client import LlmClient
 from plugin.modules.http.requests import sync_request
 from plugin.modules.http.errors import _format_http_error_response
 from plugin.framework.logging import redact_sensitive_payload_for_log
-from plugin.contrib.aihordeclient import AiHordeClient
 from plugin.framework.config import (
     get_config_bool, get_config_int, get_config_float, get_config_str
 )
@@ -35,6 +34,12 @@ logger = logging.getLogger(__name__)
 
 TRIM_IMAGES_IN_LOG = True
 
+# AiHordeClient stores the downloaded model list and per-model requirements
+# (with their refresh dates) in settings["local_settings"]. A provider is
+# built per request, so one dict is shared for the process; otherwise every
+# generation re-downloads and re-parses both.
+_HORDE_LOCAL_SETTINGS: dict = {}
+
 class ImageProvider:
     def generate(self, prompt, **kwargs):
         raise NotImplementedError()
@@ -230,8 +235,12 @@ class AIHordeImageProvider(ImageProvider):
             "image_nsfw": get_config_bool(ctx, "image_nsfw"),
             "image_censor_nsfw": get_config_bool(ctx, "image_censor_nsfw"),
             "image_max_wait": get_config_int(ctx, "image_max_wait"),
+            "local_settings": _HORDE_LOCAL_SETTINGS,
         }
 
+        # Imported here so endpoint-only setups never load the Horde client.
+        from plugin.contrib.aihordeclient import AiHordeClient
+
         self.client = AiHordeClient(
             client_version="1.0.0",
             url_version_update="",
@@ -299,7 +308,8 @@ class ImageService:
             return AIHordeImageProvider(self.config, self.ctx)
         if name == "endpoint":
             from plugin.framework.config import get_api_config, get_text_model
-            api_config = get_api_config(self.ctx).copy()
+            # get_api_config builds a fresh dict per call; no defensive copy needed.
+            api_config = get_api_config(self.ctx)
             api_config["model"] = (self.config.get("image_model") or "").strip() or get_text_model(self.ctx)
             return EndpointImageProvider(api_config, self.ctx)
         return None
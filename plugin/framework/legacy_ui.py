@@ -32,7 +32,7 @@ from plugin.framework.i18n import _
 from plugin.framework.config import (
     get_config, get_current_endpoint, get_text_model,
     populate_combobox_with_lru, set_config, update_lru_history,
-    get_config_str, get_config_bool, get_config_int, get_config_float
+    get_config_str
 )
 from plugin.framework.logging import init_logging, agent_log
 from plugin.modules.chatbot.history_db import HAS_SQLITE
@@ -147,7 +147,7 @@ def settings_box(ctx, title="Settings", x=None, y=None):
     dlg.getControl("btn_tab_image").addActionListener(TabListener(dlg, 2))
     
     try:
-        from plugin._manifest import MODULES
+        from plugin._manifest import MODULES, get_module
         
         inline_targets = {}
         for m in MODULES:
@@ -166,11 +166,11 @@ def settings_box(ctx, title="Settings", x=None, y=None):
             if target not in inline_targets:
                 inline_set.add(name)
 
-        by_name = {m["name"]: m for m in MODULES}
         inline_map = {}
         for name in inline_set:
             target = inline_targets[name]
-            inline_map.setdefault(target, []).append((by_name[name], by_name[name].get("config", {})))
+            m = get_module(name)
+            inline_map.setdefault(target, []).append((m, m.get("config", {})))
 
         page_num = 3
         for m in MODULES:
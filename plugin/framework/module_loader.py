@@ -1,6 +1,7 @@
 import os
 import logging
-from typing import Any, List, cast
+from collections.abc import Mapping, Sequence
+from typing import Any, List
 
 from plugin.framework.utils import get_plugin_dir
 
@@ -11,11 +12,15 @@ class ModuleLoader:
     """
 
     @staticmethod
-    def load_manifest() -> List[dict[str, Any]]:
-        """Loads the module manifest."""
+    def load_manifest() -> Sequence[Mapping[str, Any]]:
+        """Loads the module manifest in dependency order.
+
+        The order (``LOAD_ORDER``) is resolved by ``scripts/generate_manifest.py``
+        at build time, so no sorting happens at startup.
+        """
         try:
-            from plugin._manifest import MODULES
-            return cast(list[dict[str, Any]], MODULES)
+            from plugin._manifest import LOAD_ORDER, get_module
+            return tuple(get_module(name) for name in LOAD_ORDER)
         except ImportError as e:
             raise RuntimeError(
                 "plugin._manifest is missing or invalid (gitignored; run "
@@ -23,10 +28,12 @@ class ModuleLoader:
             ) from e
 
     @staticmethod
-    def topo_sort(modules: List[dict[str, Any]]) -> List[dict[str, Any]]:
+    def topo_sort(modules: Sequence[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
         """
         Sorts modules based on their required services.
         Ensures dependencies are initialized before the modules that require them.
+        The generated manifest is already sorted (``LOAD_ORDER``); this is for
+        ad-hoc module lists.
         """
         by_name = {m["name"]: m for m in modules}
         provides = {}
@@ -44,7 +51,9 @@ class ModuleLoader:
             m = by_name.get(name)
             if m is None:
                 return
-            for req in m.get("requires", []):
+            # requires is a frozenset in the generated manifest; sort so the
+            # resulting order does not depend on string hash randomization.
+            for req in sorted(m.get("requires", ())):
                 provider = provides.get(req, req)
                 if provider in by_name:
                     visit(provider)
@@ -63,7 +72,7 @@ class ModuleLoader:
         Returns a list of initialized module instances.
         """
         initialized_modules = []
-        manifests = cls.topo_sort(cls.load_manifest())
+        manifests = cls.load_manifest()
 
         for manifest in manifests:
             name = manifest["name"]
@@ -25,6 +25,10 @@ log = logging.getLogger(__name__)
 PRICING_FILENAME = "openrouter_pricing.json"
 CACHE_TTL = 86400 * 7  # 7 days
 
+# (path, mtime_ns, size) -> {model_id: (prompt_rate, completion_rate) or None}.
+# Holds the last parsed pricing file; a rewrite changes the key.
+_RATES_CACHE = {}
+
 def _get_cache_path(ctx):
     config_dir = user_config_dir(ctx)
     if not config_dir:
@@ -60,6 +64,34 @@ def fetch_openrouter_pricing(ctx, force=False):
         else:
             log.error(f"Failed to fetch OpenRouter pricing (unexpected): {e}")
 
+def _load_rates(cache_path):
+    """Parse the pricing file into a model_id -> rates dict, once per file version."""
+    st = os.stat(cache_path)
+    key = (cache_path, st.st_mtime_ns, st.st_size)
+    rates = _RATES_CACHE.get(key)
+    if rates is not None:
+        return rates
+
+    with open(cache_path, "r", encoding="utf-8") as f:
+        models = json.load(f)
+
+    rates = {}
+    for m in models:
+        model_id = m.get("id")
+        if model_id in rates:
+            continue  # first entry wins, as with a linear search
+        p = m.get("pricing", {})
+        try:
+            # Rates are often given per 1000 tokens or similar in some APIs,
+            # but OpenRouter /models returns USD per 1 token.
+            rates[model_id] = (float(p.get("prompt", 0)), float(p.get("completion", 0)))
+        except (ValueError, TypeError):
+            rates[model_id] = None
+
+    _RATES_CACHE.clear()
+    _RATES_CACHE[key] = rates
+    return rates
+
 def get_model_pricing(ctx, model_id):
     """Return (prompt_rate, completion_rate) per token in USD."""
     cache_path = _get_cache_path(ctx)
@@ -67,15 +99,7 @@ def get_model_pricing(ctx, model_id):
         return None
         
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            models = json.load(f)
-            
-        for m in models:
-            if m.get("id") == model_id:
-                p = m.get("pricing", {})
-                # Rates are often given per 1000 tokens or similar in some APIs, 
-                # but OpenRouter /models returns USD per 1 token.
-                return float(p.get("prompt", 0)), float(p.get("completion", 0))
+        return _load_rates(cache_path).get(model_id)
     except (IOError, json.JSONDecodeError, ValueError):
         pass
         
@@ -17,6 +17,13 @@
 """Convert between OpenAI function-calling and MCP tool schemas."""
 
 import copy
+import re
+
+# JSON Schema annotations that only document the schema; function-calling
+# models do not need them, so the compact form drops them.
+_ANNOTATION_KEYS = frozenset({"title", "examples", "$schema", "$comment"})
+_RE_SPACE_RUN = re.compile(r"[ \t]{2,}")
+_RE_LINE_EDGE = re.compile(r"[ \t]*\n[ \t]*")
 
 
 def _normalize_schema_for_strict_providers(params):
@@ -99,3 +106,50 @@ def to_mcp_schema(tool):
         "description": tool.description or "",
         "inputSchema": input_schema,
     }
+
+
+def _compact_description(text):
+    """Collapse indentation and repeated blanks; keep line breaks."""
+    return _RE_LINE_EDGE.sub("\n", _RE_SPACE_RUN.sub(" ", text)).strip()
+
+
+def _compact_schema(schema):
+    """Return *schema* without annotation keywords, recursing into sub-schemas.
+
+    Keys under ``properties`` are parameter names, not keywords, so a
+    parameter called ``title`` is kept.
+    """
+    if not isinstance(schema, dict):
+        return schema
+    out = {}
+    for key, value in schema.items():
+        if key in _ANNOTATION_KEYS:
+            continue
+        if key == "description" and isinstance(value, str):
+            value = _compact_description(value)
+        elif key == "properties" and isinstance(value, dict):
+            value = {name: _compact_schema(sub) for name, sub in value.items()}
+        elif key in ("items", "additionalProperties", "not"):
+            value = _compact_schema(value)
+        elif key in ("anyOf", "oneOf", "allOf") and isinstance(value, list):
+            value = [_compact_schema(sub) for sub in value]
+        out[key] = value
+    return out
+
+
+def compact_openai_schema(schema):
+    """Return a token-lean copy of an OpenAI function schema.
+
+    Drops ``title`` / ``examples`` / ``$schema`` / ``$comment`` annotations and
+    collapses whitespace in descriptions.  Description text itself is kept
+    intact: it carries the examples and formats the model relies on.
+    """
+    function = schema["function"]
+    return {
+        "type": schema["type"],
+        "function": {
+            "name": function["name"],
+            "description": _compact_description(function["description"]),
+            "parameters": _compact_schema(function["parameters"]),
+        },
+    }
@@ -52,10 +52,14 @@ class ServiceRegistry:
 
         log = logging.getLogger("writeragent.services")
 
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        # vars() is the module __dict__ itself: no dir() + getattr() walk and
+        # no sort, unlike inspect.getmembers().
+        module_name = module.__name__
+        for obj in vars(module).values():
+            if not isinstance(obj, type) or obj.__module__ != module_name:
+                continue
             if (issubclass(obj, ServiceBase) and
                 obj is not ServiceBase and
-                obj.__module__ == module.__name__ and
                 not inspect.isabstract(obj) and
                 getattr(obj, "name", None)):
 
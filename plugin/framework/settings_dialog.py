@@ -23,6 +23,7 @@ from plugin.framework.config import (
 from plugin.framework.event_bus import global_event_bus
 
 import logging
+from collections.abc import Mapping
 from plugin.framework.i18n import _
 
 log = logging.getLogger(__name__)
@@ -59,21 +60,22 @@ def get_settings_field_specs(ctx):
     ]
 
     try:
-        from plugin._manifest import MODULES
+        from plugin._manifest import MODULES, INTERNAL_CONFIG_KEYS
         for m in MODULES:
             m_name = str(m.get("name", ""))
             if m_name in ("main", "ai"):
                 continue
+            internal_keys = INTERNAL_CONFIG_KEYS.get(m_name, ())
 
             m_config = m.get("config", {})
-            if not isinstance(m_config, dict):
+            if not isinstance(m_config, Mapping):
                 m_config = {}
 
             for field_name, schema in m_config.items():
-                if not isinstance(schema, dict):
+                if not isinstance(schema, Mapping):
                     continue
 
-                if schema.get("internal") or schema.get("widget") == "list_detail":
+                if field_name in internal_keys or schema.get("widget") == "list_detail":
                     continue
                 
                 prefix = m_name.replace(".", "_")
@@ -85,9 +87,9 @@ def get_settings_field_specs(ctx):
                 opts = schema.get("options", [])
 
                 # For select/combo with value/label options, use label for display so dropdown shows correctly
-                if isinstance(opts, list) and opts and isinstance(opts[0], dict):
+                if isinstance(opts, (list, tuple)) and opts and isinstance(opts[0], Mapping):
                     for o in opts:
-                        if isinstance(o, dict) and str(o.get("value", "")) == str(val).strip().lower():
+                        if isinstance(o, Mapping) and str(o.get("value", "")) == str(val).strip().lower():
                             val = _(str(o.get("label", val)))
                             break
 
@@ -104,7 +106,11 @@ def get_settings_field_specs(ctx):
                         from plugin.framework.errors import ConfigError
                         log.error(f"ConfigError in options_provider {provider_path}: {e}")
                 elif schema.get("options"):
-                    field["options"] = schema["options"]
+                    # Manifest options are read-only; hand the dialog plain lists/dicts.
+                    field["options"] = [
+                        dict(o) if isinstance(o, Mapping) else o
+                        for o in schema["options"]
+                    ]
 
                 schema_type = schema.get("type", "string")
                 if schema_type == "boolean":
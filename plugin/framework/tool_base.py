@@ -55,6 +55,14 @@ class ToolBase(ABC):
     is_mutation: bool | None = None
     long_running: bool = False
 
+    # Every subclass in definition order, recorded by __init_subclass__ so
+    # ToolRegistry.auto_discover() does not have to scan module namespaces.
+    _subclasses: list[type["ToolBase"]] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        ToolBase._subclasses.append(cls)
+
     def detects_mutation(self):
         """Return True if the tool mutates the document."""
         if self.is_mutation is not None:
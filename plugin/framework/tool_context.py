@@ -72,3 +72,23 @@ class ToolContext:
         self.approval_callback = approval_callback
         self.chat_append_callback = chat_append_callback
         self.set_active_domain_callback = set_active_domain_callback
+
+    @classmethod
+    def from_defaults(cls, doc, ctx, doc_type, services, caller=""):
+        """Build a context with no callbacks, skipping keyword binding in ``__init__``.
+
+        Used on per-request paths (MCP) that never pass callbacks.
+        """
+        self = object.__new__(cls)
+        self.doc = doc
+        self.ctx = ctx
+        self.doc_type = doc_type
+        self.services = services
+        self.caller = caller
+        self.status_callback = None
+        self.append_thinking_callback = None
+        self.stop_checker = None
+        self.approval_callback = None
+        self.chat_append_callback = None
+        self.set_active_domain_callback = None
+        return self
@@ -17,14 +17,18 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Central tool registry with unified execution."""
 
+import importlib
 import logging
+import pkgutil
+import sys
 import threading
 import queue
+from collections import defaultdict
 from typing import Any, cast
 from plugin.framework.types import ToolResult, ToolError
 
-from plugin.framework.tool_base import ToolBase
-from plugin.framework.schema_convert import to_openai_schema, to_mcp_schema
+from plugin.framework.tool_base import ToolBase, ToolBaseDummy
+from plugin.framework.schema_convert import compact_openai_schema, to_openai_schema, to_mcp_schema
 from plugin.framework.errors import ToolExecutionError
 
 log = logging.getLogger("writeragent.tools")
@@ -42,9 +46,29 @@ class ToolRegistry:
 
     def __init__(self, services):
         self._services = services
+        # Resolved once; execute() emits through it on every call.
+        self._bus = services.get("events") if services is not None else None
         self._tools = {}  # name -> ToolBase instance
+        # Tools are immutable once registered, so convert their schemas once.
+        self._openai_schema_cache = {}  # name -> OpenAI function schema
+        self._openai_compact_schema_cache = {}  # name -> compact_openai_schema()
+        self._mcp_schema_cache = {}  # name -> MCP tools/list schema
+        # tier / intent -> {name: tool}, in registration order.
+        self._by_tier = defaultdict(dict)
+        self._by_intent = defaultdict(dict)
+        self._by_domain = defaultdict(dict)  # specialized_domain -> {name: tool}
+        self._summary_cache = {}  # name -> get_tool_summaries() entry
+        self._mutation = {}  # name -> tool.detects_mutation()
+        self._param_keys = {}  # name -> frozenset of schema property names
+        self._needs_validate = {}  # name -> False when validate() cannot fail
+        self._async = {}  # name -> tool.is_async()
+        self._async_names = None  # frozenset shared by every chat turn; reset on register
         self.batch_mode = False  # suppress per-tool cache invalidation
 
+    def set_event_bus(self, bus):
+        """Set (or clear, with None) the bus that receives tool:* events."""
+        self._bus = bus
+
     # ── Registration ──────────────────────────────────────────────────
 
     def register(self, tool):
@@ -75,7 +99,35 @@ class ToolRegistry:
                     type(existing_tool).__name__,
                     type(tool).__name__,
                 )
+            self._by_tier[existing_tool.tier].pop(tool.name, None)
+            self._by_intent[existing_tool.intent].pop(tool.name, None)
+            self._by_domain.get(getattr(existing_tool, "specialized_domain", None), {}).pop(tool.name, None)
         self._tools[tool.name] = tool
+        self._by_tier[tool.tier][tool.name] = tool
+        self._by_intent[tool.intent][tool.name] = tool
+        domain = getattr(tool, "specialized_domain", None)
+        if domain:
+            self._by_domain[domain][tool.name] = tool
+        openai_schema = to_openai_schema(tool)
+        self._openai_schema_cache[tool.name] = openai_schema
+        self._openai_compact_schema_cache[tool.name] = compact_openai_schema(openai_schema)
+        self._mcp_schema_cache[tool.name] = to_mcp_schema(tool)
+        self._summary_cache[tool.name] = {
+            "name": tool.name,
+            "description": tool.description[:120],
+            "tier": tool.tier,
+            "intent": tool.intent,
+        }
+        self._mutation[tool.name] = bool(tool.detects_mutation())
+        self._param_keys[tool.name] = frozenset((tool.parameters or {}).get("properties", {}))
+        # execute() already drops keys outside the schema, so the stock
+        # validate() can only fail on a missing required parameter.
+        self._needs_validate[tool.name] = (
+            type(tool).validate is not ToolBase.validate
+            or bool((tool.parameters or {}).get("required"))
+        )
+        self._async[tool.name] = bool(tool.is_async())
+        self._async_names = None
 
     def register_many(self, tools):
         for t in tools:
@@ -83,17 +135,19 @@ class ToolRegistry:
 
     def auto_discover_package(self, package_name):
         """Automatically discover and register ToolBase subclasses in all submodules of a package."""
-        import importlib
-        import pkgutil
-
         # Import the package itself to get its path
-        package = importlib.import_module(package_name)
+        package = sys.modules.get(package_name) or importlib.import_module(package_name)
 
-        # Iterate over all submodules in the package directory
+        # Iterate over all submodules in the package directory. iter_modules()
+        # resolves each path entry's finder once (sys.path_importer_cache);
+        # modules the package __init__ already imported are taken straight
+        # from sys.modules.
         for _, module_name, is_pkg in pkgutil.iter_modules(package.__path__):
             full_module_name = f"{package_name}.{module_name}"
             try:
-                module = importlib.import_module(full_module_name)
+                module = sys.modules.get(full_module_name)
+                if module is None:
+                    module = importlib.import_module(full_module_name)
                 self.auto_discover(module)
             except ImportError as e:
                 log.error("Failed to import module %s for tool discovery: %s", full_module_name, e)
@@ -104,22 +158,21 @@ class ToolRegistry:
 
     def auto_discover(self, module):
         """Automatically discover and register ToolBase subclasses in a module."""
-        import inspect
-        from plugin.framework.tool_base import ToolBase, ToolBaseDummy
-
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            # Must inherit from ToolBase, but not be ToolBase itself or ToolBaseDummy.
+        module_name = module.__name__
+        for obj in ToolBase._subclasses:
+            # Must be defined in this module to avoid double registration from imports.
             # ToolBaseDummy is our way of easily disabling a tool if we don't think it's
             # worth having exposed to the AI, so we explicitly skip registering them.
-            # Must be defined in this module to avoid double registration from imports
             # Also exclude abstract classes or classes without a defined 'name'
-            if (issubclass(obj, ToolBase) and
-                obj is not ToolBase and
+            if (obj.__module__ == module_name and
                 not issubclass(obj, ToolBaseDummy) and
-                obj.__module__ == module.__name__ and
-                not inspect.isabstract(obj) and
+                not getattr(obj, "__abstractmethods__", None) and
                 getattr(obj, "name", None)):
 
+                # Re-discovering a module (module reload, second package
+                # scan) would build an instance only for register() to drop it.
+                if type(self._tools.get(obj.name)) is obj:
+                    continue
                 try:
                     tool_instance = obj()
                     self.register(tool_instance)
@@ -158,7 +211,24 @@ class ToolRegistry:
             active_domain: If provided, dynamically includes specialized tools for this domain
                 and the specialized_workflow_finished tool.
         """
-        tools = self._tools.values()
+        # Narrow the candidates through the tier/intent indices first so the
+        # document checks below only run on tools that can be returned.
+        tools = self._by_tier.get(tier, {}) if tier else self._tools
+        by_intent = self._by_intent.get(intent, {}) if intent else None
+
+        # Most tools share a handful of service names; ask the document once
+        # per service rather than once per tool (each call crosses the UNO bridge).
+        service_support = {}
+
+        def doc_supports(svc):
+            supported = service_support.get(svc)
+            if supported is None:
+                try:
+                    supported = bool(doc.supportsService(svc))
+                except Exception:
+                    supported = False
+                service_support[svc] = supported
+            return supported
 
         # Helper to check if a tool supports the document
         def supports_doc(t):
@@ -168,18 +238,10 @@ class ToolRegistry:
             has_uno = hasattr(t, "uno_services") and t.uno_services is not None
             has_types = hasattr(t, "doc_types") and t.doc_types is not None
 
-            is_supported = False
             if has_uno:
                 if doc is not None and hasattr(doc, "supportsService"):
-                    for svc in t.uno_services:
-                        try:
-                            if doc.supportsService(svc):
-                                is_supported = True
-                                break
-                        except Exception:
-                            pass
-                if is_supported:
-                    return True
+                    if any(doc_supports(svc) for svc in t.uno_services):
+                        return True
 
             if has_types:
                 if doc_type is not None and doc_type in t.doc_types:
@@ -188,8 +250,6 @@ class ToolRegistry:
 
             return not has_uno
 
-        tools = [t for t in tools if supports_doc(t)]
-
         # If we have an active domain, we want to include its tools (and the finish tool),
         # even if they are in the excluded tiers.
         from plugin.modules.writer.base import ToolWriterSpecialBase
@@ -200,74 +260,82 @@ class ToolRegistry:
             import typing
             to_exclude = frozenset(typing.cast(typing.Iterable[typing.Any], exclude_tiers)) if exclude_tiers else frozenset()
 
-        if active_domain:
+        def in_domain(t):
             # If an active domain is set, restrict the list ONLY to the specialized tools
             # for that domain and the finish tool. Do not include normal core/extended tools.
-            filtered_tools = []
-            for t in tools:
-                if isinstance(t, ToolWriterSpecialBase) and t.specialized_domain == active_domain:
-                    filtered_tools.append(t)
-                #FIXME, these strings should be calculated or handled another way
-                elif getattr(t, "name", "") in ["final_answer", "specialized_workflow_finished", "reply_to_user"]:
-                    filtered_tools.append(t)
-            tools = filtered_tools
-        else:
-            if to_exclude:
-                def _tier_excluded(t):
-                    tier = getattr(t, "tier", None)
-                    if tier not in to_exclude:
-                        return False
-                    # create_shape is specialized for Writer-only default lists; Draw/Impress
-                    # still expose it as a core-style shape tool (shared tool name).
-                    if getattr(t, "name", None) == "create_shape" and tier == "specialized":
-                        if doc is not None and hasattr(doc, "supportsService"):
-                            try:
-                                if not doc.supportsService("com.sun.star.text.TextDocument"):
-                                    return False
-                            except Exception:
-                                pass
-                        return True
-                    return True
-
-                tools = [t for t in tools if not _tier_excluded(t)]
-
-        if tier:
-            tools = [t for t in tools if t.tier == tier]
-        if intent:
-            tools = [t for t in tools if t.intent == intent]
-        if names:
-            tools = [t for t in tools if t.name in names]
-        return list(tools)
+            if isinstance(t, ToolWriterSpecialBase) and t.specialized_domain == active_domain:
+                return True
+            #FIXME, these strings should be calculated or handled another way
+            return getattr(t, "name", "") in ["final_answer", "specialized_workflow_finished", "reply_to_user"]
 
-    def get_schemas(self, protocol="openai", active_domain=None, **kwargs):
+        def tier_excluded(t):
+            tier = getattr(t, "tier", None)
+            if tier not in to_exclude:
+                return False
+            # create_shape is specialized for Writer-only default lists; Draw/Impress
+            # still expose it as a core-style shape tool (shared tool name).
+            if getattr(t, "name", None) == "create_shape" and tier == "specialized":
+                if doc is not None and hasattr(doc, "supportsService"):
+                    try:
+                        if not doc.supportsService("com.sun.star.text.TextDocument"):
+                            return False
+                    except Exception:
+                        pass
+                return True
+            return True
+
+        # One pass; the cheap name/tier checks run before the document check.
+        return [
+            t for t in tools.values()
+            if (by_intent is None or t.name in by_intent)
+            and (not names or t.name in names)
+            and (in_domain(t) if active_domain else not (to_exclude and tier_excluded(t)))
+            and supports_doc(t)
+        ]
+
+    def get_schemas(self, protocol="openai", active_domain=None, compact=False, **kwargs):
         """Return schemas for tools matching the given kwargs criteria.
 
+        The schemas are converted once in register() and shared between
+        calls; callers must treat them as read-only.
+
         Args:
             protocol: Either "openai" or "mcp".
             active_domain: Optional active specialized domain.
+            compact: For "openai", return the compact_openai_schema() form.
             **kwargs: Filters passed to get_tools().
         """
-        tools = self.get_tools(active_domain=active_domain, **kwargs)
         if protocol == "openai":
-            return [to_openai_schema(t) for t in tools]
+            cache = self._openai_compact_schema_cache if compact else self._openai_schema_cache
         elif protocol == "mcp":
-            return [to_mcp_schema(t) for t in tools]
+            cache = self._mcp_schema_cache
         else:
             raise ValueError(f"Unknown protocol: {protocol}")
+        tools = self.get_tools(active_domain=active_domain, **kwargs)
+        return [cache[t.name] for t in tools]
 
     def get_tool_summaries(self, **kwargs):
         """Lightweight catalogue: ``[{"name", "description", "tier", "intent"}]``."""
-        tools = self.get_tools(**kwargs)
-        return [{"name": t.name,
-                 "description": (t.description or "")[:120],
-                 "tier": t.tier,
-                 "intent": t.intent}
-                for t in tools]
+        return [self._summary_cache[t.name] for t in self.get_tools(**kwargs)]
+
+    def get_domain_tools(self, domain):
+        """Return tools whose ``specialized_domain`` is *domain*, in registration order."""
+        return list(self._by_domain.get(domain, {}).values())
 
     def get(self, name):
         """Get a tool by name, or None."""
         return self._tools.get(name)
 
+    def is_mutation(self, name):
+        """Return True if the named tool mutates the document (False if unknown)."""
+        return self._mutation.get(name, False)
+
+    def async_tool_names(self):
+        """Frozenset of registered tool names whose ``is_async()`` is True."""
+        if self._async_names is None:
+            self._async_names = frozenset(name for name, is_async in self._async.items() if is_async)
+        return self._async_names
+
     # ── Execution ─────────────────────────────────────────────────────
 
     def _get_tool_timeout(self, tool):
@@ -350,9 +418,9 @@ class ToolRegistry:
 
             # Restrict kwargs to this tool's schema so extra keys (e.g. image_model
             # from API/LLM) do not cause "Unknown parameter" validation errors.
-            props = (tool.parameters or {}).get("properties", {})
-            if props:
-                kwargs = {k: v for k, v in kwargs.items() if k in props}
+            param_keys = self._param_keys[tool_name]
+            if param_keys:
+                kwargs = {k: v for k, v in kwargs.items() if k in param_keys}
 
             from plugin.framework.errors import format_error_payload, ToolExecutionError
 
@@ -364,18 +432,19 @@ class ToolRegistry:
                 common_details["doc_type"] = ctx.doc_type
 
             # Validate parameters
-            ok, err = tool.validate(**kwargs)
-            if not ok:
-                return {
-                    "status": "error",
-                    "code": "VALIDATION_ERROR",
-                    "message": err,
-                    "details": common_details
-                }
+            if self._needs_validate[tool_name]:
+                ok, err = tool.validate(**kwargs)
+                if not ok:
+                    return {
+                        "status": "error",
+                        "code": "VALIDATION_ERROR",
+                        "message": err,
+                        "details": common_details
+                    }
 
             # Emit executing event
-            bus = self._services.get("events") if hasattr(self, "_services") and self._services else None
-            if bus:
+            bus = self._bus
+            if bus is not None:
                 bus.emit("tool:executing", name=tool_name, caller=ctx.caller)
 
             # Execution with simple isolation and timeout
@@ -397,7 +466,7 @@ class ToolRegistry:
                             merged[k] = v
                     cast(dict[str, Any], result)["details"] = merged
 
-            if bus:
+            if bus is not None:
                 # only emit completed if result was not an error (optional, but follows general pattern)
                 if not (isinstance(result, dict) and result.get("status") == "error"):
                     bus.emit("tool:completed", name=tool_name, caller=ctx.caller)
@@ -412,9 +481,9 @@ class ToolRegistry:
             raise
         except Exception as e:
             # Simple wrapping
-            bus = self._services.get("events") if hasattr(self, "_services") and self._services else None
+            bus = self._bus
             log.exception("Tool execution failed: %s", tool_name)
-            if bus:
+            if bus is not None:
                 bus.emit("tool:failed", name=tool_name, error=str(e), caller=ctx.caller)
             return {
                 "status": "error",
@@ -368,25 +368,6 @@ def get_menu_text(command):
             if text is not None:
                 return _(text)
 
-    # Fallback to the title from the manifest
-    try:
-        from plugin._manifest import MODULES
-        for m in MODULES:
-            if m["name"] == mod_name:
-                # The manifest doesn't store action titles directly in a map,
-                # but it might have an action list. If we don't have a specific title,
-                # we can translate the action name by capitalizing it as a fallback,
-                # or better, let the module define it. But for static menus,
-                # we can translate the static titles from the manifest if we had them.
-                # Since Addons.xcu has the static names, and notify_menu_update sets them,
-                # if we return None, LO uses the Addons.xcu name.
-                # To override Addons.xcu with translated static names, we need a map.
-                # For now, let's map known static actions directly here if mod didn't provide it.
-                pass
-    except ImportError:
-        pass
-
-    from plugin.framework.i18n import _
     # Hardcoded fallback for static Addons.xcu items so they get translated
     # without needing dynamic state in their respective modules.
     static_titles = {
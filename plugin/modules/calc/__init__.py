@@ -17,6 +17,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Calc module — tools for Calc spreadsheet manipulation."""
 
+import importlib
+
 from plugin.framework.errors import WriterAgentException
 from plugin.framework.module_base import ModuleBase
 
@@ -36,4 +38,10 @@ class CalcModule(ModuleBase):
 
         services.tools.auto_discover_package(__name__)
 
-from . import specialized
+
+def __getattr__(name):
+    # ``specialized`` is reached through auto_discover_package(); resolve it
+    # lazily so importing CalcError does not pull in the tool classes.
+    if name == "specialized":
+        return importlib.import_module(".specialized", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
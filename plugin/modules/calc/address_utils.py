@@ -23,6 +23,9 @@ core/calc_address_utils.py for the plugin framework.
 
 import re
 
+_CELL_ADDRESS_RE = re.compile(r'^([A-Z]+)(\d+)$')
+_CELL_RANGE_RE = re.compile(r'^([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?$')
+
 
 def column_to_index(col_str: str) -> int:
     """Convert column letter to 0-based index.
@@ -69,7 +72,7 @@ def parse_address(address: str) -> tuple[int, int]:
         ValueError: Invalid cell address.
     """
     address = address.strip().upper()
-    match = re.match(r'^([A-Z]+)(\d+)$', address)
+    match = _CELL_ADDRESS_RE.match(address)
     if not match:
         raise ValueError(f"Invalid cell address: '{address}'")
 
@@ -97,8 +100,7 @@ def parse_range_string(range_str: str) -> tuple[tuple[int, int], tuple[int, int]
     """
     range_str = range_str.strip().upper()
 
-    pattern = r'^([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?$'
-    match = re.match(pattern, range_str)
+    match = _CELL_RANGE_RE.match(range_str)
     if not match:
         raise ValueError(f"Invalid cell range format: '{range_str}'")
 
@@ -38,9 +38,60 @@ logger = logging.getLogger("writeragent.calc")
 
 _FORMULA_REF_RE = re.compile(r'\$?([A-Z]+)\$?(\d+)')
 
+# com.sun.star.sheet.CellFlags.FORMULA
+_CELL_FLAGS_FORMULA = 16
+
+# (result key, UNO property) pairs read by get_cell_details, in output order.
+_DETAIL_FIELDS = (
+    ("background_color", "CellBackColor"),
+    ("number_format", "NumberFormat"),
+    ("font_color", "CharColor"),
+    ("font_size", "CharHeight"),
+    ("bold", "CharWeight"),
+    ("italic", "CharPosture"),
+    ("h_align", "HoriJustify"),
+    ("v_align", "VertJustify"),
+    ("wrap_text", "IsTextWrapped"),
+)
+_DETAIL_PROPS = ("FormulaLocal",) + tuple(prop for _, prop in _DETAIL_FIELDS)
+
+
+def _type_key(cell_type):
+    """Hashable key for a cell content type (pyuno enums compare by ``value``)."""
+    return getattr(cell_type, "value", cell_type)
+
+
+def _formula_value(cell):
+    # One bridge call for the number; text results and zero fall back to getString().
+    value = cell.getValue()
+    return value if value != 0 else cell.getString()
+
+
+_TYPE_NAMES = {
+    _type_key(EMPTY): "empty",
+    _type_key(VALUE): "value",
+    _type_key(TEXT): "text",
+    _type_key(FORMULA): "formula",
+}
+
+_VALUE_EXTRACTORS = {
+    _type_key(EMPTY): lambda cell: None,
+    _type_key(VALUE): lambda cell: cell.getValue(),
+    _type_key(TEXT): lambda cell: cell.getString(),
+    _type_key(FORMULA): _formula_value,
+}
+
+
+def _cell_value(cell, cell_type):
+    extract = _VALUE_EXTRACTORS.get(_type_key(cell_type))
+    return extract(cell) if extract is not None else cell.getString()
+
+
 class CellInspector:
     """Examines cell contents and properties."""
 
+    __slots__ = ("bridge",)
+
     def __init__(self, bridge):
         """
         Args:
@@ -50,19 +101,6 @@ class CellInspector:
 
     # ── Internal helpers ───────────────────────────────────────────────
 
-    @staticmethod
-    def _cell_type_name(cell_type) -> str:
-        """Return a human-readable name for a UNO cell content type."""
-        if cell_type == EMPTY:
-            return "empty"
-        if cell_type == VALUE:
-            return "value"
-        if cell_type == TEXT:
-            return "text"
-        if cell_type == FORMULA:
-            return "formula"
-        return "unknown"
-
     @staticmethod
     def _safe_prop(cell, name, default=None):
         try:
@@ -71,12 +109,58 @@ class CellInspector:
             logger.debug("_safe_prop exception for %s: %s", name, e)
             return default
 
+    @classmethod
+    def _detail_props(cls, cell):
+        """Read ``_DETAIL_PROPS`` in one XMultiPropertySet call.
+
+        Falls back to per-property reads if the bulk call fails (e.g. an
+        unknown property), so one bad name does not blank the others.
+        """
+        try:
+            values = cell.getPropertyValues(_DETAIL_PROPS)
+            if len(values) == len(_DETAIL_PROPS):
+                return values
+        except Exception as e:
+            logger.debug("getPropertyValues failed, reading one by one: %s", e)
+        return [cls._safe_prop(cell, name) for name in _DETAIL_PROPS]
+
     def _get_cell(self, address: str):
         """Return the cell object for *address*."""
         col, row = parse_address(address)
         sheet = self.bridge.get_active_sheet()
         return self.bridge.get_cell(sheet, col, row)
 
+    def _collect_formulas(self, cell_range, addr, out: list) -> None:
+        """Append formula entries for one block, read with two bulk bridge calls."""
+        formula_array = cell_range.getFormulaArray()
+        data_array = cell_range.getDataArray()
+
+        index_to_column = self.bridge._index_to_column
+        col_letters = [index_to_column(c) for c in range(addr.StartColumn, addr.EndColumn + 1)]
+
+        for row_idx, (formula_row, data_row) in enumerate(zip(formula_array, data_array)):
+            for col_idx, formula in enumerate(formula_row):
+                if not formula.startswith("="):
+                    continue
+
+                cell_address = f"{col_letters[col_idx]}{addr.StartRow + row_idx + 1}"
+
+                # Numeric results come back as floats, text results as str.
+                # A zero result shows its formatted string, as getString() did.
+                value = data_row[col_idx]
+                if value == 0:
+                    value = cell_range.getCellByPosition(col_idx, row_idx).getString()
+
+                refs = _FORMULA_REF_RE.findall(formula.upper())
+                precedents = list({f"{c}{r}" for c, r in refs})
+
+                out.append({
+                    "address": cell_address,
+                    "formula": formula,
+                    "value": value,
+                    "precedents": precedents,
+                })
+
     # ── Public API ─────────────────────────────────────────────────────
 
     def read_cell(self, address: str) -> dict:
@@ -92,24 +176,15 @@ class CellInspector:
             cell = self._get_cell(address)
             cell_type = cell.getType()
 
-            if cell_type == EMPTY:
-                value = None
-            elif cell_type == VALUE:
-                value = cell.getValue()
-            elif cell_type == TEXT:
-                value = cell.getString()
-            elif cell_type == FORMULA:
-                value = cell.getValue() if cell.getValue() != 0 else cell.getString()
-            else:
-                value = cell.getString()
+            value = _cell_value(cell, cell_type)
 
             formula = cell.getFormula() if cell_type == FORMULA else None
 
             return {
-                "address": address.upper(),
+                "address": address if address.isupper() else address.upper(),
                 "value": value,
                 "formula": formula,
-                "type": self._cell_type_name(cell_type),
+                "type": _TYPE_NAMES.get(_type_key(cell_type), "unknown"),
             }
         except Exception as e:
             logger.error("Cell reading error (%s): %s", address, str(e))
@@ -130,33 +205,18 @@ class CellInspector:
             cell = self._get_cell(address)
             cell_type = cell.getType()
 
-            if cell_type == EMPTY:
-                value = None
-            elif cell_type == VALUE:
-                value = cell.getValue()
-            elif cell_type == TEXT:
-                value = cell.getString()
-            elif cell_type == FORMULA:
-                value = cell.getValue() if cell.getValue() != 0 else cell.getString()
-            else:
-                value = cell.getString()
+            value = _cell_value(cell, cell_type)
+            formula_local, *props = self._detail_props(cell)
 
-            return {
-                "address": address.upper(),
+            details = {
+                "address": address if address.isupper() else address.upper(),
                 "value": value,
                 "formula": cell.getFormula(),
-                "formula_local": self._safe_prop(cell, "FormulaLocal"),
-                "type": self._cell_type_name(cell_type),
-                "background_color": self._safe_prop(cell, "CellBackColor"),
-                "number_format": self._safe_prop(cell, "NumberFormat"),
-                "font_color": self._safe_prop(cell, "CharColor"),
-                "font_size": self._safe_prop(cell, "CharHeight"),
-                "bold": self._safe_prop(cell, "CharWeight"),
-                "italic": self._safe_prop(cell, "CharPosture"),
-                "h_align": self._safe_prop(cell, "HoriJustify"),
-                "v_align": self._safe_prop(cell, "VertJustify"),
-                "wrap_text": self._safe_prop(cell, "IsTextWrapped"),
+                "formula_local": formula_local,
+                "type": _TYPE_NAMES.get(_type_key(cell_type), "unknown"),
             }
+            details.update(zip((key for key, _ in _DETAIL_FIELDS), props))
+            return details
         except Exception as e:
             logger.error("Cell detailed reading error (%s): %s", address, str(e))
             raise ToolExecutionError(str(e)) from e
@@ -184,50 +244,57 @@ class CellInspector:
             data_array = cell_range.getDataArray()
             formula_array = cell_range.getFormulaArray()
 
-            result = []
-            for row_idx, row in enumerate(range(addr.StartRow, addr.EndRow + 1)):
-                row_data = []
-                for col_idx, col in enumerate(range(addr.StartColumn, addr.EndColumn + 1)):
-                    # Extract raw data and formula strings from batch fetched arrays
-                    raw_val = data_array[row_idx][col_idx]
-                    raw_formula = formula_array[row_idx][col_idx]
+            index_to_column = self.bridge._index_to_column
+            col_letters = [index_to_column(c) for c in range(addr.StartColumn, addr.EndColumn + 1)]
+
+            width = len(col_letters)
+            height = addr.EndRow - addr.StartRow + 1
+            result: list = [None] * height
+            for row_idx in range(height):
+                row_number = addr.StartRow + row_idx + 1
+                # Extract raw data and formula strings from batch fetched arrays
+                data_row = data_array[row_idx]
+                formula_row = formula_array[row_idx]
+                row_data: list = [None] * width
+                for col_idx in range(width):
+                    raw_val = data_row[col_idx]
+                    raw_formula = formula_row[col_idx]
 
                     value = raw_val
                     formula = None
 
                     if raw_formula and raw_formula.startswith("="):
-                        cell_type = FORMULA
+                        type_name = "formula"
                         formula = raw_formula
                         # Keep value as raw_val which already contains the evaluated formula result
                     elif isinstance(raw_val, float):
-                        cell_type = VALUE
+                        type_name = "value"
                     elif isinstance(raw_val, str) and raw_val:
-                        cell_type = TEXT
+                        type_name = "text"
                     else:
-                        cell_type = EMPTY
+                        type_name = "empty"
                         value = None
 
-                    col_letter = self.bridge._index_to_column(col)
-                    cell_address = f"{col_letter}{row + 1}"
-
-                    row_data.append({
-                        "address": cell_address,
+                    row_data[col_idx] = {
+                        "address": f"{col_letters[col_idx]}{row_number}",
                         "value": value,
                         "formula": formula,
-                        "type": self._cell_type_name(cell_type),
-                    })
-                result.append(row_data)
+                        "type": type_name,
+                    }
+                result[row_idx] = row_data
 
             return result
         except Exception as e:
             logger.error("Range reading error (%s): %s", range_name, str(e))
             raise ToolExecutionError(str(e)) from e
 
-    def get_all_formulas(self, sheet_name: str | None = None) -> list[dict]:
+    def get_all_formulas(self, sheet_name: str | None = None, range_hint: str | None = None) -> list[dict]:
         """List all formulas in a sheet.
 
         Args:
             sheet_name: Sheet name (active sheet if None).
+            range_hint: Optional range (e.g. "A1:D100") to search instead of
+                the whole sheet.
 
         Returns:
             List of dicts with keys: address, formula, value, precedents.
@@ -240,43 +307,18 @@ class CellInspector:
             else:
                 sheet = self.bridge.get_active_sheet()
 
-            cursor = sheet.createCursor()
-            cursor.gotoStartOfUsedArea(False)
-            cursor.gotoEndOfUsedArea(True)
+            # queryContentCells returns only the blocks that hold formulas, so
+            # empty and constant cells of a sparse sheet are never fetched.
+            scope = self.bridge.get_cell_range(sheet, range_hint) if range_hint else sheet
+            blocks = scope.queryContentCells(_CELL_FLAGS_FORMULA)
 
-            addr = cursor.getRangeAddress()
             formulas = []
-
-            cell_range = sheet.getCellRangeByPosition(
-                addr.StartColumn, addr.StartRow, addr.EndColumn, addr.EndRow
-            )
-            # Result 7 means value, datetime, string. Here we query cells with formulas.
-            # Using queryFormulaCells with 23 (1|2|4|16) to get all formula cells, or actually just 23 for all formula results
-            formula_cells = cell_range.queryFormulaCells(23)
-
-            if formula_cells:
-                cells_collection = formula_cells.getCells()
-                if cells_collection:
-                    enum = cells_collection.createEnumeration()
-                    while enum.hasMoreElements():
-                        cell = enum.nextElement()
-                        cell_addr = cell.getCellAddress()
-
-                        col_letter = self.bridge._index_to_column(cell_addr.Column)
-                        cell_address = f"{col_letter}{cell_addr.Row + 1}"
-
-                        formula = cell.getFormula()
-                        value = cell.getValue() if cell.getValue() != 0 else cell.getString()
-
-                        refs = _FORMULA_REF_RE.findall(formula.upper())
-                        precedents = list({f"{c}{r}" for c, r in refs})
-
-                        formulas.append({
-                            "address": cell_address,
-                            "formula": formula,
-                            "value": value,
-                            "precedents": precedents,
-                        })
+            if blocks:
+                for addr in blocks.getRangeAddresses():
+                    cell_range = sheet.getCellRangeByPosition(
+                        addr.StartColumn, addr.StartRow, addr.EndColumn, addr.EndRow
+                    )
+                    self._collect_formulas(cell_range, addr, formulas)
 
             return formulas
         except Exception as e:
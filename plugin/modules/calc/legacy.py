@@ -17,11 +17,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Legacy operations for Calc (Extend/Edit Selection)."""
 from plugin.framework.config import (
-    get_config, get_config_int, get_config_str, get_api_config, validate_api_config
+    get_config_int, get_config_str, get_api_config, validate_api_config
 )
-from plugin.modules.http.errors import format_error_message
-from plugin.modules.http.client import LlmClient
-from plugin.framework.async_stream import run_stream_completion_async
 from plugin.framework.dialogs import msgbox
 from plugin.framework.i18n import _
 
@@ -76,6 +73,12 @@ def do_calc_extend_edit(ctx, model, input_box_fn, is_edit):
         msgbox(ctx, title, _(err_msg))
         return
 
+    # The LLM client and streaming helpers are only needed once the user runs
+    # the command; the Calc package is imported at startup for tool discovery.
+    from plugin.modules.http.client import LlmClient
+    from plugin.modules.http.errors import format_error_message
+    from plugin.framework.async_stream import run_stream_completion_async
+
     client = LlmClient(api_config, ctx)
     task_index = [0]
 
@@ -124,17 +124,12 @@ class DelegateToSpecializedCalc(ToolBase):
             # Gather tools for the requested domain
             registry = ctx.services.get("tools")
 
-            # Add the control tool
-            all_tools = registry.get_tools(
-                filter_doc_type=False,
-                exclude_tiers=(),
-            )
-
-            domain_tools = []
-            for t in all_tools:
-                # Check if it's a subclass of our special base and matches the domain
-                if isinstance(t, ToolCalcSpecialBase) and t.specialized_domain == domain:
-                    domain_tools.append(t)
+            # The registry indexes tools by specialized_domain; keep the ones
+            # that are subclasses of our special base.
+            domain_tools = [
+                t for t in registry.get_domain_tools(domain)
+                if isinstance(t, ToolCalcSpecialBase)
+            ]
 
             if not domain_tools:
                 return self._tool_error(
@@ -63,10 +63,8 @@ from plugin.framework.dialogs import (
     set_control_visible
 )
 from plugin.framework.uno_context import get_active_document, get_extension_url, get_extension_path
-from plugin.framework.document import is_writer, is_calc, is_draw
 from plugin.modules.chatbot.panel_wiring import _wireControls as wire_chatpanel_controls
 
-import typing
 from com.sun.star.ui import XUIElementFactory, XUIElement, XToolPanel, XSidebarPanel
 try:
     from com.sun.star.ui.UIElementType import TOOLPANEL  # type: ignore
@@ -74,7 +72,6 @@ except ImportError:
     TOOLPANEL = 3  # Fallback
 
 from plugin.framework.listeners import BaseItemListener
-from com.sun.star.awt import XItemListener
 
 log = logging.getLogger(__name__)
 
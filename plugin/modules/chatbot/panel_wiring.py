@@ -1,10 +1,8 @@
-import weakref
 import logging
 
 from plugin.framework.dialogs import (
     get_optional as get_optional_control,
     get_checkbox_state,
-    set_control_enabled,
     get_control_text,
     set_control_text
 )
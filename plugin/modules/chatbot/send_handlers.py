@@ -84,8 +84,6 @@ from plugin.framework.errors import safe_json_loads
 from plugin.modules.chatbot.state_machine import (
     SendHandlerState, StartEvent, StreamChunkEvent, StreamDoneEvent,
     ErrorEvent, StopRequestedEvent, next_state, EffectInterpreter,
-    SpawnAudioWorkerEffect, SpawnDirectImageEffect, SpawnAgentWorkerEffect,
-    SpawnWebWorkerEffect, ProceedToChatEffect
 )
 
 log = logging.getLogger(__name__)
@@ -3,7 +3,7 @@
 import time
 import dataclasses
 from dataclasses import dataclass
-from typing import List, Any, Dict, Optional, NamedTuple
+from typing import List, Any, Optional, NamedTuple
 from plugin.modules.http.errors import format_error_for_display
 from plugin.framework.state import BaseState, FsmTransition
 from plugin.framework.types import (
@@ -11,7 +11,7 @@ import inspect
 import dataclasses
 import json
 import queue
-from typing import TYPE_CHECKING, Protocol, Any, Callable, TypeVar, Sequence, cast
+from typing import TYPE_CHECKING, Protocol, Any, Callable, Sequence, cast
 
 if TYPE_CHECKING:
     import threading
@@ -46,12 +46,10 @@ from plugin.framework.constants import get_chat_system_prompt_for_document
 from plugin.framework.document import get_document_context_for_chat
 from plugin.framework.errors import (
     format_error_payload,
-    safe_json_loads,
-    WriterAgentException,
+    json_dumps_compact,
     ToolExecutionError,
     UnoObjectError,
     NetworkError,
-    ConfigError
 )
 from plugin.modules.http.client import LlmClient
 from plugin.framework.config import as_bool
@@ -68,6 +66,9 @@ from plugin.modules.chatbot.tool_loop_state import (
 
 log = logging.getLogger(__name__)
 
+# Used when the tool registry cannot be reached.
+_DEFAULT_ASYNC_TOOLS = frozenset({"web_research", "generate_image"})
+
 # DEFAULT_MAX_TOOL_ROUNDS removed; now managed by WriterAgentConfig.chat_max_tool_rounds
 
 class ToolLoopHost(Protocol):
@@ -116,6 +117,7 @@ class ToolLoopHost(Protocol):
     def _handle_stream_stopped(self) -> None: ...
     def _handle_stream_error(self, e: Any) -> None: ...
     def _on_tool_loop_approval_required(self, item: Any) -> None: ...
+    def _put_tool_status(self, msg: str) -> None: ...
     def _execute_effect(self, effect: Any) -> bool: ...
     def _do_send_chat_with_tools(self, query_text: str, model: Any, doc_type_str: str) -> None: ...
     def _is_400_input_validation(self, err: Any) -> bool: ...
@@ -167,7 +169,11 @@ class ToolCallingMixin:
         try:
             log.debug("_do_send: loading %s schema..." % doc_type_str)
             active_domain = getattr(self.session, "active_specialized_domain", None) if hasattr(self, "session") else None
-            active_tools = get_tools().get_schemas("openai", doc=model, active_domain=active_domain)
+            active_tools = get_tools().get_schemas("openai", doc=model, active_domain=active_domain, compact=True)
+            # (key, ToolContext) of the last plain tool call. Tools only read
+            # their context, so consecutive calls with the same doc and
+            # callbacks share one instead of building a new one each time.
+            last_tctx: list[Any] = [None, None]
 
             def execute_fn(
                 name,
@@ -239,24 +245,30 @@ class ToolCallingMixin:
                     except Exception as ex:
                         log.warning("tool_loop: web_research approval setup failed: %s", ex)
 
-                tctx = ToolContext(
-                    doc=doc,
-                    ctx=ctx,
-                    doc_type=doc_type_str,
-                    services=_get_tools()._services,
-                    caller="chat",
-                    status_callback=status_callback,
-                    append_thinking_callback=append_thinking_callback,
-                    stop_checker=stop_checker,
-                    approval_callback=approval_cb,
-                    chat_append_callback=chat_append_cb
-                    if name == "web_research"
-                    else None,
-                    set_active_domain_callback=set_active_domain,
-                )
+                tools_registry = _get_tools()
+                key = (doc, ctx, status_callback, append_thinking_callback, stop_checker)
+                if name != "web_research" and last_tctx[0] == key:
+                    tctx = last_tctx[1]
+                else:
+                    tctx = ToolContext(
+                        doc=doc,
+                        ctx=ctx,
+                        doc_type=doc_type_str,
+                        services=tools_registry._services,
+                        caller="chat",
+                        status_callback=status_callback,
+                        append_thinking_callback=append_thinking_callback,
+                        stop_checker=stop_checker,
+                        approval_callback=approval_cb,
+                        chat_append_callback=chat_append_cb,
+                        set_active_domain_callback=set_active_domain,
+                    )
+                    if name != "web_research":
+                        last_tctx[:] = (key, tctx)
                 try:
-                    res = _get_tools().execute(name, tctx, **args)
-                    return json.dumps(res) if isinstance(res, dict) else str(res)
+                    res = tools_registry.execute(name, tctx, **args)
+                    # Compact, with non-ASCII document text unescaped (smaller payload).
+                    return json_dumps_compact(res) if isinstance(res, dict) else str(res)
                 except (ToolExecutionError, UnoObjectError) as e:
                     import traceback
                     tb = traceback.format_exc()
@@ -551,9 +563,7 @@ class ToolCallingMixin:
             if ln > 4:
                 try:
                     from plugin.main import get_tools as _get_tools_registry
-                    tool = _get_tools_registry().get(s[2])
-                    if tool and tool.detects_mutation():
-                        mutates = True
+                    mutates = _get_tools_registry().is_mutation(s[2])
                 except Exception as e:
                     try:
                         from com.sun.star.lang import DisposedException
@@ -578,6 +588,9 @@ class ToolCallingMixin:
             return ToolLoopEvent(kind=EventKind.ERROR, data={"error": data})
         return None
 
+    def _put_tool_status(self: ToolLoopHost, msg: str) -> None:
+        self._active_q.put((StreamQueueKind.STATUS, msg))
+
     def _execute_effect(self: ToolLoopHost, effect: Any) -> bool:
         """Execute a single pure effect returned by the state machine."""
         if isinstance(effect, ExitLoopEffect):
@@ -667,9 +680,6 @@ class ToolCallingMixin:
             if image_model_override and func_name == "generate_image":
                 func_args["image_model"] = image_model_override
 
-            def tool_status_callback(msg):
-                self._active_q.put((StreamQueueKind.STATUS, msg))
-
             if effect.is_async:
                 def run_async():
                     try:
@@ -682,7 +692,7 @@ class ToolCallingMixin:
                                 func_args,
                                 self._active_model,
                                 self.ctx,
-                                status_callback=tool_status_callback,
+                                status_callback=self._put_tool_status,
                                 append_thinking_callback=tool_thinking_callback,
                                 stop_checker=lambda: self.stop_requested,
                             )
@@ -709,7 +719,7 @@ class ToolCallingMixin:
                             func_args,
                             self._active_model,
                             self.ctx,
-                            status_callback=tool_status_callback,
+                            status_callback=self._put_tool_status,
                         )
                     else:
                         res = self._active_execute_tool_fn(
@@ -851,14 +861,10 @@ class ToolCallingMixin:
 
         try:
             from plugin.main import get_tools as _get_tools_registry
-            registry = _get_tools_registry()
-            async_tools = frozenset([
-                tool.name for tool in registry.get_tools(filter_doc_type=False, exclude_tiers=())
-                if getattr(tool, "is_async", lambda: False)()
-            ])
+            async_tools = _get_tools_registry().async_tool_names()
         except Exception as e:
             log.debug("Failed to get async tools list, falling back to defaults: %s", e)
-            async_tools = frozenset({"web_research", "generate_image"})
+            async_tools = _DEFAULT_ASYNC_TOOLS
 
         self._sm_state = ToolLoopState(
             round_num=0,
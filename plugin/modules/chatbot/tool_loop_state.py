@@ -1,6 +1,6 @@
 import dataclasses
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, NamedTuple
+from typing import Any, Dict, List, Optional, NamedTuple
 
 from plugin.framework.state import BaseState, FsmTransition
 from plugin.framework.types import UIEffectKind
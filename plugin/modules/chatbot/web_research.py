@@ -14,9 +14,17 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import functools
 import logging
-
-from plugin.framework.tool_base import ToolBase
+import os
+import re
+import types
+from typing import Iterable, cast
+
+from plugin.framework.errors import NetworkError, ToolExecutionError, format_error_payload, safe_json_loads
+from plugin.framework.i18n import _
+from plugin.framework.utils import get_url_domain
+from plugin.modules.chatbot.web_research_chat import web_search_engine_step_chat_text
 from plugin.modules.writer.base import ToolWriterWebResearchBase
 from plugin.modules.calc.base import ToolCalcWebResearchBase
 from plugin.modules.draw.base import ToolDrawWebResearchBase
@@ -29,7 +37,6 @@ def _web_search_query_from_arguments(arguments) -> str:
     if isinstance(arguments, dict):
         return str(arguments.get("query", "") or "")
     if isinstance(arguments, str):
-        from plugin.framework.errors import safe_json_loads
         parsed = safe_json_loads(arguments)
         if isinstance(parsed, dict):
             return str(parsed.get("query", "") or "")
@@ -44,7 +51,6 @@ def _apply_web_search_query_override(step, query_override: str) -> bool:
         new_args = args
     elif isinstance(args, str):
         coercion = True
-        from plugin.framework.errors import safe_json_loads
         parsed = safe_json_loads(args)
         new_args = parsed if isinstance(parsed, dict) else {"query": query_override}
     else:
@@ -57,11 +63,38 @@ def _apply_web_search_query_override(step, query_override: str) -> bool:
 
 def _norm_research_query(s: str) -> str:
     """Normalize for comparing outer research request to first DDG ``web_search`` query."""
-    import re
-
     return re.sub(r"\s+", " ", (s or "").strip()).casefold()
 
 
+@functools.cache
+def _agent_deps():
+    """Import the sub-agent stack once, on the first web_research call.
+
+    The tool is discovered at startup but rarely run, so the LLM client and
+    smolagents stay unloaded until needed.
+    """
+    from plugin.modules.http.client import LlmClient
+    from plugin.framework.smol_model import WriterAgentSmolModel
+    from plugin.contrib.smolagents.agents import ToolCallingAgent
+    from plugin.contrib.smolagents.default_tools import DuckDuckGoSearchTool, VisitWebpageTool, VisitWebpagesTool
+    from plugin.contrib.smolagents.memory import ActionStep, FinalAnswerStep, ToolCall
+
+    return types.SimpleNamespace(
+        LlmClient=LlmClient,
+        WriterAgentSmolModel=WriterAgentSmolModel,
+        ToolCallingAgent=ToolCallingAgent,
+        DuckDuckGoSearchTool=DuckDuckGoSearchTool,
+        VisitWebpageTool=VisitWebpageTool,
+        VisitWebpagesTool=VisitWebpagesTool,
+        ActionStep=ActionStep,
+        FinalAnswerStep=FinalAnswerStep,
+        ToolCall=ToolCall,
+        # Exact-type dispatch for the step loop; stream deltas and other
+        # step types miss with a single dict lookup.
+        step_kinds={ToolCall: "tool_call", ActionStep: "action", FinalAnswerStep: "final"},
+    )
+
+
 # Use multiple inheritance so the domain is auto-discovered by the sub-agent delegates.
 class WebResearchTool(ToolWriterWebResearchBase, ToolCalcWebResearchBase, ToolDrawWebResearchBase):  # type: ignore[misc]
     name = "web_research"
@@ -91,17 +124,13 @@ class WebResearchTool(ToolWriterWebResearchBase, ToolCalcWebResearchBase, ToolDr
     def execute(self, ctx, **kwargs):
         query = kwargs.get("query")
         history_text = kwargs.get("history_text")
-        from plugin.framework.errors import format_error_payload, ToolExecutionError
-        import os
-        from plugin.framework.utils import get_url_domain
+
+        # Config helpers are looked up per call so they can be patched on
+        # plugin.framework.config; the heavy agent stack is cached.
+        from plugin.framework.config import as_bool, get_api_config, get_config, get_config_int, user_config_dir
 
         try:
-            from plugin.framework.config import get_api_config, get_config_int, user_config_dir
-            from plugin.modules.http.client import LlmClient
-            from plugin.framework.smol_model import WriterAgentSmolModel
-            from plugin.contrib.smolagents.agents import ToolCallingAgent
-            from plugin.contrib.smolagents.default_tools import DuckDuckGoSearchTool, VisitWebpageTool
-            from plugin.contrib.smolagents.memory import ActionStep, FinalAnswerStep, ToolCall
+            deps = _agent_deps()
         except (ImportError, ValueError, TypeError) as e:
             return format_error_payload(ToolExecutionError(f"Failed to load required dependencies: {e}"))
 
@@ -122,7 +151,6 @@ class WebResearchTool(ToolWriterWebResearchBase, ToolCalcWebResearchBase, ToolDr
 
             config = get_api_config(ctx.ctx)
             max_tokens = int(config.get("chat_max_tokens", 2048))
-            from plugin.framework.config import get_config_int
             max_steps = get_config_int(ctx.ctx, "chat_max_tool_rounds")
 
             udir = user_config_dir(ctx.ctx)
@@ -131,16 +159,17 @@ class WebResearchTool(ToolWriterWebResearchBase, ToolCalcWebResearchBase, ToolDr
             cache_max_age_days = get_config_int(ctx.ctx, "web_cache_validity_days")
             cache_path = os.path.join(udir, "localwriter_web_cache.db") if (udir and cache_max_mb > 0) else None
 
-            smol_model = WriterAgentSmolModel(
-                LlmClient(config, ctx.ctx), max_tokens=max_tokens,
+            smol_model = deps.WriterAgentSmolModel(
+                deps.LlmClient(config, ctx.ctx), max_tokens=max_tokens,
                 status_callback=status_callback,
             )
 
             instructions = "You are a research assistant. Use the conversation context provided below to resolve any ambiguity in the user's query."
-            agent = ToolCallingAgent(
+            agent = deps.ToolCallingAgent(
                 tools=[
-                    DuckDuckGoSearchTool(cache_path=cache_path, cache_max_mb=cache_max_mb, cache_max_age_days=cache_max_age_days),
-                    VisitWebpageTool(cache_path=cache_path, cache_max_mb=cache_max_mb, cache_max_age_days=cache_max_age_days),
+                    deps.DuckDuckGoSearchTool(cache_path=cache_path, cache_max_mb=cache_max_mb, cache_max_age_days=cache_max_age_days),
+                    deps.VisitWebpageTool(cache_path=cache_path, cache_max_mb=cache_max_mb, cache_max_age_days=cache_max_age_days),
+                    deps.VisitWebpagesTool(cache_path=cache_path, cache_max_mb=cache_max_mb, cache_max_age_days=cache_max_age_days),
                 ],
                 model=smol_model,
                 max_steps=max_steps,
@@ -153,7 +182,6 @@ class WebResearchTool(ToolWriterWebResearchBase, ToolCalcWebResearchBase, ToolDr
 
             prompt_for_web_research = False
             try:
-                from plugin.framework.config import get_config, as_bool
                 prompt_for_web_research = as_bool(
                     get_config(ctx.ctx, "chatbot.prompt_for_web_research")
                 )
@@ -167,12 +195,15 @@ class WebResearchTool(ToolWriterWebResearchBase, ToolCalcWebResearchBase, ToolDr
             )
 
             web_search_step_index = 0
-            from typing import Iterable, cast
+            step_kinds = deps.step_kinds
             run_stream = cast(Iterable, agent.run(task, stream=True))
             for step in run_stream:
                 if stop_checker and stop_checker():
                     return format_error_payload(ToolExecutionError("Web search stopped by user.", code="USER_STOPPED"))
-                if isinstance(step, ToolCall):
+                kind = step_kinds.get(type(step))
+                if kind is None:
+                    continue
+                if kind == "tool_call":
                     status_msg = ""
                     if step.name == "web_search":
                         q = _web_search_query_from_arguments(step.arguments)
@@ -180,10 +211,6 @@ class WebResearchTool(ToolWriterWebResearchBase, ToolCalcWebResearchBase, ToolDr
                         if append_thinking_callback:
                             append_thinking_callback(f"Running tool: {step.name} with {{'query': '{q}'}}\n")
 
-                        from plugin.modules.chatbot.web_research_chat import (
-                            web_search_engine_step_chat_text,
-                        )
-
                         if prompt_for_web_research and approval_callback:
                             log.info(
                                 "web_research: requesting approval for web_search query=%r",
@@ -268,6 +295,14 @@ class WebResearchTool(ToolWriterWebResearchBase, ToolCalcWebResearchBase, ToolDr
 
                         domain = get_url_domain(url)
                         status_msg = f"Read: {domain}"
+                    elif step.name == "visit_webpages":
+                        urls = step.arguments.get("urls", []) if isinstance(step.arguments, dict) else []
+                        urls = urls if isinstance(urls, list) else []
+
+                        if append_thinking_callback:
+                            append_thinking_callback(f"Running tool: {step.name} with {{'urls': {urls}}}\n")
+
+                        status_msg = "Read: " + ", ".join(get_url_domain(str(u)) for u in urls[:3])
                     else:
                         if append_thinking_callback:
                             append_thinking_callback(f"Running tool: {step.name} with {step.arguments}\n")
@@ -276,7 +311,7 @@ class WebResearchTool(ToolWriterWebResearchBase, ToolCalcWebResearchBase, ToolDr
                     if status_callback and status_msg:
                         status_callback(f"{status_msg}...")
 
-                elif isinstance(step, ActionStep):
+                elif kind == "action":
                     if append_thinking_callback:
                         msg = f"Step {step.step_number}:\n"
                         if step.model_output:
@@ -292,18 +327,15 @@ class WebResearchTool(ToolWriterWebResearchBase, ToolCalcWebResearchBase, ToolDr
                             msg += f"Observation: {str(step.observations).strip()}\n"
 
                         append_thinking_callback(msg + "\n")
-                elif isinstance(step, FinalAnswerStep):
+                else:
                     final_ans = step.output
 
-            from plugin.framework.i18n import _
-
             return {
                 "status": "ok",
                 "message": _("Web research completed."),
                 "result": str(final_ans),
             }
         except Exception as e:
-            from plugin.framework.errors import NetworkError
             if isinstance(e, NetworkError):
                 log.error("Web search NetworkError: %s", e)
             else:
@@ -7,8 +7,7 @@
 
 import logging
 
-from plugin.framework.tool_base import ToolBase, ToolBaseDummy
-from plugin.framework.types import ToolResult, ToolError
+from plugin.framework.tool_base import ToolBaseDummy
 
 log = logging.getLogger("nelson.common")
 
@@ -16,10 +16,10 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Draw module — tools for Draw/Impress document manipulation."""
 
+import importlib
+
 from plugin.framework.module_base import ModuleBase
 
-# Import submodules to ensure tools are registered via auto_discover_package
-from plugin.modules.draw import specialized
 
 class DrawModule(ModuleBase):
     """Registers Draw/Impress tools for shapes, pages/slides."""
@@ -28,3 +28,11 @@ class DrawModule(ModuleBase):
         self.services = services
 
         services.tools.auto_discover_package(__name__)
+
+
+def __getattr__(name):
+    # auto_discover_package() imports every submodule, ``specialized``
+    # included; only resolve it here when accessed as an attribute.
+    if name == "specialized":
+        return importlib.import_module(".specialized", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
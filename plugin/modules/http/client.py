@@ -309,7 +309,8 @@ class LlmClient:
             data["tool_choice"] = "auto"
             data["parallel_tool_calls"] = False
 
-        json_data = json.dumps(data).encode("utf-8")
+        # No padding after separators: the tool schemas alone are tens of KB.
+        json_data = json.dumps(data, separators=(",", ":")).encode("utf-8")
         init_logging(self.ctx)
         log.debug(
             "=== Chat Request (tools=%s, stream=%s) ===" % (bool(tools), stream)
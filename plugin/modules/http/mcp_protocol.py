@@ -588,13 +588,7 @@ class MCPProtocolHandler:
             }
 
         from plugin.framework.tool_context import ToolContext
-        context = ToolContext(
-            doc=doc,
-            ctx=ctx,
-            doc_type=doc_type,
-            services=self.services,
-            caller="mcp",
-        )
+        context = ToolContext.from_defaults(doc, ctx, doc_type, self.services, "mcp")
 
         t0 = time.perf_counter()
         result = self.tool_registry.execute(tool_name, context, **arguments)
@@ -644,13 +638,7 @@ class MCPProtocolHandler:
             pass
 
         from plugin.framework.tool_context import ToolContext
-        context = ToolContext(
-            doc=doc,
-            ctx=ctx,
-            doc_type=doc_type,
-            services=self.services,
-            caller="mcp",
-        )
+        context = ToolContext.from_defaults(doc, ctx, doc_type, self.services, "mcp")
 
         t0 = time.perf_counter()
         result = self.tool_registry.execute(tool_name, context, **arguments)
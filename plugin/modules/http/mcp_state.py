@@ -3,7 +3,6 @@ from enum import Enum, auto
 from typing import Any, Dict, List, Optional
 
 from plugin.framework.state import BaseState, FsmTransition
-from plugin.framework.types import ToolResult, ToolError
 
 # --- States ---
 class MCPStateStr(Enum):
@@ -24,7 +24,6 @@ Route handlers are looked up from an HttpRouteRegistry instance.
 import json
 import logging
 import socketserver
-import threading
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Any, cast
 from plugin.framework.utils import get_url_path, get_url_query_dict
@@ -136,9 +136,13 @@ class GetDocumentContent(ToolBase):
 # ApplyDocumentContent
 # ------------------------------------------------------------------
 
-# ------------------------------------------------------------------
-# ApplyDocumentContent
-# ------------------------------------------------------------------
+# Positional insert targets -> success message (single dict lookup per call).
+_INSERT_TARGET_MESSAGES = {
+    "beginning": "Inserted content at beginning.",
+    "end": "Inserted content at end.",
+    "selection": "Inserted content at selection.",
+}
+
 
 class ApplyDocumentContent(ToolBase):
     """Insert or replace content in the document.
@@ -257,15 +261,12 @@ class ApplyDocumentContent(ToolBase):
         if target == "full_document":
             format_support.replace_full_document(ctx.doc, ctx.ctx, content, config_svc=config_svc)
             return {"status": "ok", "message": "Replaced entire document."}
-        if target == "end":
-            format_support.insert_content_at_position(ctx.doc, ctx.ctx, content, "end", config_svc=config_svc)
-            return {"status": "ok", "message": "Inserted content at end."}
-        if target == "selection":
-            format_support.insert_content_at_position(ctx.doc, ctx.ctx, content, "selection", config_svc=config_svc)
-            return {"status": "ok", "message": "Inserted content at selection."}
-        if target == "beginning":
-            format_support.insert_content_at_position(ctx.doc, ctx.ctx, content, "beginning", config_svc=config_svc)
-            return {"status": "ok", "message": "Inserted content at beginning."}
+        insert_message = _INSERT_TARGET_MESSAGES.get(target)
+        if insert_message is not None:
+            format_support.insert_content_at_position(ctx.doc, ctx.ctx, content, target, config_svc=config_svc)
+            return {"status": "ok", "message": insert_message}
+        if target != "search":
+            return self._tool_error("Unknown target: %s" % target)
 
         # target == "search" from here on
         old_stripped = str(old_content).strip()
@@ -488,41 +489,37 @@ class GetDocumentStats(ToolBase):
         doc = ctx.doc
         doc_svc = ctx.services.document
 
-        # Character and word count via full text.
+        # Character and word count from Writer's own document statistics
+        # (as in Tools > Word Count), so the text never crosses the bridge.
         try:
-            text_obj = doc.getText()
-            cursor = text_obj.createTextCursor()
-            cursor.gotoStart(False)
-            cursor.gotoEnd(True)
-            full_text = cursor.getString()
-            char_count = len(full_text)
-            word_count = len(full_text.split())
+            char_count = doc.getPropertyValue("CharacterCount")
+            word_count = doc.getPropertyValue("WordCount")
         except Exception:
-            char_count = doc_svc.get_document_length(doc)
-            word_count = 0
-
-        # Paragraph count.
+            # Fall back to counting the full text.
+            try:
+                text_obj = doc.getText()
+                cursor = text_obj.createTextCursor()
+                cursor.gotoStart(False)
+                cursor.gotoEnd(True)
+                full_text = cursor.getString()
+                char_count = len(full_text)
+                word_count = len(full_text.split())
+            except Exception:
+                char_count = doc_svc.get_document_length(doc)
+                word_count = 0
+
+        # Paragraph and heading counts from one enumeration; writer_tree
+        # caches the tree, so outline/navigation calls that follow reuse it.
         try:
-            para_ranges = doc_svc.get_paragraph_ranges(doc)
-            para_count = len(para_ranges)
+            tree = ctx.services.writer_tree.build_heading_tree(doc)
+            para_count = tree["total_paragraphs"]
+            heading_count = _count_headings(tree["children"])
         except Exception:
             para_count = 0
-
-        # Heading count from tree.
-        try:
-            tree = doc_svc.build_heading_tree(doc)
-            heading_count = _count_headings(tree)
-        except Exception:
             heading_count = 0
 
-        # Page count (approximate via view cursor).
-        page_count = 0
-        try:
-            vc = doc.getCurrentController().getViewCursor()
-            vc.jumpToLastPage()
-            page_count = vc.getPage()
-        except Exception:
-            pass
+        # Page count (view cursor is restored afterwards).
+        page_count = doc_svc.get_page_count(doc)
 
         return {
             "status": "ok",
@@ -535,9 +532,11 @@ class GetDocumentStats(ToolBase):
 
 
 def _count_headings(nodes):
-    """Recursively count heading nodes in a nested list."""
+    """Count heading nodes in a nested list (iterative, no recursion limit)."""
     count = 0
-    for node in nodes:
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
         count += 1
-        count += _count_headings(node.get("children", []))
+        stack.extend(node.get("children", ()))
     return count
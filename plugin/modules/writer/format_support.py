@@ -271,27 +271,41 @@ def _range_to_content_via_temp_doc(model, ctx, start, end, max_chars, config_svc
         enum = text.createEnumeration()
         first_para = True
         added_any = False
+        # Exported HTML is never shorter than its plain text, so once the
+        # copied text reaches max_chars the tail cannot survive truncation.
+        copied_chars = 0
+        # Paragraph offsets are measured incrementally: one cursor steps from
+        # the previous paragraph start to the next, so each step transfers
+        # only the text in between rather than the whole document prefix.
+        measure = text.createTextCursor()
+        measure.gotoStart(False)
+        offset = 0
 
         while enum.hasMoreElements():
+            if max_chars and copied_chars > max_chars:
+                break
             el = enum.nextElement()
             if not hasattr(el, "getString"):
                 continue
-            try:
-                style = el.getPropertyValue("ParaStyleName")
-            except Exception:
-                style = ""
-            style = style or ""
             para_text = el.getString()
 
             # Compute paragraph start offset
-            start_cursor = model.getText().createTextCursor()
-            start_cursor.gotoStart(False)
-            start_cursor.gotoRange(el.getStart(), True)
-            para_start = len(start_cursor.getString())
+            measure.gotoRange(el.getStart(), True)
+            offset += len(measure.getString())
+            measure.collapseToEnd()
+            para_start = offset
             para_end = para_start + len(para_text)
 
-            if para_end <= start or para_start >= end:
+            if para_start >= end:
+                # Paragraphs come in document order: nothing later overlaps.
+                break
+            if para_end <= start:
                 continue
+            try:
+                style = el.getPropertyValue("ParaStyleName")
+            except Exception:
+                style = ""
+            style = style or ""
             if para_start < start or para_end > end:
                 trim_start = max(0, start - para_start)
                 trim_end = len(para_text) - max(0, para_end - end)
@@ -310,6 +324,7 @@ def _range_to_content_via_temp_doc(model, ctx, start, end, max_chars, config_svc
                 temp_cursor.setPropertyValue("ParaStyleName", style)
                 temp_cursor.setString(para_text)
             added_any = True
+            copied_chars += len(para_text) + 1
 
         if not added_any:
             return ""
@@ -489,6 +504,9 @@ def apply_content_at_search(model, ctx, content, search,
         sd.SearchRegularExpression = False
         sd.SearchCaseSensitive = case_sensitive
 
+        # Bind the loop-invariant UNO method once; each attribute access on
+        # a UNO proxy is a bridge round-trip.
+        find_next = model.findNext
         count = 0
         found = model.findFirst(sd)
         while found:
@@ -499,7 +517,7 @@ def apply_content_at_search(model, ctx, content, search,
             count += 1
             if not all_matches:
                 break
-            found = model.findNext(cursor.getEnd(), sd)
+            found = find_next(cursor.getEnd(), sd)
             if count > 200:
                 break
         return count
@@ -648,6 +666,9 @@ def replace_preserving_format(model, target_range, new_text, ctx=None):
     # Process overlapping characters one by one.
     # setString on a selected character preserves the range's formatting.
     main_cursor = text.createTextCursorByRange(target_range.getStart())
+    # Hoist loop-invariant UNO method lookups out of the per-character loop.
+    create_cursor = text.createTextCursorByRange
+    goto_range = main_cursor.gotoRange
 
     for i in range(overlap):
         if i > 0 and i % 500 == 0 and toolkit:
@@ -657,7 +678,7 @@ def replace_preserving_format(model, target_range, new_text, ctx=None):
                 toolkit = None
 
         # Create a selection for exactly one character to check/replace.
-        sel = text.createTextCursorByRange(main_cursor)
+        sel = create_cursor(main_cursor)
         if not sel.goRight(1, True):
             break
 
@@ -667,7 +688,7 @@ def replace_preserving_format(model, target_range, new_text, ctx=None):
         # Explicitly move main_cursor to the end of the character just processed.
         # This is more robust than goRight(1) because setString() can affect
         # the cursor's logical position in some environments.
-        main_cursor.gotoRange(sel.getEnd(), False)
+        goto_range(sel.getEnd(), False)
 
     # Handle length changes.
     if new_len > old_len:
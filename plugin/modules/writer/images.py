@@ -86,6 +86,14 @@ class GenerateImage(ToolWriterImageBase):
     is_mutation = True
     long_running = True
 
+    # aspect_ratio -> (width, height) multipliers of base_size; anything else is square.
+    _ASPECT_RATIOS = {
+        "landscape_16_9": (16 / 9, 1), "16:9": (16 / 9, 1),
+        "portrait_9_16": (1, 16 / 9), "9:16": (1, 16 / 9),
+        "landscape_3_2": (1.5, 1), "4:3": (1.5, 1),
+        "portrait_2_3": (1, 1.5), "3:4": (1, 1.5),
+    }
+
     import typing
 
     def is_async(self) -> bool:
@@ -150,19 +158,10 @@ class GenerateImage(ToolWriterImageBase):
             base_size = 512
 
         aspect = args.get("aspect_ratio", get_config_str(ctx.ctx, "image_default_aspect"))
-        if aspect in ("landscape_16_9", "16:9"):
-            w, h = int(base_size * 16 / 9), base_size
-        elif aspect in ("portrait_9_16", "9:16"):
-            w, h = base_size, int(base_size * 16 / 9)
-        elif aspect in ("landscape_3_2", "4:3"):
-            w, h = int(base_size * 1.5), base_size
-        elif aspect in ("portrait_2_3", "3:4"):
-            w, h = base_size, int(base_size * 1.5)
-        else:
-            w, h = base_size, base_size
-
-        w = (w // 64) * 64
-        h = (h // 64) * 64
+        mul_w, mul_h = self._ASPECT_RATIOS.get(aspect, (1, 1))
+        # Round down to a multiple of 64, as the image models expect.
+        w = int(base_size * mul_w) & ~63
+        h = int(base_size * mul_h) & ~63
 
         width = args.get("width", edit_width if is_edit else w)
         height = args.get("height", edit_height if is_edit else h)
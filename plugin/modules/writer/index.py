@@ -20,6 +20,7 @@ Ported from mcp-libre services/writer/index.py.
 Language detected from UNO CharLocale. Stemming via bundled snowballstemmer.
 """
 
+import heapq
 import logging
 import re
 import sys
@@ -407,7 +408,7 @@ class IndexService(ServiceBase):
             hits = idx.query_not(hits, not_stems)
 
         total = len(hits)
-        selected = sorted(hits)[:max_results]
+        selected = sorted(hits) if max_results is None else heapq.nsmallest(max_results, hits)
 
         bookmark_map = self._bm_svc.get_mcp_bookmark_map(doc)
 
@@ -461,9 +462,8 @@ class IndexService(ServiceBase):
         """Index statistics + top 20 most frequent stems."""
         idx, was_cached = self._get_index(doc)
 
-        top = sorted(idx.terms.items(),
-                     key=lambda x: len(x[1]),
-                     reverse=True)[:20]
+        # Partial selection instead of sorting every stem in the index.
+        top = heapq.nlargest(20, idx.terms.items(), key=lambda x: len(x[1]))
 
         return {
             "language": idx.language,
@@ -26,7 +26,7 @@ Also includes tools for managing document comments (Annotations).
 
 import datetime
 import logging
-from typing import TYPE_CHECKING, cast, Any
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from com.sun.star.text import TextDocument, XTextDocument
@@ -27,6 +27,41 @@ from plugin.framework.service_base import ServiceBase
 log = logging.getLogger("writeragent.writer.nav.tree")
 
 
+def _join_preview(parts, max_chars):
+    preview = " ".join(parts)
+    if len(preview) > max_chars:
+        preview = preview[:max_chars] + "..."
+    return preview
+
+
+_invalidator_cls = None
+
+
+def _cache_invalidator_class():
+    """Return the XModifyListener class used by TreeService, or None without UNO."""
+    global _invalidator_cls
+    if _invalidator_cls is None:
+        try:
+            import unohelper
+            from com.sun.star.util import XModifyListener
+        except ImportError:
+            return None
+
+        class _CacheInvalidator(unohelper.Base, XModifyListener):
+            def __init__(self, events, doc):
+                self._events = events
+                self._doc = doc
+
+            def modified(self, rEvent):
+                self._events.emit("document:cache_invalidated", doc=self._doc)
+
+            def disposing(self, Source):
+                self._events.emit("document:cache_invalidated", doc=self._doc)
+
+        _invalidator_cls = _CacheInvalidator
+    return _invalidator_cls
+
+
 class TreeService(ServiceBase):
     """Heading tree navigation with per-document caching."""
 
@@ -36,8 +71,11 @@ class TreeService(ServiceBase):
         self._doc_svc = services.document
         self._bm_svc = services.writer_bookmarks
         events = services.events
+        self._events = events
         self._tree_cache = {}  # doc_key -> root node
         self._ai_summary_cache = {}  # doc_key -> {para_index: summary}
+        self._preview_cache = {}  # doc_key -> {para_index: body preview}
+        self._watched = {}  # doc_key -> (doc, modify listener)
         events.subscribe("document:cache_invalidated",
                          self._on_cache_invalidated)
 
@@ -45,10 +83,45 @@ class TreeService(ServiceBase):
         if doc is None:
             self._tree_cache.clear()
             self._ai_summary_cache.clear()
+            self._preview_cache.clear()
+            for key in list(self._watched):
+                self._unwatch(key)
         else:
             key = self._doc_svc.doc_key(doc)
             self._tree_cache.pop(key, None)
             self._ai_summary_cache.pop(key, None)
+            self._preview_cache.pop(key, None)
+            self._unwatch(key)
+
+    def _watch_modifications(self, doc, key):
+        """Emit ``document:cache_invalidated`` the next time *doc* changes.
+
+        Covers edits made in the UI as well as by tools. The listener lives
+        only as long as the cache entry it guards: it is removed when the
+        entry is dropped and attached again on the next rebuild, so stale
+        proxies never accumulate listeners. No-op outside LibreOffice.
+        """
+        if key in self._watched:
+            return
+        listener_cls = _cache_invalidator_class()
+        if listener_cls is None:
+            return
+        listener = listener_cls(self._events, doc)
+        try:
+            doc.addModifyListener(listener)
+            self._watched[key] = (doc, listener)
+        except Exception as e:
+            log.debug("Could not watch document modifications: %s", e)
+
+    def _unwatch(self, key):
+        entry = self._watched.pop(key, None)
+        if entry is None:
+            return
+        doc, listener = entry
+        try:
+            doc.removeModifyListener(listener)
+        except Exception:
+            pass  # Document already closed.
 
     # ── Tree building ──────────────────────────────────────────────
 
@@ -57,7 +130,8 @@ class TreeService(ServiceBase):
 
         Returns root node dict:
             {"level": 0, "text": "root", "para_index": -1,
-             "children": [...], "body_paragraphs": N}
+             "children": [...], "body_paragraphs": N,
+             "total_paragraphs": M}
         """
         key = self._doc_svc.doc_key(doc)
         if key in self._tree_cache:
@@ -102,15 +176,20 @@ class TreeService(ServiceBase):
             para_index += 1
             self._doc_svc.yield_to_gui()
 
+        root["total_paragraphs"] = para_index
         self._tree_cache[key] = root
+        self._watch_modifications(doc, key)
         return root
 
     def _count_all_children(self, node):
-        count = len(node.get("children", []))
-        for child in node.get("children", []):
-            if "children" in child:
-                count += self._count_all_children(child)
-        return count + node.get("body_paragraphs", 0)
+        # Every descendant heading plus every body paragraph below node.
+        count = node.get("body_paragraphs", 0)
+        stack = list(node.get("children", ()))
+        while stack:
+            child = stack.pop()
+            count += 1 + child.get("body_paragraphs", 0)
+            stack.extend(child.get("children", ()))
+        return count
 
     def _find_node_by_para_index(self, node, para_index):
         if node.get("para_index") == para_index:
@@ -128,17 +207,18 @@ class TreeService(ServiceBase):
         enum = text.createEnumeration()
         idx = 0
         preview_parts = []
+        preview_len = 0
         found_heading = (heading_para_index == -1)
 
         while enum.hasMoreElements():
             element = enum.nextElement()
-            is_para = element.supportsService(
-                "com.sun.star.text.Paragraph")
             if idx == heading_para_index:
                 found_heading = True
                 idx += 1
                 continue
-            if found_heading and is_para:
+            # Elements before the heading are only counted, not inspected.
+            if found_heading and element.supportsService(
+                    "com.sun.star.text.Paragraph"):
                 outline_level = 0
                 try:
                     outline_level = element.getPropertyValue("OutlineLevel")
@@ -149,14 +229,84 @@ class TreeService(ServiceBase):
                 para_text = element.getString().strip()
                 if para_text:
                     preview_parts.append(para_text)
-                    if sum(len(p) for p in preview_parts) >= max_chars:
+                    preview_len += len(para_text)
+                    if preview_len >= max_chars:
                         break
             idx += 1
 
-        full_preview = " ".join(preview_parts)
-        if len(full_preview) > max_chars:
-            full_preview = full_preview[:max_chars] + "..."
-        return full_preview
+        return _join_preview(preview_parts, max_chars)
+
+    def _collect_body_previews(self, doc, tree, wanted, max_chars=100):
+        """Return {para_index: preview} for the headings in *wanted*.
+
+        Same text as ``_get_body_preview`` for each heading, but from a
+        single enumeration instead of one walk from the top per heading.
+        Heading positions come from *tree*, so body paragraphs are only
+        read while a wanted heading's preview is still short of max_chars.
+        """
+        if not wanted:
+            return {}
+        headings = self._heading_indices(tree["children"])
+        last = max(wanted)
+        previews = {}
+        current = None  # wanted heading whose body is being read
+        parts = []
+        parts_len = 0
+
+        enum = doc.getText().createEnumeration()
+        idx = 0
+        while enum.hasMoreElements():
+            element = enum.nextElement()
+            if idx in headings:
+                if current is not None:
+                    previews[current] = _join_preview(parts, max_chars)
+                if idx > last:
+                    current = None
+                    break
+                current = idx if idx in wanted else None
+                parts = []
+                parts_len = 0
+            elif (current is not None and parts_len < max_chars
+                  and element.supportsService("com.sun.star.text.Paragraph")):
+                para_text = element.getString().strip()
+                if para_text:
+                    parts.append(para_text)
+                    parts_len += len(para_text)
+            idx += 1
+            self._doc_svc.yield_to_gui()
+
+        if current is not None:
+            previews[current] = _join_preview(parts, max_chars)
+        return previews
+
+    @staticmethod
+    def _heading_indices(nodes, depth=0):
+        """para_index of the headings in *nodes*, *depth* levels deep (0 = all)."""
+        found = set()
+        stack = [(node, 1) for node in nodes]
+        while stack:
+            node, level = stack.pop()
+            found.add(node["para_index"])
+            if depth == 0 or level < depth:
+                stack.extend((c, level + 1) for c in node.get("children", ()))
+        return found
+
+    def _previews_for(self, doc, tree, nodes, content_strategy, depth,
+                      ai_summaries):
+        """Body previews needed to serialize *nodes*, or None if unused.
+
+        Previews are kept per document until it is modified, so repeated
+        tree requests only sweep for headings not seen yet.
+        """
+        if content_strategy not in ("ai_summary_first", "first_lines"):
+            return None
+        cached = self._preview_cache.setdefault(self._doc_svc.doc_key(doc), {})
+        wanted = self._heading_indices(nodes, depth).difference(cached)
+        if content_strategy == "ai_summary_first":
+            wanted.difference_update(ai_summaries)
+        if wanted:
+            cached.update(self._collect_body_previews(doc, tree, wanted))
+        return cached
 
     def _get_full_body_text(self, doc, heading_para_index):
         text = doc.getText()
@@ -167,13 +317,12 @@ class TreeService(ServiceBase):
 
         while enum.hasMoreElements():
             element = enum.nextElement()
-            is_para = element.supportsService(
-                "com.sun.star.text.Paragraph")
             if idx == heading_para_index:
                 found_heading = True
                 idx += 1
                 continue
-            if found_heading and is_para:
+            if found_heading and element.supportsService(
+                    "com.sun.star.text.Paragraph"):
                 outline_level = 0
                 try:
                     outline_level = element.getPropertyValue("OutlineLevel")
@@ -221,8 +370,13 @@ class TreeService(ServiceBase):
         self._ai_summary_cache[key] = summaries
         return summaries
 
+    def _body_preview(self, doc, para_idx, max_chars, previews):
+        if previews is not None and para_idx in previews:
+            return previews[para_idx]
+        return self._get_body_preview(doc, para_idx, max_chars)
+
     def _apply_content_strategy(self, node, doc, ai_summaries, strategy,
-                                max_chars=100):
+                                max_chars=100, previews=None):
         para_idx = node.get("para_index", -1)
         if strategy in ("none", "heading_only"):
             pass
@@ -230,11 +384,11 @@ class TreeService(ServiceBase):
             if para_idx in ai_summaries:
                 node["ai_summary"] = ai_summaries[para_idx]
             else:
-                node["body_preview"] = self._get_body_preview(
-                    doc, para_idx, max_chars)
+                node["body_preview"] = self._body_preview(
+                    doc, para_idx, max_chars, previews)
         elif strategy == "first_lines":
-            node["body_preview"] = self._get_body_preview(
-                doc, para_idx, max_chars)
+            node["body_preview"] = self._body_preview(
+                doc, para_idx, max_chars, previews)
             if para_idx in ai_summaries:
                 node["ai_summary"] = ai_summaries[para_idx]
         elif strategy == "full":
@@ -242,7 +396,7 @@ class TreeService(ServiceBase):
 
     def _serialize_tree_node(self, child, doc, ai_summaries,
                              content_strategy, depth, current_depth=1,
-                             bookmark_map=None):
+                             bookmark_map=None, previews=None):
         node = {
             "type": "heading",
             "level": child["level"],
@@ -253,13 +407,13 @@ class TreeService(ServiceBase):
             "body_paragraphs": child["body_paragraphs"],
         }
         self._apply_content_strategy(
-            node, doc, ai_summaries, content_strategy)
+            node, doc, ai_summaries, content_strategy, previews=previews)
         if depth == 0 or current_depth < depth:
             if child.get("children"):
                 node["children"] = [
                     self._serialize_tree_node(
                         sub, doc, ai_summaries, content_strategy,
-                        depth, current_depth + 1, bookmark_map)
+                        depth, current_depth + 1, bookmark_map, previews)
                     for sub in child["children"]
                 ]
         return node
@@ -275,22 +429,16 @@ class TreeService(ServiceBase):
             self.get_ai_summaries_map(doc)
             if content_strategy in ("ai_summary_first", "first_lines")
             else {})
+        previews = self._previews_for(doc, tree, tree["children"],
+                                      content_strategy, depth, ai_summaries)
 
         children = [
             self._serialize_tree_node(
                 child, doc, ai_summaries, content_strategy,
-                depth, bookmark_map=bookmark_map)
+                depth, bookmark_map=bookmark_map, previews=previews)
             for child in tree["children"]
         ]
 
-        # Count total paragraphs
-        text = doc.getText()
-        enum = text.createEnumeration()
-        total = 0
-        while enum.hasMoreElements():
-            enum.nextElement()
-            total += 1
-
         try:
             self._doc_svc.annotate_pages(children, doc)
         except Exception:
@@ -304,7 +452,7 @@ class TreeService(ServiceBase):
             "depth": depth,
             "children": children,
             "body_before_first_heading": tree["body_paragraphs"],
-            "total_paragraphs": total,
+            "total_paragraphs": tree["total_paragraphs"],
             "page_count": page_count,
         }
 
@@ -353,13 +501,12 @@ class TreeService(ServiceBase):
 
         while enum.hasMoreElements():
             element = enum.nextElement()
-            is_para = element.supportsService(
-                "com.sun.star.text.Paragraph")
             if idx == heading_para_index:
                 found_heading = True
                 idx += 1
                 continue
-            if found_heading and is_para:
+            if found_heading and element.supportsService(
+                    "com.sun.star.text.Paragraph"):
                 outline_level = 0
                 try:
                     outline_level = element.getPropertyValue("OutlineLevel")
@@ -386,10 +533,12 @@ class TreeService(ServiceBase):
             idx += 1
             self._doc_svc.yield_to_gui()
 
+        previews = self._previews_for(doc, tree, target["children"],
+                                      content_strategy, depth, ai_summaries)
         for child in target["children"]:
             node = self._serialize_tree_node(
                 child, doc, ai_summaries, content_strategy,
-                depth, bookmark_map=bookmark_map)
+                depth, bookmark_map=bookmark_map, previews=previews)
             children.append(node)
 
         return {
@@ -630,12 +779,15 @@ class TreeService(ServiceBase):
         return None
 
     def _flatten_headings(self, node):
+        # Document (pre-)order into one list, without per-subtree copies.
         result = []
-        for child in node.get("children", []):
+        stack = list(reversed(node.get("children", ())))
+        while stack:
+            child = stack.pop()
             result.append({
                 "text": child["text"],
                 "para_index": child["para_index"],
                 "level": child["level"],
             })
-            result.extend(self._flatten_headings(child))
+            stack.extend(reversed(child.get("children", ())))
         return result
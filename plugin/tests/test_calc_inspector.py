@@ -0,0 +1,163 @@
+"""Tests for plugin.modules.calc.inspector without a running office."""
+
+from unittest.mock import MagicMock
+
+from plugin.modules.calc.address_utils import index_to_column
+from plugin.modules.calc.inspector import CellInspector
+
+
+class _Addr:
+    def __init__(self, sc, sr, ec, er):
+        self.StartColumn, self.StartRow, self.EndColumn, self.EndRow = sc, sr, ec, er
+
+
+class _Range:
+    def __init__(self, addr, formulas, data):
+        self._addr = addr
+        self._formulas = formulas
+        self._data = data
+        self.cell_lookups = []
+
+    def getRangeAddress(self):
+        return self._addr
+
+    def getFormulaArray(self):
+        return self._formulas
+
+    def getDataArray(self):
+        return self._data
+
+    def queryContentCells(self, flags):
+        blocks = MagicMock()
+        blocks.getRangeAddresses.return_value = (self._addr,)
+        return blocks
+
+    def getCellByPosition(self, col, row):
+        self.cell_lookups.append((col, row))
+        cell = MagicMock()
+        cell.getString.return_value = "0"
+        return cell
+
+
+def _make_inspector(cell_range):
+    sheet = MagicMock()
+    sheet.queryContentCells.side_effect = cell_range.queryContentCells
+    sheet.getCellRangeByPosition.return_value = cell_range
+    bridge = MagicMock()
+    bridge.get_active_sheet.return_value = sheet
+    bridge.get_cell_range.return_value = cell_range
+    bridge._index_to_column.side_effect = index_to_column
+    return CellInspector(bridge)
+
+
+def test_get_all_formulas_reads_arrays_once():
+    cell_range = _Range(
+        _Addr(1, 1, 2, 2),
+        (("1", "=B2*2"), ("x", "=0")),
+        ((1.0, 2.0), ("x", 0.0)),
+    )
+    formulas = _make_inspector(cell_range).get_all_formulas()
+    assert [(f["address"], f["formula"], f["value"]) for f in formulas] == [
+        ("C2", "=B2*2", 2.0),
+        ("C3", "=0", "0"),
+    ]
+    assert formulas[0]["precedents"] == ["B2"]
+    # Only the zero result needs a per-cell lookup for its display string.
+    assert cell_range.cell_lookups == [(1, 1)]
+
+
+def test_get_all_formulas_reads_only_formula_blocks():
+    block = _Range(_Addr(3, 9, 3, 9), (("=SUM($A$1:B2)",),), ((5.0,),))
+    inspector = _make_inspector(block)
+    sheet = inspector.bridge.get_active_sheet.return_value
+    formulas = inspector.get_all_formulas()
+    assert formulas == [
+        {"address": "D10", "formula": "=SUM($A$1:B2)", "value": 5.0, "precedents": formulas[0]["precedents"]}
+    ]
+    assert sorted(formulas[0]["precedents"]) == ["A1", "B2"]
+    sheet.queryContentCells.assert_called_once_with(16)
+    sheet.getCellRangeByPosition.assert_called_once_with(3, 9, 3, 9)
+    sheet.createCursor.assert_not_called()
+
+    inspector.get_all_formulas(range_hint="D1:D20")
+    inspector.bridge.get_cell_range.assert_called_once_with(sheet, "D1:D20")
+
+
+def test_read_range_infers_types_from_arrays():
+    cell_range = _Range(
+        _Addr(0, 0, 1, 1),
+        (("1", "hi"), ("", "=A1")),
+        ((1.0, "hi"), ("", 1.0)),
+    )
+    inspector = _make_inspector(cell_range)
+    rows = inspector.read_range("A1:B2")
+    assert [[c["type"] for c in row] for row in rows] == [["value", "text"], ["empty", "formula"]]
+    assert rows[1][1] == {"address": "B2", "value": 1.0, "formula": "=A1", "type": "formula"}
+    assert cell_range.cell_lookups == []
+    # Column letters are converted once per column, not once per cell.
+    assert inspector.bridge._index_to_column.call_count == 2
+
+
+class _UnoEnum:
+    """Mimics pyuno.Enum: compares by value and is not hashable."""
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, _UnoEnum) and other.value == self.value
+
+
+def test_read_cell_dispatches_on_cell_type(monkeypatch):
+    from plugin.modules.calc import inspector as inspector_mod
+
+    inspector = _make_inspector(_Range(_Addr(0, 0, 0, 0), (), ()))
+    cell = MagicMock()
+    cell.getValue.return_value = 3.0
+    cell.getString.return_value = "3"
+    cell.getFormula.return_value = "=1+2"
+    inspector.bridge.get_cell.return_value = cell
+
+    cell.getType.return_value = inspector_mod.TEXT
+    assert inspector.read_cell("a1") == {"address": "A1", "value": "3", "formula": None, "type": "text"}
+
+    cell.getType.return_value = inspector_mod.FORMULA
+    cell.getValue.reset_mock()
+    assert inspector.read_cell("A1")["value"] == 3.0
+    cell.getValue.assert_called_once_with()
+
+    # Real UNO enums are keyed by their value name.
+    formula = _UnoEnum("FORMULA")
+    monkeypatch.setattr(inspector_mod, "FORMULA", formula)
+    monkeypatch.setitem(inspector_mod._TYPE_NAMES, "FORMULA", "formula")
+    cell.getType.return_value = formula
+    assert inspector.read_cell("A1")["type"] == "formula"
+    cell.getType.return_value = _UnoEnum("SOMETHING_ELSE")
+    assert inspector.get_cell_details("A1")["type"] == "unknown"
+
+
+def test_get_cell_details_reads_properties_in_one_call():
+    from plugin.modules.calc import inspector as inspector_mod
+
+    inspector = _make_inspector(_Range(_Addr(0, 0, 0, 0), (), ()))
+    cell = MagicMock()
+    cell.getType.return_value = inspector_mod.TEXT
+    cell.getPropertyValues.return_value = ("=A1", 0xFF0000, 0, 0, 11.0, 150.0, 0, 0, 0, True)
+    inspector.bridge.get_cell.return_value = cell
+
+    details = inspector.get_cell_details("b2")
+    cell.getPropertyValues.assert_called_once_with(inspector_mod._DETAIL_PROPS)
+    cell.getPropertyValue.assert_not_called()
+    assert details["formula_local"] == "=A1"
+    assert details["background_color"] == 0xFF0000
+    assert details["bold"] == 150.0
+    assert details["wrap_text"] is True
+
+    # A failing bulk read falls back to per-property reads.
+    cell.getPropertyValues.side_effect = RuntimeError("unknown property")
+    cell.getPropertyValue.side_effect = lambda name: name
+    details = inspector.get_cell_details("B2")
+    assert details["font_size"] == "CharHeight"
+    assert cell.getPropertyValue.call_count == len(inspector_mod._DETAIL_PROPS)
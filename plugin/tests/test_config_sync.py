@@ -209,6 +209,22 @@ class TestPopulateComboboxWithLruFetchOptions(unittest.TestCase):
             self.assertIn("m1", items)
             self.assertIn("m2", items)
 
+    def test_merge_keeps_lru_order_and_dedupes(self):
+        from plugin.framework.config import populate_combobox_with_lru
+
+        self.config_data["model_lru@http://localhost:8080"] = ["m2", "m1"]
+        ctrl = MagicMock()
+        ctrl.getItemCount.return_value = 0
+        populate_combobox_with_lru(
+            self.ctx,
+            ctrl,
+            "cur",
+            "model_lru",
+            "http://localhost:8080",
+            remote_models=["m1", "m3", "m2"],
+        )
+        self.assertEqual(ctrl.addItems.call_args[0][0], ("cur", "m2", "m1", "m3"))
+
 
 class TestFetchAvailableModelsCache(unittest.TestCase):
     """_model_fetch_cache is process-wide; same normalized endpoint hits HTTP once."""
@@ -303,6 +319,20 @@ class TestConfigSyncFileIO(unittest.TestCase):
             data = json.load(f)
         self.assertEqual(data["api_keys_by_endpoint"]["http://api.openai.com"], "sk-recovered")
 
+    def test_corrupt_config_parsed_once_per_mtime(self):
+        import plugin.framework.config as cfg
+
+        with open(self.config_path, "w", encoding="utf-8") as f:
+            f.write("{ invalid json ")
+        cfg._cached_config_dict = None
+        cfg._cached_config_mtime_last_checked = 0.0
+        with patch("plugin.framework.config.json.load", wraps=json.load) as mock_load:
+            self.assertEqual(get_api_key_for_endpoint(self.ctx, "http://api.openai.com"), "")
+            cfg._cached_config_mtime_last_checked = 0.0
+            self.assertEqual(get_api_key_for_endpoint(self.ctx, "http://api.openai.com"), "")
+        self.assertEqual(mock_load.call_count, 1)
+        cfg._cached_config_dict = None
+
     def test_get_config_default_resolution(self):
         # Delete config file to ensure we hit default resolution logic
         if os.path.exists(self.config_path):
@@ -0,0 +1,37 @@
+import pytest
+
+from plugin.framework.default_models import (
+    DEFAULT_MODELS,
+    get_catalog_capability,
+    get_default_model_ids,
+    get_provider_defaults,
+    resolve_model_id,
+)
+
+
+def test_provider_defaults_follow_catalog_order():
+    defaults = get_provider_defaults("openrouter")
+    first_text = next(
+        resolve_model_id(m, "openrouter") for m in DEFAULT_MODELS
+        if m.get("default_text") and resolve_model_id(m, "openrouter")
+    )
+    assert defaults["text_model"] == first_text
+    assert get_provider_defaults(None) == {}
+    # Callers get a copy, not the shared lookup table
+    defaults["text_model"] = "changed"
+    assert get_provider_defaults("openrouter")["text_model"] == first_text
+
+
+def test_catalog_capability_and_default_ids():
+    assert get_catalog_capability("together", "openai/whisper-large-v3") == "audio"
+    assert get_catalog_capability("together", "unknown/model") is None
+    assert "openai/whisper-large-v3" in get_default_model_ids("together", "audio")
+    assert get_default_model_ids("nonexistent", "text") == ()
+
+
+def test_catalog_is_read_only():
+    assert isinstance(DEFAULT_MODELS, tuple)
+    with pytest.raises(TypeError):
+        DEFAULT_MODELS[0]["display_name"] = "x"
+    with pytest.raises(TypeError):
+        DEFAULT_MODELS[0]["ids"]["openrouter"] = "x"
@@ -2,7 +2,7 @@ import queue
 import unittest
 from unittest.mock import Mock, patch
 
-from plugin.framework.errors import WriterAgentException, format_error_payload, safe_json_loads
+from plugin.framework.errors import WriterAgentException, format_error_payload, json_dumps_compact, safe_json_loads
 from plugin.framework.tool_base import ToolBase
 from plugin.modules.http.errors import format_error_for_display
 
@@ -71,6 +71,52 @@ class TestSafeJsonLoads(unittest.TestCase):
         self.assertEqual(safe_json_loads('invalid', default={"error": True}), {"error": True})
         self.assertEqual(safe_json_loads(None, default="default"), "default")
 
+    def test_safe_json_loads_matches_stdlib_edge_cases(self):
+        # Inputs orjson rejects but json accepts must still parse.
+        self.assertEqual(safe_json_loads('[Infinity]'), [float("inf")])
+        self.assertEqual(safe_json_loads(str(2 ** 70)), 2 ** 70)
+        self.assertEqual(safe_json_loads(b'{"a": 1}'), {"a": 1})
+        self.assertIsNone(safe_json_loads("[" * 100000))
+
+    def test_json_dumps_compact(self):
+        self.assertEqual(json_dumps_compact({"a": [1, 2.5], "t": "é"}), '{"a":[1,2.5],"t":"é"}')
+        # Values orjson refuses fall back to the stdlib encoder.
+        self.assertEqual(json_dumps_compact({1: 2 ** 70}), '{"1":%d}' % 2 ** 70)
+
+    def test_json_dumps_compact_orjson_branch(self):
+        import types
+        from plugin.framework import errors
+
+        class JSONEncodeError(TypeError):
+            pass
+
+        def dumps(obj, option=0):
+            calls.append(option)
+            if isinstance(obj, dict) and "when" in obj:
+                raise JSONEncodeError("passthrough")
+            return b'{"t":"\xc3\xa9"}'
+
+        calls = []
+        stub = types.SimpleNamespace(
+            dumps=dumps, JSONEncodeError=JSONEncodeError,
+            OPT_PASSTHROUGH_DATETIME=1, OPT_PASSTHROUGH_DATACLASS=2,
+        )
+        with patch.object(errors, "orjson", stub):
+            self.assertEqual(json_dumps_compact({"t": "é"}), '{"t":"é"}')
+            self.assertEqual(calls, [3])
+            # Types orjson passes through are rejected exactly as json rejects them.
+            import datetime
+            with self.assertRaises(TypeError):
+                json_dumps_compact({"when": datetime.date(2026, 1, 1)})
+
+    def test_json_dumps_compact_real_orjson_rejects_datetime(self):
+        from plugin.framework import errors
+        if errors.orjson is None:
+            self.skipTest("orjson not installed")
+        import datetime
+        with self.assertRaises(TypeError):
+            json_dumps_compact({"when": datetime.datetime(2026, 1, 1)})
+
 from plugin.framework.async_stream import StreamQueueKind, run_stream_drain_loop
 
 class TestAsyncStreamErrorHandling(unittest.TestCase):
@@ -125,5 +125,15 @@ class TestImageStatusCallback(unittest.TestCase):
                 ]
                 self.assertEqual(status_callback.call_args_list, expected_calls)
 
+    def test_horde_local_settings_shared_between_providers(self):
+        mock_ctx = MagicMock()
+        service = ImageService(mock_ctx, {"image_provider": "aihorde"})
+        first = service.get_provider("aihorde")
+        first.client.settings["local_settings"]["requirements"] = {"model": {"steps": 20}}
+        second = service.get_provider("aihorde")
+        self.assertIs(second.client.settings["local_settings"], first.client.settings["local_settings"])
+        self.assertEqual(second.client.settings["local_settings"]["requirements"], {"model": {"steps": 20}})
+        second.client.settings["local_settings"].clear()
+
 if __name__ == '__main__':
     unittest.main()
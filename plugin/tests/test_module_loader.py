@@ -77,3 +77,41 @@ def test_load_modules(mock_load_manifest):
 
         assert len(modules) == 1
         assert modules[0].name == "test_module"
+
+
+def test_plugin_package_import_is_side_effect_free():
+    """Importing the plugin package must not pull in any submodule."""
+    import os
+    import subprocess
+    import sys
+
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    code = (
+        "import sys, plugin; "
+        "print(sorted(m for m in sys.modules if m.startswith('plugin.')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+        check=True, cwd=root,
+    ).stdout.strip()
+    assert out == "[]"
+
+
+def test_manifest_import_is_stdlib_only():
+    """plugin._manifest must be loadable without pulling in the framework."""
+    import os
+    import subprocess
+    import sys
+
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if not os.path.exists(os.path.join(root, "plugin", "_manifest.py")):
+        pytest.skip("plugin/_manifest.py is generated at build time")
+    code = (
+        "import sys, plugin._manifest; "
+        "print(sorted(m for m in sys.modules if m == 'plugin' or m.startswith('plugin.')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+        check=True, cwd=root,
+    ).stdout.strip()
+    assert out == "['plugin', 'plugin._manifest']"
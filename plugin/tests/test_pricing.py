@@ -0,0 +1,21 @@
+import json
+from unittest.mock import patch
+
+from plugin.framework import pricing
+
+
+def test_model_pricing_parsed_once_per_file_version(tmp_path):
+    path = tmp_path / pricing.PRICING_FILENAME
+    path.write_text(json.dumps([
+        {"id": "a", "pricing": {"prompt": "0.1", "completion": "0.2"}},
+        {"id": "b", "pricing": {"prompt": "n/a"}},
+    ]))
+    with patch.object(pricing, "_get_cache_path", return_value=str(path)):
+        with patch.object(pricing.json, "load", wraps=json.load) as load:
+            assert pricing.get_model_pricing(None, "a") == (0.1, 0.2)
+            assert pricing.get_model_pricing(None, "b") is None
+            assert pricing.get_model_pricing(None, "missing") is None
+            assert load.call_count == 1
+
+        path.write_text(json.dumps([{"id": "a", "pricing": {"prompt": "1", "completion": "2"}}]))
+        assert pricing.get_model_pricing(None, "a") == (1.0, 2.0)
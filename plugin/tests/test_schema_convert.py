@@ -1,4 +1,4 @@
-from plugin.framework.schema_convert import to_openai_schema, to_mcp_schema, _normalize_schema_for_strict_providers
+from plugin.framework.schema_convert import to_openai_schema, to_mcp_schema, compact_openai_schema, _normalize_schema_for_strict_providers
 from plugin.framework.tool_base import ToolBase
 
 class DummyTool(ToolBase):
@@ -112,3 +112,28 @@ def test_normalize_schema_none_dict():
     assert _normalize_schema_for_strict_providers(None) is None
     assert _normalize_schema_for_strict_providers("string") == "string"
 
+
+def test_compact_openai_schema():
+    schema = {
+        "type": "function",
+        "function": {
+            "name": "t",
+            "description": "Line one.\n        Line   two.",
+            "parameters": {
+                "type": "object",
+                "title": "Args",
+                "properties": {
+                    "title": {"type": "string", "title": "Title", "examples": ["x"], "description": "The  title."},
+                    "tags": {"type": "array", "items": {"type": "string", "title": "Tag"}},
+                },
+            },
+        },
+    }
+    compact = compact_openai_schema(schema)
+    assert compact["function"]["description"] == "Line one.\nLine two."
+    params = compact["function"]["parameters"]
+    assert "title" not in params
+    assert params["properties"]["title"] == {"type": "string", "description": "The title."}
+    assert params["properties"]["tags"]["items"] == {"type": "string"}
+    # The source schema is left untouched.
+    assert schema["function"]["parameters"]["title"] == "Args"
@@ -86,3 +86,26 @@ class TestLifecycle:
 
         reg.register("bad", BadShutdown())
         reg.shutdown_all()  # should not raise
+
+
+class TestAutoDiscover:
+    def test_registers_services_defined_in_module(self):
+        import types
+
+        module = types.ModuleType("fake_services")
+
+        class LocalService(ServiceBase):
+            name = "local"
+
+            def __init__(self, services):
+                self.services = services
+
+        LocalService.__module__ = "fake_services"
+        module.LocalService = LocalService
+        module.DummyService = DummyService  # imported from elsewhere: skipped
+        module.not_a_class = object()
+
+        reg = ServiceRegistry()
+        reg.auto_discover(module)
+        assert isinstance(reg.get("local"), LocalService)
+        assert reg.get("dummy") is None
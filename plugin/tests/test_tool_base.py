@@ -42,6 +42,10 @@ def test_detects_mutation():
 
     assert UnnamedTool().detects_mutation() is True
 
+def test_subclasses_recorded_in_definition_order():
+    subclasses = ToolBase._subclasses
+    assert subclasses.index(ValidTool) < subclasses.index(ReadTool) < subclasses.index(ExplictMutateTool)
+
 def test_validate():
     tool = ValidTool()
 
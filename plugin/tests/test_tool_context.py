@@ -42,3 +42,9 @@ def test_tool_context_defaults():
     assert tc.status_callback is None
     assert tc.append_thinking_callback is None
     assert tc.stop_checker is None
+
+def test_tool_context_from_defaults_matches_init():
+    fast = ToolContext.from_defaults("doc", "ctx", "writer", "services", "mcp")
+    slow = ToolContext(doc="doc", ctx="ctx", doc_type="writer", services="services", caller="mcp")
+    for slot in ToolContext.__slots__:
+        assert getattr(fast, slot) == getattr(slow, slot)
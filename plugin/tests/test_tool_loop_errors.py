@@ -139,6 +139,33 @@ def test_tool_execution_error_handling(test_instance, mock_get_tools):
         assert "Unexpected error executing tool" in parsed_res["message"]
         assert parsed_res["details"]["original_error"] == "Something unexpected"
 
+
+def test_execute_fn_reuses_tool_context(test_instance, mock_get_tools):
+    registry = mock_get_tools
+    registry.get_schemas.return_value = [{"name": "test_tool"}]
+    registry.execute.return_value = {"status": "ok"}
+    captured_execute_fn = []
+
+    with patch("plugin.modules.chatbot.tool_loop.get_document_context_for_chat", return_value="doc text"), \
+         patch.object(test_instance, "_start_tool_calling_async", lambda *a, **kw: captured_execute_fn.append(a[4])):
+        test_instance._do_send_chat_with_tools("test", "test_model", "writer")
+
+    execute_fn = captured_execute_fn[0]
+    doc = object()
+    execute_fn("test_tool", {}, doc, test_instance.ctx, status_callback=test_instance._put_tool_status)
+    execute_fn("other_tool", {}, doc, test_instance.ctx, status_callback=test_instance._put_tool_status)
+    first, second = (c.args[1] for c in registry.execute.call_args_list)
+    assert first is second
+    assert first.status_callback == test_instance._put_tool_status
+
+    # Different callbacks, or a web_research call, get their own context.
+    execute_fn("test_tool", {}, doc, test_instance.ctx, status_callback=print)
+    execute_fn("web_research", {}, doc, test_instance.ctx, status_callback=print)
+    third, fourth = (c.args[1] for c in registry.execute.call_args_list[2:])
+    assert third is not first and fourth is not third
+    assert third.chat_append_callback is None
+    assert fourth.chat_append_callback is not None
+
 # Disabled outside LibreOffice: tool_loop.py catches Exception and imports
 # com.sun.star.lang.DisposedException etc., which raises ImportError in pytest.
 # def test_document_context_error_handling(test_instance, mock_get_tools):
@@ -120,6 +120,26 @@ class TestRegister:
         assert reg.get("imported_tool") is None
         assert len(reg) == 2
 
+    def test_auto_discover_skips_registered_classes(self):
+        import types
+
+        mock_module = types.ModuleType("mock_rediscover_module")
+        created = []
+
+        class CountingTool(ToolBase):
+            name = "counting_tool"
+            description = "Counts instances"
+            def __init__(self):
+                created.append(self)
+            def execute(self, ctx, **kwargs): pass
+        CountingTool.__module__ = "mock_rediscover_module"
+
+        reg = _make_registry()
+        reg.auto_discover(mock_module)
+        reg.auto_discover(mock_module)
+        assert len(created) == 1
+        assert reg.get("counting_tool") is created[0]
+
     def test_register_and_get(self):
         reg = _make_registry(FakeTool())
         assert reg.get("fake_tool") is not None
@@ -153,6 +173,54 @@ class TestDocTypeFiltering:
         names = [t.name for t in reg.get_tools(doc=None)]
         assert names == ["universal_tool"]
 
+    def test_supports_service_asked_once_per_service(self):
+        class CountingDoc(MockDoc):
+            calls = 0
+
+            def supportsService(self, svc):
+                CountingDoc.calls += 1
+                return super().supportsService(svc)
+
+        class OtherWriterTool(FakeTool):
+            name = "other_writer_tool"
+
+        reg = _make_registry(FakeTool(), OtherWriterTool(), AllDocTool())
+        names = [t.name for t in reg.get_tools(doc=CountingDoc("writer"))]
+        assert names == ["fake_tool", "other_writer_tool", "universal_tool"]
+        assert CountingDoc.calls == 1
+
+    def test_tier_and_intent_indices(self):
+        class CoreEditTool(AllDocTool):
+            name = "core_edit"
+            tier = "core"
+            intent = "edit"
+
+        class CoreEditToolV2(CoreEditTool):
+            intent = "review"
+
+        reg = _make_registry(FakeTool(), AllDocTool(), CoreEditTool())
+        assert [t.name for t in reg.get_tools(tier="core")] == ["core_edit"]
+        assert [t.name for t in reg.get_tools(intent="edit")] == ["core_edit"]
+        assert reg.get_tools(tier="core", intent="review") == []
+        reg.register(CoreEditToolV2())
+        assert reg.get_tools(intent="edit") == []
+        assert [t.name for t in reg.get_tools(tier="core", intent="review")] == ["core_edit"]
+
+    def test_domain_index(self):
+        class ChartTool(AllDocTool):
+            name = "chart_tool"
+            specialized_domain = "charts"
+
+        class ChartToolMoved(ChartTool):
+            specialized_domain = "shapes"
+
+        reg = _make_registry(FakeTool(), ChartTool())
+        assert [t.name for t in reg.get_domain_tools("charts")] == ["chart_tool"]
+        assert reg.get_domain_tools("tables") == []
+        reg.register(ChartToolMoved())
+        assert reg.get_domain_tools("charts") == []
+        assert [t.name for t in reg.get_domain_tools("shapes")] == ["chart_tool"]
+
 
 class TestExecute:
     def test_successful_execution(self):
@@ -180,6 +248,35 @@ class TestExecute:
         assert result["status"] == "error"
         assert "Missing required" in result.get("error", result.get("message", ""))
 
+    def test_extra_kwargs_dropped_and_mutation_precomputed(self):
+        reg = _make_registry(FakeTool(), AllDocTool())
+        result = reg.execute("fake_tool", _make_ctx("writer"), text="hi", image_model="x")
+        assert result == {"status": "ok", "text": "hi"}
+        assert reg.is_mutation("fake_tool") is True
+        assert reg.is_mutation("missing_tool") is False
+
+    def test_async_tool_names_cached_until_register(self):
+        class AsyncTool(AllDocTool):
+            name = "async_tool"
+
+            def is_async(self):
+                return True
+
+        reg = _make_registry(FakeTool(), AsyncTool())
+        names = reg.async_tool_names()
+        assert names == frozenset({"async_tool"})
+        assert reg.async_tool_names() is names
+        reg.register(AllDocTool())
+        assert reg.async_tool_names() == names
+
+    def test_validate_skipped_when_it_cannot_fail(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(ToolBase, "validate", lambda self, **kw: calls.append(self.name) or (True, None))
+        reg = _make_registry(FakeTool(), AllDocTool())
+        reg.execute("universal_tool", _make_ctx("writer"), stray=1)
+        reg.execute("fake_tool", _make_ctx("writer"), text="x")
+        assert calls == ["fake_tool"]
+
     def test_execution_failure_returns_error(self):
         reg = _make_registry(FailingTool())
         ctx = _make_ctx("writer")
@@ -309,6 +406,30 @@ class TestSchemas:
         assert s["name"] == "fake_tool"
         assert "inputSchema" in s
 
+    def test_schemas_converted_once_at_register(self, monkeypatch):
+        from plugin.framework import tool_registry
+        reg = _make_registry(FakeTool())
+
+        def fail(tool):
+            raise AssertionError("schema converted on lookup")
+
+        monkeypatch.setattr(tool_registry, "to_openai_schema", fail)
+        monkeypatch.setattr(tool_registry, "to_mcp_schema", fail)
+        first = reg.get_schemas("openai", doc=MockDoc("writer"))
+        assert reg.get_schemas("openai", doc=MockDoc("writer"))[0] is first[0]
+        assert reg.get_schemas("mcp", doc=MockDoc("writer"))[0]["name"] == "fake_tool"
+        with pytest.raises(ValueError):
+            reg.get_schemas("xml")
+
+
+    def test_tool_summaries(self):
+        reg = _make_registry(FakeTool(), AllDocTool())
+        summaries = reg.get_tool_summaries(doc=MockDoc("calc"))
+        assert summaries == [
+            {"name": "universal_tool", "description": "Works everywhere", "tier": "extended", "intent": None}
+        ]
+        assert reg.get_tool_summaries(doc=MockDoc("calc"))[0] is summaries[0]
+
 
 class TestExecuteEventsAndInvalidation:
     """Tests that execute() emits events."""
@@ -380,6 +501,20 @@ class TestExecuteEventsAndInvalidation:
         assert events.events[1][0] == "tool:failed"
         assert "something went wrong" in events.events[1][1]["error"]
 
+    def test_event_bus_set_after_construction(self):
+        emitted = []
+
+        class ListBus:
+            def emit(self, event, **kwargs):
+                emitted.append(event)
+
+        reg = _make_registry(FakeTool())
+        reg.execute("fake_tool", _make_ctx("writer"), text="a")
+        assert emitted == []
+        reg.set_event_bus(ListBus())
+        reg.execute("fake_tool", _make_ctx("writer"), text="b")
+        assert emitted == ["tool:executing", "tool:completed"]
+
 class TestToolIsolation:
     def test_tool_execution_error(self):
         from plugin.framework.tool_registry import ToolRegistry
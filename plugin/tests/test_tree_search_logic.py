@@ -95,6 +95,76 @@ class TestTreeServiceSearch(unittest.TestCase):
         self.assertIsNotNone(res)
         self.assertEqual(res["text"], "Advanced Usage")
 
+    def test_flatten_keeps_document_order(self):
+        tree = self.tree_svc.build_heading_tree(self.doc)
+        flat = self.tree_svc._flatten_headings(tree)
+        self.assertEqual([h["para_index"] for h in flat], [0, 2, 3, 4, 5])
+        self.assertEqual(self.tree_svc._count_all_children(tree), 6)
+
+    def test_body_preview_skips_elements_before_heading(self):
+        checked = []
+
+        class CheckedElement(ElementStub):
+            def supportsService(self, service):
+                checked.append(self.text)
+                return super().supportsService(service)
+
+        doc = WriterDocStub([CheckedElement(t) for t in ("a", "b", "c")] + [
+            CheckedElement("Heading", outline_level=1),
+            CheckedElement("first body"),
+            CheckedElement("Next", outline_level=1),
+            CheckedElement("never read"),
+        ])
+        self.assertEqual(self.tree_svc._get_body_preview(doc, 3), "first body")
+        self.assertEqual(checked, ["first body", "Next"])
+
+    def test_tree_previews_match_per_heading_walks(self):
+        elements = [
+            ElementStub("Intro", outline_level=1),
+            ElementStub("Intro body"),
+            ElementStub("Part", outline_level=1),
+            ElementStub("[table]", services=["com.sun.star.text.TextTable"]),
+            ElementStub("x" * 80),
+            ElementStub("y" * 80),
+            ElementStub("Sub", outline_level=2),
+            ElementStub("Sub body"),
+            ElementStub("End", outline_level=1),
+        ]
+        enumerations = []
+        doc = WriterDocStub(elements)
+        get_text = doc.getText
+
+        def counting_get_text():
+            text = get_text()
+            create = text.createEnumeration
+            text.createEnumeration = lambda: enumerations.append(1) or create()
+            return text
+
+        doc.getText = counting_get_text
+        self.tree_svc.get_ai_summaries_map = MagicMock(return_value={})
+
+        result = self.tree_svc.get_document_tree(doc, depth=0)
+        # One pass for the heading tree, one for every preview.
+        self.assertEqual(len(enumerations), 2)
+        previews = {}
+        stack = list(result["children"])
+        while stack:
+            node = stack.pop()
+            previews[node["para_index"]] = node["body_preview"]
+            stack.extend(node.get("children", ()))
+        self.assertEqual(previews, {
+            i: self.tree_svc._get_body_preview(doc, i) for i in (0, 2, 6, 8)
+        })
+        self.assertEqual(previews[2], "x" * 80 + " " + "y" * 19 + "...")
+
+        # Cached until the document changes.
+        del enumerations[:]
+        self.tree_svc.get_document_tree(doc, depth=0)
+        self.assertEqual(enumerations, [])
+        self.tree_svc._on_cache_invalidated(doc=doc)
+        self.tree_svc.get_document_tree(doc, depth=0)
+        self.assertEqual(len(enumerations), 2)
+
     def test_no_match(self):
         res = self.tree_svc._find_heading_by_text(self.doc, "NonExistent")
         self.assertIsNone(res)
@@ -105,5 +175,63 @@ class TestTreeServiceSearch(unittest.TestCase):
         res = self.tree_svc._find_heading_by_text(self.doc, "   ")
         self.assertIsNone(res)
 
+
+class TestTreeCacheInvalidation(unittest.TestCase):
+    def test_document_change_drops_cached_tree(self):
+        import types
+        from unittest.mock import patch
+        from plugin.framework.event_bus import EventBus
+
+        class Base:
+            pass
+
+        unohelper = types.ModuleType("unohelper")
+        unohelper.Base = Base
+        util = types.ModuleType("com.sun.star.util")
+        util.XModifyListener = type("XModifyListener", (), {})
+
+        class WatchableDoc(WriterDocStub):
+            def __init__(self, elements):
+                super().__init__(elements)
+                self.listeners = []
+
+            def addModifyListener(self, listener):
+                self.listeners.append(listener)
+
+            def removeModifyListener(self, listener):
+                self.listeners.remove(listener)
+
+        from plugin.modules.writer import tree as tree_mod
+
+        doc = WatchableDoc([ElementStub("Intro", outline_level=1)])
+        services = MagicMock()
+        services.document.doc_key.side_effect = lambda d: id(d)
+        services.events = EventBus()
+        tree_svc = TreeService(services)
+
+        with patch.dict("sys.modules", {"unohelper": unohelper, "com.sun.star.util": util}), \
+                patch.object(tree_mod, "_invalidator_cls", None):
+            tree = tree_svc.build_heading_tree(doc)
+            self.assertIs(tree_svc.build_heading_tree(doc), tree)
+            self.assertEqual(len(doc.listeners), 1)
+
+            doc.elements.append(ElementStub("Appendix", outline_level=1))
+            listener = doc.listeners[0]
+            listener.modified(None)
+            # The listener is detached along with the cache entry it guarded.
+            self.assertEqual(doc.listeners, [])
+            rebuilt = tree_svc.build_heading_tree(doc)
+            self.assertEqual(len(rebuilt["children"]), 2)
+            self.assertEqual(len(doc.listeners), 1)
+            # The listener class is built once, not per document.
+            self.assertIs(type(doc.listeners[0]), type(listener))
+
+            # A second proxy gets its own listener; a full invalidation drops both.
+            other = WatchableDoc([ElementStub("Intro", outline_level=1)])
+            tree_svc.build_heading_tree(other)
+            services.events.emit("document:cache_invalidated")
+            self.assertEqual((doc.listeners, other.listeners), ([], []))
+            self.assertEqual(tree_svc._watched, {})
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,240 @@
+import contextlib
+import sqlite3
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from plugin.contrib.smolagents import default_tools
+
+
+def test_web_cache_roundtrip(tmp_path):
+    db_path = str(tmp_path / "web_cache.db")
+    default_tools._web_cache_set(db_path, "page", "https://example.com", "hello", 1024 * 1024)
+    assert default_tools._web_cache_get(db_path, "page", "https://example.com") == "hello"
+    assert default_tools._web_cache_get(db_path, "search", "https://example.com") is None
+
+
+def test_web_cache_uses_wal(tmp_path):
+    db_path = str(tmp_path / "web_cache.db")
+    default_tools._web_cache_set(db_path, "search", "q", "results", 1024 * 1024)
+    assert db_path in default_tools._pragmas_applied
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+
+def test_web_cache_evicts_oldest(tmp_path):
+    db_path = str(tmp_path / "web_cache.db")
+    default_tools._web_cache_set(db_path, "page", "a", "x" * 60, 100)
+    default_tools._web_cache_set(db_path, "page", "b", "y" * 60, 100)
+    assert default_tools._web_cache_get(db_path, "page", "a") is None
+    assert default_tools._web_cache_get(db_path, "page", "b") == "y" * 60
+
+
+def test_web_cache_reuses_connection_per_thread(tmp_path):
+    db_path = str(tmp_path / "web_cache.db")
+    conn = default_tools._get_conn(db_path)
+    default_tools._web_cache_set(db_path, "page", "k", "v", 1024)
+    assert default_tools._get_conn(db_path) is conn
+    assert not conn.in_transaction
+
+
+def test_web_cache_expiry_is_absolute(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "web_cache.db")
+    default_tools._web_cache_set(db_path, "page", "old", "x", 1024, max_age_days=1)
+    default_tools._web_cache_set(db_path, "page", "kept", "y", 1024, max_age_days=1, etag='"e"')
+    conn = default_tools._get_conn(db_path)
+    conn.execute("UPDATE web_cache SET expires_at = 0")
+    for k in ("old", "kept"):
+        default_tools._mem_cache_discard(db_path, "page", k)
+        assert default_tools._web_cache_get(db_path, "page", k) is None
+    # Reads never write: the expired rows are still there until the purge sweep.
+    assert conn.execute("SELECT COUNT(*) FROM web_cache").fetchone()[0] == 2
+    monkeypatch.setattr(default_tools, "_WEB_CACHE_PURGE_EVERY", 1)
+    default_tools._web_cache_set(db_path, "page", "new", "z", 1024)
+    keys = {row[0] for row in conn.execute("SELECT raw_key FROM web_cache")}
+    assert keys == {"kept", "new"}
+
+
+def test_is_garbage_text():
+    assert not default_tools._is_garbage_text("short\x00\x01")
+    assert not default_tools._is_garbage_text("Plain readable text.\n" * 10)
+    assert not default_tools._is_garbage_text("日本語のテキストです。" * 20)
+    assert default_tools._is_garbage_text("�\x00\x07a" * 50)
+
+
+def test_text_extractor_skips_hidden_tags():
+    extractor = default_tools._TextExtractor()
+    extractor.feed("<html><head><title>T</title></head><body><script>x=1</script><p>Hello</p> <p>World</p></body></html>")
+    assert extractor.text == ["Hello", "World"]
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    ports = []
+
+    def do_GET(self):
+        self.ports.append(self.client_address[1])
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/page")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = b"<html><body><p>Hello page</p></body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def page_server():
+    _PageHandler.ports = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield "http://127.0.0.1:%d" % server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_visit_webpage_reuses_connection(page_server):
+    tool = default_tools.VisitWebpageTool()
+    assert tool.forward(page_server + "/page") == "Hello page"
+    assert tool.forward(page_server + "/moved") == "Hello page"
+    assert len(_PageHandler.ports) == 3
+    assert len(set(_PageHandler.ports)) == 1
+
+
+def test_visit_webpage_reads_body_once_with_cap():
+    from email.message import Message
+    from unittest.mock import MagicMock, patch
+
+    headers = Message()
+    headers["Content-Type"] = "text/html; charset=utf-8"
+    response = MagicMock()
+    response.headers = headers
+    response.read.return_value = b"<html><body><p>Hello page</p></body></html>"
+
+    @contextlib.contextmanager
+    def fake_open(url, data=None, headers=None, timeout=20):
+        yield response
+
+    tool = default_tools.VisitWebpageTool(max_output_length=100)
+    with patch.object(default_tools, "_web_open", fake_open):
+        assert tool.forward("https://example.com/") == "Hello page"
+    response.read.assert_called_once_with(
+        100 * default_tools._HTML_BYTES_PER_OUTPUT_CHAR + default_tools._GARBAGE_CHECK_BYTES
+    )
+
+
+def test_visit_webpage_revalidates_stale_entry(tmp_path, page_server):
+    db_path = str(tmp_path / "web_cache.db")
+    url = page_server + "/page"
+    tool = default_tools.VisitWebpageTool(cache_path=db_path)
+    assert tool.forward(url) == "Hello page"
+    default_tools._web_cache_set(db_path, "page", url, "cached text", 1024 * 1024, etag='"v1"')
+    default_tools._get_conn(db_path).execute("UPDATE web_cache SET expires_at = 0")
+    default_tools._mem_cache_discard(db_path, "page", url)
+    assert default_tools._web_cache_get(db_path, "page", url) is None
+
+    assert tool.forward(url) == "cached text"
+    assert default_tools._web_cache_get(db_path, "page", url) == "cached text"
+
+
+def test_web_cache_size_counter_tracks_rows(tmp_path):
+    db_path = str(tmp_path / "web_cache.db")
+    for i in range(10):
+        default_tools._web_cache_set(db_path, "page", "k%d" % i, "x" * (10 + i), 60)
+    default_tools._web_cache_set(db_path, "page", "k9", "short", 60)
+    conn = default_tools._get_conn(db_path)
+    total = conn.execute("SELECT total FROM web_cache_meta").fetchone()[0]
+    assert total == conn.execute("SELECT SUM(size) FROM web_cache").fetchone()[0]
+    assert total <= 60
+
+
+def test_web_cache_memory_layer(tmp_path):
+    db_path = str(tmp_path / "web_cache.db")
+    default_tools._web_cache_set(db_path, "search", "q", "results", 1024)
+    assert (db_path, "search", "q") in default_tools._MEM_CACHE
+    # Served from memory even after the row is removed behind the cache's back.
+    default_tools._get_conn(db_path).execute("DELETE FROM web_cache")
+    assert default_tools._web_cache_get(db_path, "search", "q") == "results"
+    default_tools._mem_cache_discard(db_path, "search", "q")
+    assert default_tools._web_cache_get(db_path, "search", "q") is None
+
+
+def test_visit_webpages_fetches_concurrently_in_order(page_server):
+    tool = default_tools.VisitWebpagesTool()
+    urls = [page_server + "/page", page_server + "/missing", page_server + "/page"]
+    pages = tool.forward_many(urls)
+    assert pages[0] == pages[2] == "Hello page"
+    assert default_tools.TOOL_MAPPING["visit_webpages"] is default_tools.VisitWebpagesTool
+    combined = tool.forward(urls)
+    assert combined.count("<h2>") == 2
+
+
+def test_web_cache_stores_hashed_keys(tmp_path):
+    db_path = str(tmp_path / "web_cache.db")
+    url = "https://example.com/" + "a" * 300
+    default_tools._web_cache_set(db_path, "page", url, "v", 1024)
+    key, raw_key = default_tools._get_conn(db_path).execute("SELECT key, raw_key FROM web_cache").fetchone()
+    assert isinstance(key, bytes) and len(key) == 16
+    assert raw_key == url
+    default_tools._mem_cache_discard(db_path, "page", url)
+    assert default_tools._web_cache_get(db_path, "page", url) == "v"
+
+
+def test_duckduckgo_result_parser_defers_description_join():
+    parser = default_tools._DuckDuckGoResultParser()
+    parser.feed(
+        "<table><tr><td><a class='result-link'>Title</a></td></tr>"
+        "<tr><td class='result-snippet'>Some <b>bold</b> text</td></tr>"
+        "<tr><td><span class='link-text'>example.com</span></td></tr></table>"
+    )
+    assert parser.results == [
+        {"title": "Title", "description": ["Some", "bold", "text"], "link": "https://example.com"}
+    ]
+
+
+def test_binary_kind():
+    assert default_tools._binary_kind("image/png; charset=binary", b"") == "image/png"
+    assert default_tools._binary_kind("", b"\x89PNG\r\n\x1a\n") == "png"
+    assert default_tools._binary_kind("", b"\x00\x00\x00\x18ftypmp42") == "mp4"
+    assert default_tools._binary_kind("text/html", b"<!doctype") is None
+
+
+def test_http_pool_keeps_recent_hosts_per_thread(monkeypatch):
+    monkeypatch.setattr(default_tools, "_http_local", threading.local())
+    first_key, first = default_tools._http_connection("http", "h0", 80, 5)
+    closed = []
+    first.close = lambda: closed.append(first_key)
+    for i in range(1, default_tools._HTTP_MAX_CONNS_PER_THREAD + 1):
+        default_tools._http_connection("http", "h%d" % i, 80, 5)
+    conns = default_tools._http_local.conns
+    assert len(conns) == default_tools._HTTP_MAX_CONNS_PER_THREAD
+    assert first_key not in conns
+    assert closed == [first_key]
+
+
+def test_http_proxies_follow_environment(monkeypatch):
+    monkeypatch.delenv("http_proxy", raising=False)
+    monkeypatch.delenv("HTTP_PROXY", raising=False)
+    assert "http" not in default_tools._http_proxies()
+    monkeypatch.setenv("http_proxy", "http://proxy.invalid:3128")
+    assert default_tools._http_proxies()["http"] == "http://proxy.invalid:3128"
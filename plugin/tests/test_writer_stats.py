@@ -0,0 +1,81 @@
+"""Tests for the get_document_stats tool."""
+
+from unittest.mock import MagicMock
+
+from plugin.framework.tool_context import ToolContext
+from plugin.modules.writer.content import GetDocumentStats
+from plugin.modules.writer.tree import TreeService
+from plugin.tests.testing_utils import ElementStub, WriterDocStub
+
+
+class _CountingDocStub(WriterDocStub):
+    def __init__(self, elements):
+        super().__init__(elements)
+        self.enumerations = 0
+
+    def getText(self):
+        text = super().getText()
+        create = text.createEnumeration
+
+        def counting_create():
+            self.enumerations += 1
+            return create()
+
+        text.createEnumeration = counting_create
+        return text
+
+
+def _make_ctx(doc):
+    doc_svc = MagicMock()
+    doc_svc.doc_key.return_value = "doc"
+    doc_svc.get_document_length.return_value = 42
+    doc_svc.get_page_count.return_value = 3
+    services = MagicMock()
+    services.document = doc_svc
+    services.writer_tree = TreeService(services)
+    return ToolContext(doc, None, "writer", services)
+
+
+def test_stats_share_one_paragraph_enumeration():
+    doc = _CountingDocStub([
+        ElementStub("Title", outline_level=1),
+        ElementStub("Body"),
+        ElementStub("Section", outline_level=2),
+        ElementStub("More body"),
+    ])
+    ctx = _make_ctx(doc)
+    result = GetDocumentStats().execute(ctx)
+    assert result["paragraph_count"] == 4
+    assert result["heading_count"] == 2
+    assert result["page_count"] == 3
+    assert result["character_count"] == 42
+    assert doc.enumerations == 1
+
+    # The heading tree is cached on the tree service for later calls.
+    GetDocumentStats().execute(ctx)
+    assert doc.enumerations == 1
+
+
+def test_heading_counts_handle_deep_nesting():
+    from plugin.modules.writer.content import _count_headings
+
+    root = {"children": [], "body_paragraphs": 1}
+    node = root
+    for _ in range(5000):  # deeper than the default recursion limit
+        child = {"children": [], "body_paragraphs": 2, "text": "h", "para_index": 0, "level": 1}
+        node["children"].append(child)
+        node = child
+    assert _count_headings(root["children"]) == 5000
+
+    tree_svc = TreeService(MagicMock())
+    assert tree_svc._count_all_children(root) == 1 + 5000 * 3
+    assert len(tree_svc._flatten_headings(root)) == 5000
+
+
+def test_stats_prefer_writer_statistics():
+    doc = _CountingDocStub([ElementStub("One two three")])
+    doc.getPropertyValue = {"CharacterCount": 13, "WordCount": 3}.__getitem__
+    ctx = _make_ctx(doc)
+    result = GetDocumentStats().execute(ctx)
+    assert (result["character_count"], result["word_count"]) == (13, 3)
+    ctx.services.document.get_document_length.assert_not_called()
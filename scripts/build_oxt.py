@@ -42,6 +42,10 @@ ALWAYS_INCLUDE_PLUGIN = [
     "plugin/modules/chatbot/panel_factory.py",
     "plugin/version.py",
     "plugin/prompt_function.py",
+    # Shipped as source, not .pyc-only: the .oxt runs on LibreOffice's bundled
+    # Python whose bytecode magic rarely matches the build interpreter. The
+    # payload is already a marshal blob (version-pinned), so there is little
+    # compile work left for a .pyc to save.
     "plugin/_manifest.py",
     "plugin/plugin.yaml",
     "plugin/framework/",
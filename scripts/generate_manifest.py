@@ -2,7 +2,7 @@
 """Generate _manifest.py and XCS/XCU from module.yaml files.
 
 Reads each module.yaml under plugin/modules/, validates it, and produces:
-  - build/generated/_manifest.py     — Python dict for runtime
+  - plugin/_manifest.py              — read-only module descriptors for runtime
   - build/generated/registry/*.xcs   — LO config schemas
   - build/generated/registry/*.xcu   — LO config defaults
   - Generates description.xml from description.xml.tpl with version
@@ -28,6 +28,15 @@ except ImportError:
           file=sys.stderr)
     sys.exit(1)
 
+# libyaml's C loader when PyYAML was built with it; same results, much faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml(path):
+    """Parse a YAML file with the safe loader (C implementation if available)."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 def find_modules(modules_dir, filter_names=None):
     """Find all module.yaml files recursively and return parsed manifests.
@@ -35,6 +44,8 @@ def find_modules(modules_dir, filter_names=None):
     Module name comes from the ``name`` field in module.yaml.
     Directory convention: dots map to underscores (tunnel.bore -> tunnel_bore/).
     Falls back to directory-derived name if ``name`` is absent.
+    Modules with ``enabled: false`` are skipped so disabled modules never
+    reach the generated manifest, menus, or dialogs.
     """
     manifests = []
     for dirpath, dirnames, filenames in os.walk(modules_dir):
@@ -50,14 +61,53 @@ def find_modules(modules_dir, filter_names=None):
                 continue
 
         yaml_path = os.path.join(dirpath, "module.yaml")
-        with open(yaml_path) as f:
-            manifest = yaml.safe_load(f)
+        manifest = _load_yaml(yaml_path)
         manifest.setdefault("name", module_name)
+        if manifest.get("enabled", True) is False:
+            print("  Skipping disabled module: %s" % manifest["name"])
+            continue
         manifests.append(manifest)
 
     return manifests
 
 
+SCHEMA_PATH = os.path.join(PROJECT_ROOT, "scripts", "manifest.schema.json")
+
+
+def validate_manifests(manifests):
+    """Validate parsed module.yaml files against ``manifest.schema.json``.
+
+    Runs at build time only so the shipped extension never imports a
+    validator. Uses ``fastjsonschema`` (code-generated validator) when
+    installed, else ``jsonschema``; skips with a notice if neither is present.
+    Returns a list of ``"module: message"`` error strings.
+    """
+    with open(SCHEMA_PATH) as f:
+        schema = json.load(f)
+    try:
+        import fastjsonschema
+    except ImportError:
+        fastjsonschema = None
+    if fastjsonschema is not None:
+        validate = fastjsonschema.compile(schema)
+        errors = []
+        for m in manifests:
+            try:
+                validate(m)
+            except fastjsonschema.JsonSchemaException as e:
+                errors.append("%s: %s" % (m.get("name", "?"), e.message))
+        return errors
+    try:
+        import jsonschema
+    except ImportError:
+        print("  Skipping module.yaml schema validation "
+              "(install fastjsonschema or jsonschema)")
+        return []
+    validator = jsonschema.Draft7Validator(schema)
+    return ["%s: %s" % (m.get("name", "?"), e.message)
+            for m in manifests for e in validator.iter_errors(m)]
+
+
 def topo_sort(modules):
     """Sort modules by dependency order (core first)."""
     by_name = {m["name"]: m for m in modules}
@@ -90,84 +140,326 @@ def topo_sort(modules):
     return order
 
 
-
-def _json_to_python(text):
-    """Convert JSON literals to Python literals (true->True, false->False, null->None)."""
-    # Only replace JSON keywords when they appear as values, not inside strings
-    result = []
-    in_string = False
-    escape = False
-    i = 0
-    while i < len(text):
-        ch = text[i]
-        if escape:
-            result.append(ch)
-            escape = False
-            i += 1
-            continue
-        if ch == '\\' and in_string:
-            result.append(ch)
-            escape = True
-            i += 1
-            continue
-        if ch == '"':
-            in_string = not in_string
-            result.append(ch)
-            i += 1
-            continue
-        if in_string:
-            result.append(ch)
-            i += 1
-            continue
-        # Outside string: replace JSON keywords
-        for jval, pyval in (("true", "True"), ("false", "False"), ("null", "None")):
-            if text[i:i+len(jval)] == jval:
-                # Check it's a whole word (not part of a larger identifier)
-                before_ok = (i == 0 or not text[i-1].isalnum())
-                after_ok = (i + len(jval) >= len(text) or not text[i+len(jval)].isalnum())
-                if before_ok and after_ok:
-                    result.append(pyval)
-                    i += len(jval)
-                    break
+# Config defaults are deliberately not emitted as per-module constant files
+# (e.g. LOG_LEVEL_DEFAULT): every read goes through get_config(ctx, key) with
+# a runtime string key and user overrides, so callers could never import the
+# constants. Specialization happens in the cached accessors below instead.
+
+# marshal format pinned so the blobs stay readable by LibreOffice's bundled
+# Python, which is often a different version from the build interpreter.
+_MARSHAL_VERSION = 4
+
+# Runtime half of the generated module. Each module entry is its own marshal
+# blob, decoded once on first request (memoized) into a slotted, frozen
+# ModuleEntry whose nested dicts are read-only MappingProxyType views;
+# MODULES materializes every entry on first access.
+_MANIFEST_RUNTIME = '''
+# Equal frozensets (requires / provides_services) share one object.
+_SHARED_SETS = {}
+
+
+def _freeze(value, memo=None):
+    # memo (by id) keeps sub-values the generator deduplicated shared after
+    # wrapping, instead of building one view per reference.
+    if memo is None:
+        memo = {}
+    if isinstance(value, frozenset):
+        return _SHARED_SETS.setdefault(value, value)
+    if not isinstance(value, (dict, tuple)):
+        return value
+    frozen = memo.get(id(value))
+    if frozen is None:
+        if isinstance(value, dict):
+            frozen = _M({k: _freeze(v, memo) for k, v in value.items()})
         else:
-            result.append(ch)
-            i += 1
-    return "".join(result)
+            frozen = tuple(_freeze(v, memo) for v in value)
+        memo[id(value)] = frozen
+    return frozen
+
+
+# Shared values for fields the generator omits when empty.
+_DEFAULTS = _M({
+    "title": "",
+    "requires": frozenset(),
+    "provides_services": frozenset(),
+    "config": _M({}),
+    "config_inline": None,
+    "actions": (),
+    "action_icons": _M({}),
+})
+
+
+def module_field(entry, key):
+    """Return *key* from a manifest entry, falling back to the shared default."""
+    return entry.get(key, _DEFAULTS[key])
+
+
+_FIELDS = tuple(_DEFAULTS) + ("name",)
+_FIELD_SET = frozenset(_FIELDS)
+
+
+@_dataclass(slots=True, frozen=True, eq=False)
+class ModuleEntry(_Mapping):
+    """One module's manifest entry.
+
+    Fields are slots (``entry.config``); the read-only Mapping API
+    (``entry["config"]``, ``entry.get(...)``) is kept for dict-style callers.
+    """
+
+    name: str
+    title: str
+    requires: frozenset
+    provides_services: frozenset
+    config: _Mapping
+    config_inline: object
+    actions: tuple
+    action_icons: _Mapping
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(_FIELDS)
+
+    def __len__(self):
+        return len(_FIELDS)
+
+
+@_cache
+def get_module(name):
+    """Return the manifest entry for module *name* (KeyError if unknown)."""
+    fields = _freeze(_marshal.loads(_BLOBS[MODULES_BY_NAME[name]]))
+    return ModuleEntry(**{**_DEFAULTS, **fields})
+
+
+@_cache
+def get_config_schema(name):
+    """Return the config field schemas of module *name* (KeyError if unknown)."""
+    return module_field(get_module(name), "config")
+
+
+@_cache
+def _load_modules():
+    return tuple(get_module(name) for name in MODULE_NAMES)
+
+
+def __getattr__(name):
+    if name == "MODULES":
+        value = _load_modules()
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+'''
+
+
+# String values that come from a small vocabulary and are compared often.
+_ENUM_KEYS = frozenset(("name", "type", "widget", "value"))
+
+
+def _intern_strings(value):
+    """Intern dict keys, enumerated values and set members.
+
+    marshal records the interned flag, so on load every occurrence of e.g.
+    ``"type"`` or ``"select"`` resolves to one shared string object.
+    """
+    if isinstance(value, dict):
+        return {
+            sys.intern(k) if isinstance(k, str) else k:
+            sys.intern(v) if k in _ENUM_KEYS and isinstance(v, str)
+            else _intern_strings(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, tuple):
+        return tuple(_intern_strings(v) for v in value)
+    if isinstance(value, frozenset):
+        return frozenset(sys.intern(v) if isinstance(v, str) else v
+                         for v in value)
+    return value
+
+
+def _share_equal_values(value, memo):
+    """Make structurally equal dicts/tuples the same object.
+
+    marshal writes repeated objects as back-references, so e.g. identical
+    ``options`` lists are stored and decoded once (YAML-anchor style).
+    """
+    if isinstance(value, dict):
+        value = {k: _share_equal_values(v, memo) for k, v in value.items()}
+    elif isinstance(value, tuple):
+        value = tuple(_share_equal_values(v, memo) for v in value)
+    else:
+        return value
+    if not value:
+        return value
+    key = repr(value)
+    return memo.setdefault(key, value)
+
+
+def _to_tuples(value):
+    """Recursively convert lists to tuples (marshal-friendly, immutable)."""
+    if isinstance(value, dict):
+        return {k: _to_tuples(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_tuples(v) for v in value)
+    return value
+
+
+def _bytes_literal(blob, indent=4, width=64):
+    """Render *blob* as a parenthesized run of short bytes literals."""
+    pad = " " * indent
+    chunks = [blob[i:i + width] for i in range(0, len(blob), width)]
+    return "(\n%s\n%s)" % (
+        "\n".join("%s    %r" % (pad, c) for c in chunks), pad)
+
+
+def load_levels(modules):
+    """Group modules into dependency levels with ``graphlib``.
+
+    Every module in a level depends only on modules in earlier levels, so a
+    level's members could be initialized independently of one another.
+    """
+    import graphlib
+
+    provides = {}
+    for m in modules:
+        for svc in m.get("provides_services", []):
+            provides.setdefault(svc, m["name"])
+    names = {m["name"] for m in modules}
+    sorter = graphlib.TopologicalSorter()
+    for m in modules:
+        deps = {provides.get(req, req) for req in m.get("requires", [])}
+        sorter.add(m["name"], *sorted(d for d in deps if d in names and d != m["name"]))
+    sorter.prepare()
+    levels = []
+    while sorter.is_active():
+        ready = tuple(sorted(sorter.get_ready()))
+        levels.append(ready)
+        sorter.done(*ready)
+    return tuple(levels)
+
+
+def _frozenset_literal(values):
+    """Render *values* as a ``frozenset`` literal with stable (sorted) order."""
+    if not values:
+        return "frozenset()"
+    return "frozenset({%s})" % ", ".join(repr(v) for v in sorted(values))
 
 
 def generate_manifest_py(modules, output_path):
-    """Generate _manifest.py with module descriptors as Python dicts."""
+    """Generate _manifest.py with one lazily decoded marshal blob per module."""
+    import marshal
     from plugin.version import EXTENSION_VERSION
 
-    lines = [
-        '"""Auto-generated module manifest. DO NOT EDIT."""',
-        "",
-        "VERSION = %r" % EXTENSION_VERSION,
-        "",
-        "MODULES = [",
-    ]
+    entries = []
     for m in modules:
-        # Clean repr — only keep runtime-relevant keys
-        entry = {
+        # Clean repr — only keep runtime-relevant keys; empty values are
+        # omitted and served from the shared _DEFAULTS (see module_field).
+        entries.append(_intern_strings(_to_tuples({
             "name": m["name"],
             "title": m.get("title", ""),
-            "requires": m.get("requires", []),
-            "provides_services": m.get("provides_services", []),
+            # Set semantics (membership / dependency resolution), not order.
+            "requires": frozenset(m.get("requires", [])),
+            "provides_services": frozenset(m.get("provides_services", [])),
             "config": m.get("config", {}),
             "config_inline": m.get("config_inline"),
             "actions": list(m.get("actions", {}).keys()),
             "action_icons": {k: v["icon"] for k, v in m.get("actions", {}).items() if v.get("icon")},
-        }
-        # json.dumps then convert true/false/null to Python True/False/None
-        json_text = json.dumps(entry, indent=8)
-        lines.append("    %s," % _json_to_python(json_text))
-    lines.append("]")
+        })))
+    entries = [{k: v for k, v in e.items() if k == "name" or v} for e in entries]
+    shared = {}
+    entries = [_share_equal_values(e, shared) for e in entries]
+    names = tuple(e["name"] for e in entries)
+    blobs = [marshal.dumps(e, _MARSHAL_VERSION) for e in entries]
+    load_order = tuple(m["name"] for m in topo_sort(modules))
+
+    # Module -> {key: default}, in MODULE_NAMES order; fields without a
+    # default and modules without any are omitted.
+    config_defaults = {}
+    for e in entries:
+        defaults = {k: schema["default"] for k, schema in e.get("config", {}).items()
+                    if "default" in schema}
+        if defaults:
+            config_defaults[e["name"]] = defaults
+
+    # Static config-key partitions (module -> keys), modules without any omitted.
+    public_keys = {}
+    internal_keys = {}
+    for e in entries:
+        for key, schema in e.get("config", {}).items():
+            if schema.get("public"):
+                public_keys.setdefault(e["name"], []).append(key)
+            if schema.get("internal"):
+                internal_keys.setdefault(e["name"], []).append(key)
+
+    # Column views and inverted indices for dependency/service queries.
+    provider_of = {}
+    requirers_of = {}
+    for e in entries:
+        for svc in sorted(e.get("provides_services", ())):
+            provider_of.setdefault(svc, e["name"])
+        for req in sorted(e.get("requires", ())):
+            requirers_of.setdefault(req, []).append(e["name"])
+
+    lines = [
+        '"""Auto-generated module manifest. DO NOT EDIT.',
+        "",
+        "Imports only the standard library, and plugin/__init__.py is empty, so",
+        "tools can read module metadata without booting the framework.",
+        '"""',
+        "",
+        "import marshal as _marshal",
+        "from collections.abc import Mapping as _Mapping",
+        "from dataclasses import dataclass as _dataclass",
+        "from functools import cache as _cache",
+        "from types import MappingProxyType as _M",
+        "",
+        "VERSION = %r" % EXTENSION_VERSION,
+        "",
+        "MODULE_NAMES = %r" % (names,),
+        "",
+        "# Module name -> index into MODULE_NAMES / MODULES.",
+        "MODULES_BY_NAME = %r" % {n: i for i, n in enumerate(names)},
+        "",
+        "# Dependency order for initialization, resolved at build time.",
+        "LOAD_ORDER = %r" % (load_order,),
+        "LOAD_LEVELS = %r" % (load_levels(modules),),
+        "",
+        "# Per-module columns, parallel to MODULE_NAMES.",
+        "REQUIRES = (%s\n)" % "".join(
+            "\n    %s," % _frozenset_literal(e.get("requires", ())) for e in entries),
+        "PROVIDES = (%s\n)" % "".join(
+            "\n    %s," % _frozenset_literal(e.get("provides_services", ())) for e in entries),
+        "",
+        "# Service -> providing module; requirement -> modules that require it.",
+        "PROVIDER_OF = %r" % dict(sorted(provider_of.items())),
+        "REQUIRERS_OF = %r" % {k: tuple(v) for k, v in sorted(requirers_of.items())},
+        "",
+        "# Schema defaults per module (read-only).",
+        "CONFIG_DEFAULTS = _M({%s\n})" % "".join(
+            "\n    %r: _M(%r)," % (name, defaults)
+            for name, defaults in config_defaults.items()),
+        "",
+        "# Config keys flagged public (readable by other modules) / internal (no UI).",
+        "PUBLIC_CONFIG_KEYS = %r" % {k: tuple(v) for k, v in public_keys.items()},
+        "INTERNAL_CONFIG_KEYS = %r" % {k: tuple(v) for k, v in internal_keys.items()},
+        "",
+        "# One marshal-encoded entry per module, decoded on demand by get_module().",
+        "_BLOBS = (",
+    ]
+    for name, blob in zip(names, blobs):
+        lines.append("    # %s" % name)
+        lines.append("    %s," % _bytes_literal(blob))
+    lines.append(")")
     lines.append("")
+    lines.append(_MANIFEST_RUNTIME)
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     with open(output_path, "w") as f:
         f.write("\n".join(lines))
-    print("  Generated %s (%d modules)" % (output_path, len(modules)))
+    print("  Generated %s (%d modules, %d bytes encoded)"
+          % (output_path, len(modules), sum(len(b) for b in blobs)))
 
 
 # Ensure scripts/ is on path for manifest_xdl and manifest_registry
@@ -201,8 +493,7 @@ def main():
     plugin_yaml_path = os.path.join(PROJECT_ROOT, "plugin", "plugin.yaml")
     framework_manifest = None
     if os.path.isfile(plugin_yaml_path):
-        with open(plugin_yaml_path) as f:
-            framework_manifest = yaml.safe_load(f)
+        framework_manifest = _load_yaml(plugin_yaml_path)
         framework_manifest.setdefault("name", "main")
         print("  Loaded framework config: plugin/plugin.yaml")
 
@@ -216,6 +507,13 @@ def main():
         print("  No modules found!")
         return 1
 
+    errors = validate_manifests(
+        manifests + ([framework_manifest] if framework_manifest else []))
+    if errors:
+        for err in errors:
+            print("ERROR: %s" % err, file=sys.stderr)
+        return 1
+
     sorted_modules = topo_sort(manifests)
 
     # Prepend framework manifest (always first, before all modules)